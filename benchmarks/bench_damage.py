@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark of DamageAccumulator on clustered dirty regions, reporting the
+time per added region and the area repainted compared to the bounding
+region."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from random import random, seed
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Region, DamageAccumulator
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def clustered(n: int) -> list[Region]:
+  """Returns 'n' small regions spread over four clusters."""
+  centers = [(50, 50), (900, 80), (120, 700), (800, 850)]
+  out = []
+  for i in range(n):
+    cx, cy = centers[i % len(centers)]
+    x, y = cx + 60 * random(), cy + 60 * random()
+    out.append(Region(x, y, x + 8 + 16 * random(), y + 8 + 16 * random()))
+  return out
+
+
+def accumulate(regions: list[Region]) -> DamageAccumulator:
+  """Returns an accumulator holding every region."""
+  accumulator = DamageAccumulator()
+  accumulator.addMany(regions)
+  return accumulator
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  seed(0)
+  n = 500
+  regions = clustered(n)
+  perAdd = best(lambda: accumulate(regions), 5) / n
+  accumulator = accumulate(regions)
+  print("""DamageAccumulator, %d clustered regions:""" % n)
+  print("""  %-24s %12.2f""" % ('microseconds per add', perAdd))
+  print("""  %-24s %12d""" % ('rectangles', len(accumulator)))
+  print("""  %-24s %12.1f""" % ('repainted area', accumulator.area))
+  print("""  %-24s %12.1f""" % ('bounding area', accumulator.boundingArea))
+  print("""  %-24s %12.1f""" % ('saved area', accumulator.savedArea))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
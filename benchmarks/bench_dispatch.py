@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing the cached dispatch of the geometry classes
+against the plain worktoy Dispatch, using undecorated subclasses."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from random import random
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Point, RotateMap, Region, dispatchCacheInfo
+
+
+class PlainPoint(Point):
+  """Point without the dispatch cache."""
+
+
+class PlainRotateMap(RotateMap):
+  """RotateMap without the dispatch cache."""
+
+
+class PlainRegion(Region):
+  """Region without the dispatch cache."""
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  x, y = random(), random()
+  p = Point(x, y)
+  rotateMap, plainMap = RotateMap(x), PlainRotateMap(x)
+  results = {
+      'Point(x, y), plain'          : lambda: PlainPoint(x, y),
+      'Point(x, y), cached'         : lambda: Point(x, y),
+      'RotateMap(point), plain'     : lambda: plainMap(p),
+      'RotateMap(point), cached'    : lambda: rotateMap(p),
+      'Region(x, y, x, y), plain'   : lambda: PlainRegion(x, y, x, y),
+      'Region(x, y, x, y), cached'  : lambda: Region(x, y, x, y),
+  }
+  print("""Best of 5 (microseconds per call):""")
+  for name, stmt in results.items():
+    print("""  %-28s %8.2f""" % (name, best(stmt, 5000)))
+  print("""Point: %s""" % dispatchCacheInfo(Point)['__init__'])
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
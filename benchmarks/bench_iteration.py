@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing the generator based iteration of Point and
+LayoutRect against the former list-and-pop iteration protocol."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.layouts import LayoutIndex, LayoutRect
+from worQt.tools.geometry import Point
+
+
+class LegacyPoint(Point):
+  """Point with the former iteration protocol."""
+
+  __iter_contents__ = None
+
+  def __iter__(self, ) -> LegacyPoint:
+    """Stores the coordinates on the instance and returns self."""
+    self.__iter_contents__ = [self.r0, self.r1]
+    return self
+
+  def __next__(self) -> float:
+    """Pops the next coordinate."""
+    if self.__iter_contents__:
+      return self.__iter_contents__.pop(0)
+    self.__iter_contents__ = None
+    raise StopIteration
+
+
+class LegacyRect(LayoutRect):
+  """LayoutRect with the former iteration protocol."""
+
+  __iter_contents__ = None
+
+  def __iter__(self, ) -> LegacyRect:
+    """Builds every index up front and returns self."""
+    items = []
+    for i in range(self.colSpan):
+      for j in range(self.rowSpan):
+        items.append(LayoutIndex(self.top + j, self.left + i))
+    self.__iter_contents__ = items
+    return self
+
+  def __next__(self) -> LayoutIndex:
+    """Pops the next index."""
+    if self.__iter_contents__:
+      return self.__iter_contents__.pop(0)
+    self.__iter_contents__ = None
+    raise StopIteration
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def unpack(point: Point) -> float:
+  """Unpacks the point."""
+  x, y = point
+  return x + y
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  point, legacyPoint = Point(1., 2.), LegacyPoint(1., 2.)
+  n = 32
+  rect = LayoutRect(0, 0, n - 1, n - 1)
+  legacyRect = LegacyRect(0, 0, n - 1, n - 1)
+  results = {
+      'unpack, legacy'   : (lambda: unpack(legacyPoint), 10000),
+      'unpack, generator': (lambda: unpack(point), 10000),
+      'rect, legacy'     : (lambda: [*legacyRect], 5),
+      'rect, generator'  : (lambda: [*rect], 5),
+  }
+  print("""Best of 5 (microseconds per call), rect is %dx%d:""" % (n, n))
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
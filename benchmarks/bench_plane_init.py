@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing the fast 'Plane._fromFloats' constructor
+against the overload dispatched constructor and timing the operators that
+now use the fast constructor."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from random import random
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Point, Vector, Size
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  x, y = random(), random()
+  p, q = Point(x, y), Point(y, x)
+  v = Vector(x, y)
+  groups = {
+      'construction': {
+          'Point(x, y)'            : lambda: Point(x, y),
+          'Point._fromFloats(x, y)': lambda: Point._fromFloats(x, y),
+          'Size(x, y)'             : lambda: Size(x, y),
+          'Size._fromFloats(x, y)' : lambda: Size._fromFloats(x, y),
+      },
+      'operators'   : {
+          '-p'   : lambda: -p,
+          'p + q': lambda: p + q,
+          'p - q': lambda: p - q,
+          'p * 2': lambda: p * 2,
+          'p / 2': lambda: p / 2,
+          'v * 2': lambda: v * 2,
+          '~v'   : lambda: ~v,
+      },
+  }
+  print("""Best of 5 (microseconds per call):""")
+  for group, stmts in groups.items():
+    print("""  %s""" % group)
+    for name, stmt in stmts.items():
+      print("""    %-26s %8.2f""" % (name, best(stmt, 10000)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing the buffer copy in PointArray.toQPolygonF
+against building a QPolygonF from one QPointF per point."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPolygonF
+
+from worQt.tools.geometry import PointArray, Region, RegionMap
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def perPoint(points: PointArray) -> QPolygonF:
+  """Builds the polygon one QPointF at a time."""
+  xs, ys = points.x, points.y
+  return QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)])
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  n = 100000
+  points = PointArray.fromColumns(range(n), [i % 7 for i in range(n)])
+  regionMap = RegionMap(Region(0., 0., n, 7.), Region(0., 0., 1920., 1080.))
+  results = {
+      'per QPointF'         : (lambda: perPoint(points), 3),
+      'toQPolygonF'         : (lambda: points.toQPolygonF(), 20),
+      'fromQPolygonF'       : (
+          lambda: PointArray.fromQPolygonF(points.toQPolygonF()), 20),
+      'map, per QPointF'    : (lambda: perPoint(regionMap(points)), 3),
+      'map, mapToQPolygonF' : (
+          lambda: regionMap.mapToQPolygonF(points), 3),
+  }
+  print("""Best of 5 (microseconds per call), %d points:""" % n)
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of the edge and derived value access on Region."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Region
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  region = Region(7., 9., 1., 2.)
+  results = {
+      'left'     : (lambda: region.left, 20000),
+      'width'    : (lambda: region.width, 20000),
+      'area'     : (lambda: region.area, 20000),
+      'topLeft'  : (lambda: region.topLeft, 20000),
+      'center'   : (lambda: region.center, 20000),
+      'size'     : (lambda: region.size, 20000),
+      'construct': (lambda: Region(7., 9., 1., 2.), 5000),
+  }
+  print("""Best of 5 (microseconds per call):""")
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing batch set operations on RegionArray against
+loops over lists of Region."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from random import random, seed
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Region, RegionArray, Point, PointArray
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def randRegion() -> Region:
+  """Returns a random region."""
+  x, y = 1000 * random(), 1000 * random()
+  return Region(x, y, x + 50 * random(), y + 50 * random())
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  seed(0)
+  n = 1000
+  regions = [randRegion() for _ in range(n)]
+  others = [randRegion() for _ in range(n)]
+  points = [Point(1000 * random(), 1000 * random()) for _ in range(n)]
+  regionArray, otherArray = RegionArray(regions), RegionArray(others)
+  pointArray = PointArray(points)
+  results = {
+      'intersect, list'   : (
+          lambda: [a * b for a, b in zip(regions, others)], 5),
+      'intersect, array'  : (lambda: regionArray * otherArray, 5),
+      'contains, list'    : (
+          lambda: [p in r for r, p in zip(regions, points)], 5),
+      'contains, array'   : (lambda: regionArray.contains(pointArray), 5),
+      'area, list'        : (lambda: [r.area for r in regions], 5),
+      'area, array'       : (lambda: regionArray.area, 5),
+      'all-vs-all, list'  : (
+          lambda: [(i, j) for i, a in enumerate(regions)
+                   for j, b in enumerate(others) if a * b], 1),
+      'all-vs-all, array' : (lambda: regionArray.intersectAll(otherArray),
+                             1),
+  }
+  print("""Best of 5 (microseconds per call), %d regions:""" % n)
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing RegionIndex queries against linear scans over
+a list of regions."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from random import random
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Point, Region, RegionIndex
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def randRegion() -> Region:
+  """Returns a random region on a 4000 x 4000 canvas."""
+  x, y = random() * 4000, random() * 4000
+  return Region(x, y, x + random() * 100, y + random() * 100)
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  n = 5000
+  regions = [randRegion() for _ in range(n)]
+  edges = [(r.left, r.top, r.right, r.bottom) for r in regions]
+  point = Point(random() * 4000, random() * 4000)
+  x, y = point.x, point.y
+  print("""Bulk loading %d regions:""" % n)
+  print("""  %-28s %12.2f""" % ('RegionIndex(regions)', best(
+      lambda: RegionIndex(regions), 1)))
+  index = RegionIndex(regions)
+
+  def scanEdges() -> list:
+    """Scans precomputed edges."""
+    return [e for e in edges if e[0] <= x <= e[2] and e[1] <= y <= e[3]]
+
+  query = randRegion()
+  results = {
+      'point in region, scan' : lambda: [r for r in regions if point in r],
+      'edge comparisons, scan': scanEdges,
+      'queryPoint'            : lambda: index.queryPoint(x, y),
+      'queryRegion'           : lambda: index.queryRegion(query),
+      'nearest'               : lambda: index.nearest(x, y),
+  }
+  print("""Queries, best of 5 (microseconds per call):""")
+  for name, stmt in results.items():
+    print("""  %-28s %12.2f""" % (name, best(stmt, 5)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
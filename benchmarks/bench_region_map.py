@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of RegionMap applied to single points and batches."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Point, PointArray, Region, RegionMap
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  regionMap = RegionMap(Region(0., -1., 10., 1.), Region(0., 0., 640., 480.))
+  point = Point(3., .5)
+  points = PointArray([(0.01 * i, 0.) for i in range(1000)])
+  results = {
+      'Point'           : (lambda: regionMap(point), 5000),
+      'float, float'    : (lambda: regionMap(3., .5), 5000),
+      'complex'         : (lambda: regionMap(3. + .5j), 5000),
+      'tuple'           : (lambda: regionMap((3., .5)), 5000),
+      'Region'          : (lambda: regionMap(regionMap.source), 5000),
+      'PointArray, 1000': (lambda: regionMap(points), 50),
+  }
+  print("""Best of 5 (microseconds per call):""")
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
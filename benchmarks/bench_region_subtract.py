@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing the sweep in Region.subtractMany against
+repeated pairwise subtraction."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from random import random, seed
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Region
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def randRegion() -> Region:
+  """Returns a random region."""
+  x, y = 1000 * random(), 1000 * random()
+  return Region(x, y, x + 200 * random(), y + 200 * random())
+
+
+def pairwise(region: Region, occluders: list[Region]) -> list[Region]:
+  """Subtracts the occluders one at a time."""
+  parts = [region]
+  for occluder in occluders:
+    parts = [part for other in parts for part in other - occluder]
+  return parts
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  seed(0)
+  region = Region(0., 0., 1000., 1000.)
+  print("""Best of 5 (microseconds per call):""")
+  for n in (10, 50, 200):
+    occluders = [randRegion() for _ in range(n)]
+    count = len(region.subtractMany(occluders))
+    pairCount = len(pairwise(region, occluders))
+    results = {
+        '%d occluders, pairwise' % n: (
+            lambda: pairwise(region, occluders), pairCount),
+        '%d occluders, sweep' % n   : (
+            lambda: region.subtractMany(occluders), count),
+    }
+    for name, (stmt, parts) in results.items():
+      timing = best(stmt, 1)
+      print("""  %-28s %12.2f %6d parts""" % (name, timing, parts))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
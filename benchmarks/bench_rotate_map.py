@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark comparing RotateMap against the former polar rotation,
+which computed the radius, atan2, cos and sin for every point."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from math import atan2, cos, sin
+from random import random
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Point, PointArray, RotateMap
+
+
+def polarRotate(angle: float, point: Point) -> Point:
+  """The former per-point rotation of RotateMap."""
+  r = (point.x ** 2 + point.y ** 2) ** 0.5
+  t = atan2(point.y, point.x) + angle
+  return Point(r * cos(t), r * sin(t))
+
+
+def polarKernel(angle: float, x: float, y: float) -> tuple:
+  """The arithmetic of the former rotation on plain floats."""
+  r = (x ** 2 + y ** 2) ** 0.5
+  t = atan2(y, x) + angle
+  return r * cos(t), r * sin(t)
+
+
+def matrixKernel(c: float, s: float, x: float, y: float) -> tuple:
+  """The arithmetic of the cached rotation on plain floats."""
+  return c * x - s * y, s * x + c * y
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  n = 1000
+  angle = random() * 6.28
+  rotateMap = RotateMap(angle)
+  points = [Point(random() * 100, random() * 100) for _ in range(n)]
+  pointArray = PointArray(points)
+  floats = [(p.x, p.y) for p in points]
+  c, s = cos(angle), sin(angle)
+  kernels = {
+      'polar kernel'        : lambda: [polarKernel(angle, x, y) for (x, y)
+                                       in floats],
+      'matrix kernel'       : lambda: [matrixKernel(c, s, x, y) for (x, y)
+                                       in floats],
+  }
+  results = {
+      'polar, per point'   : lambda: [polarRotate(angle, p) for p in
+                                      points],
+      'RotateMap, per point': lambda: [rotateMap(p) for p in points],
+      'RotateMap, floats'   : lambda: [rotateMap(p.x, p.y) for p in points],
+      'RotateMap, batch'    : lambda: rotateMap(pointArray),
+  }
+  print("""Rotating %d points, best of 5 (microseconds):""" % n)
+  for group in (kernels, results):
+    base = None
+    for name, stmt in group.items():
+      t = best(stmt, 20)
+      base = t if base is None else base
+      print("""  %-22s %10.1f  (x%.2f)""" % (name, t, base / t))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark of mapping a long trace to screen space, simplifying it and
+painting it as a polyline on a QImage, reporting the time and the number
+of points handed to the painter."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from math import sin
+from random import random, seed
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from PySide6.QtGui import QImage, QPainter, QPolygonF
+
+from worQt.tools.geometry import PointArray, Region, RegionMap, simplify
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in milliseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e3
+
+
+def paint(image: QImage, polygon: QPolygonF) -> None:
+  """Paints the polygon as an antialiased polyline on the image."""
+  painter = QPainter(image)
+  painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+  painter.drawPolyline(polygon)
+  painter.end()
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  seed(0)
+  n, width = 100000, 800
+  xs = [float(i) for i in range(n)]
+  ys = [sin(0.001 * x) + 0.1 * random() for x in xs]
+  trace = PointArray.fromColumns(xs, ys)
+  source = Region(0., -1.2, float(n), 1.2)
+  regionMap = RegionMap(source, Region(0., 0., float(width), 400.))
+  screen = regionMap(trace)
+  image = QImage(width, 400, QImage.Format.Format_ARGB32_Premultiplied)
+  results = {
+      'no simplification': lambda: paint(
+          image, regionMap(trace).toQPolygonF()),
+      'minmax, 1px'      : lambda: paint(
+          image, simplify(regionMap(trace), 1.).toQPolygonF()),
+      'rdp, 0.5px'       : lambda: paint(
+          image, simplify(regionMap(trace), .5, 'rdp').toQPolygonF()),
+  }
+  counts = {
+      'no simplification': len(screen),
+      'minmax, 1px'      : len(simplify(screen, 1.)),
+      'rdp, 0.5px'       : len(simplify(screen, .5, 'rdp')),
+  }
+  print("""Best of 5 (milliseconds), %d points, %d pixels wide:""" % (
+      n, width))
+  for name, stmt in results.items():
+    timing = best(stmt, 1)
+    print("""  %-24s %12.2f %8d points""" % (name, timing, counts[name]))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of fitting and packing a grid of thumbnails, as done
+on every resize of an image grid."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from random import Random
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Size, Region, packShelves
+
+COUNT = 5000
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  rng = Random(0)
+  sizes = [Size(rng.uniform(100., 4000.), rng.uniform(100., 4000.))
+           for _ in range(COUNT)]
+  cell = Size(128., 96.)
+  container = Region(0., 0., 1920., 1e6)
+  results = {
+      'fit, 1'                 : (lambda: sizes[0].fit(cell), 5000),
+      'fit loop, %d' % COUNT   : (lambda: [s.fit(cell) for s in sizes], 5),
+      'fitMany, %d' % COUNT    : (lambda: Size.fitMany(sizes, cell), 5),
+      'packShelves, %d' % COUNT: (
+          lambda: packShelves(sizes, container, rowHeight=96.), 5),
+  }
+  print("""Best of 5 (microseconds per call):""")
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
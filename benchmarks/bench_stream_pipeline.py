@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of StreamPipeline against mapping the whole trace on
+every frame. Each frame appends a chunk of samples to a trace holding the
+most recent samples and produces the mapped polygon."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import PointArray, Region, RegionMap
+from worQt.tools.geometry import StreamPipeline
+
+CAPACITY = 100000
+CHUNK = 100
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  source = Region(0., -1., float(CAPACITY), 1.)
+  regionMap = RegionMap(source, Region(0., 0., 640., 480.))
+  trace = PointArray([(float(i), 0.) for i in range(CAPACITY)])
+  chunk = PointArray([(float(i), .5) for i in range(CHUNK)])
+  pipeline = StreamPipeline(CAPACITY, regionMap)
+  pipeline.append(trace)
+
+  def incremental() -> None:
+    """Appends a chunk and maps only the chunk."""
+    pipeline.append(chunk)
+    pipeline.toQPolygonF()
+
+  def remapAll() -> None:
+    """Maps the whole trace as before."""
+    regionMap.mapToQPolygonF(trace)
+
+  panned = [source, Region(1., -1., CAPACITY + 1., 1.)]
+
+  def pan() -> None:
+    """Appends a chunk after panning the source region."""
+    panned.reverse()
+    regionMap._setRegions(panned[0], regionMap.target)
+    pipeline.append(chunk)
+    pipeline.toQPolygonF()
+
+  results = {
+      'remap all, %d' % CAPACITY: (remapAll, 20),
+      'incremental, %d' % CHUNK : (incremental, 20),
+      'after pan'               : (pan, 20),
+  }
+  print("""Best of 5 (microseconds per frame):""")
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark suite of the geometry classes with regression
+thresholds. Times Plane construction, the arithmetic operators, every
+'__call__' overload of every map, the Region accessors and set operations
+and Size.fit, each at several input sizes where applicable.
+
+Usage:
+  python benchmarks/bench_suite.py [--output results.json]
+                                   [--baseline baseline.json]
+                                   [--threshold 25] [--save-baseline]
+                                   [--filter map.]
+
+Results are written as JSON mapping each case name to the best time per
+call in microseconds. When a baseline is given, every case slower than
+the baseline by more than the threshold percentage is reported and the
+script exits with status 1. With '--save-baseline' the results are
+written to the baseline file instead. Baselines are specific to the
+machine and Python version they were recorded on and are therefore not
+kept in the repository."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+from timeit import Timer
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+
+from worQt.tools.geometry import Plane, Point, Vector, Size, Region
+from worQt.tools.geometry import PointArray, VectorArray
+from worQt.tools.geometry import RegionMap, MoveMap, ScaleMap, RotateMap
+from worQt.tools.geometry import RotatePointMap, AffineMap
+
+#  Minimum duration in seconds of each timed repetition
+MIN_DURATION = 0.01
+#  Input sizes of the batch cases
+BATCH_SIZES = (10, 1000)
+
+
+def best(stmt: callable, repeat: int) -> float:
+  """Returns the best time per call in microseconds. The number of calls
+  per repetition is calibrated to last at least MIN_DURATION."""
+  timer, number = Timer(stmt), 1
+  while timer.timeit(number) < MIN_DURATION:
+    number *= 4
+  return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def planeCases() -> dict[str, callable]:
+  """Returns the Plane construction cases."""
+  plane = Plane(1., 2.)
+  return {
+      'plane.init.float_float': lambda: Plane(1., 2.),
+      'plane.init.int_int'    : lambda: Plane(1, 2),
+      'plane.init.complex'    : lambda: Plane(1. + 2.j),
+      'plane.init.tuple'      : lambda: Plane((1., 2.)),
+      'plane.init.plane'      : lambda: Plane(plane),
+      'plane.init.empty'      : lambda: Plane(),
+      'plane.fromFloats'      : lambda: Plane._fromFloats(1., 2.),
+      'point.init.float_float': lambda: Point(1., 2.),
+      'vector.init.float_float': lambda: Vector(1., 2.),
+      'size.init.float_float' : lambda: Size(1., 2.),
+  }
+
+
+def operatorCases() -> dict[str, callable]:
+  """Returns the arithmetic operator cases."""
+  p, q = Point(1., 2.), Point(3., 5.)
+  v, w = Vector(1., 2.), Vector(3., 5.)
+  cases = {
+      'op.neg'           : lambda: -p,
+      'op.abs'           : lambda: abs(p),
+      'op.add.point'     : lambda: p + q,
+      'op.add.float'     : lambda: p + 2.,
+      'op.add.complex'   : lambda: p + 2.j,
+      'op.add.tuple'     : lambda: p + (1., 2.),
+      'op.radd.float'    : lambda: 2. + p,
+      'op.sub.point'     : lambda: p - q,
+      'op.sub.float'     : lambda: p - 2.,
+      'op.rsub.float'    : lambda: 2. - p,
+      'op.mul.float'     : lambda: p * 2.,
+      'op.rmul.float'    : lambda: 2. * p,
+      'op.truediv.float' : lambda: p / 2.,
+      'op.vector.dot'    : lambda: v * w,
+      'op.vector.cross'  : lambda: v @ w,
+      'op.vector.invert' : lambda: ~v,
+  }
+  for n in BATCH_SIZES:
+    points = PointArray([(float(i), float(i)) for i in range(n)])
+    cases['op.array.add.%d' % n] = lambda a=points: a + a
+    cases['op.array.mul.%d' % n] = lambda a=points: a * 2.
+  return cases
+
+
+def sampleArgs(types: tuple[type, ...], n: int) -> tuple:
+  """Returns sample positional arguments of the given types."""
+  samples = {
+      int         : lambda: 3,
+      float       : lambda: 1.5,
+      complex     : lambda: 1.5 + 2.5j,
+      tuple       : lambda: (1.5, 2.5),
+      list        : lambda: [1.5, 2.5],
+      Point       : lambda: Point(1.5, 2.5),
+      Vector      : lambda: Vector(1.5, 2.5),
+      Size        : lambda: Size(1.5, 2.5),
+      Region      : lambda: Region(1., 2., 3., 5.),
+      PointArray  : lambda: PointArray.fromColumns(range(n), range(n)),
+      VectorArray : lambda: VectorArray.fromColumns(range(n), range(n)),
+  }
+  return (*[samples[type_]() for type_ in types],)
+
+
+def callSignatures(cls: type) -> list[tuple[type, ...]]:
+  """Returns the type signatures of the '__call__' overloads defined on
+  the class."""
+  dispatch = cls.__dict__.get('__call__', None)
+  callMap = getattr(dispatch, '__call_map__', {})
+  return [getattr(sig, '__raw_types__', ()) for sig in callMap]
+
+
+def mapCases() -> dict[str, callable]:
+  """Returns a case for every '__call__' overload of every map class.
+  Batch overloads are timed at every input size."""
+  maps = [
+      RegionMap(Region(0., 0., 10., 2.), Region(0., 0., 640., 480.)),
+      MoveMap(Vector(1., 2.)),
+      ScaleMap(2., 3.),
+      RotateMap(0.5),
+      RotatePointMap(Point(1., 2.), 0.5),
+      AffineMap(1., 2., 3., 4., 5., 6.),
+  ]
+  cases = {}
+  for map_ in maps:
+    for types in callSignatures(type(map_)):
+      names = '_'.join([type_.__name__ for type_ in types])
+      batch = any([issubclass(t, PointArray) for t in types])
+      for n in BATCH_SIZES if batch else (None,):
+        args = sampleArgs(types, n)
+        name = 'map.%s.%s' % (type(map_).__name__, names)
+        if n is not None:
+          name = '%s.%d' % (name, n)
+        cases[name] = lambda m=map_, a=args: m(*a)
+  return cases
+
+
+def regionCases() -> dict[str, callable]:
+  """Returns the Region accessor and set operation cases."""
+  region, other = Region(0., 0., 10., 10.), Region(5., 5., 15., 15.)
+  point = Point(3., 4.)
+  cases = {
+      'region.init.floats'  : lambda: Region(0., 0., 10., 10.),
+      'region.init.points'  : lambda: Region(point, Point(9., 9.)),
+      'region.left'         : lambda: region.left,
+      'region.width'        : lambda: region.width,
+      'region.area'         : lambda: region.area,
+      'region.topLeft'      : lambda: region.topLeft,
+      'region.center'       : lambda: region.center,
+      'region.size'         : lambda: region.size,
+      'region.contains'     : lambda: point in region,
+      'region.add'          : lambda: region + other,
+      'region.mul'          : lambda: region * other,
+      'region.sub'          : lambda: region - other,
+  }
+  for n in BATCH_SIZES:
+    occluders = [Region(i % 97, i % 89, i % 97 + 7, i % 89 + 5)
+                 for i in range(n)]
+    big = Region(0., 0., 100., 100.)
+    cases['region.subtractMany.%d' % n] = (
+        lambda o=occluders: big.subtractMany(o))
+  return cases
+
+
+def sizeCases() -> dict[str, callable]:
+  """Returns the Size.fit cases for wide, tall and square inputs at
+  several magnitudes."""
+  cases = {}
+  shapes = {'wide': (4., 1.), 'tall': (1., 4.), 'square': (1., 1.)}
+  for name, (w, h) in shapes.items():
+    for scale in (1., 1000.):
+      size, other = Size(w, h), Size(scale * 3., scale * 2.)
+      key = 'size.fit.%s.%d' % (name, scale)
+      cases[key] = lambda s=size, o=other: s.fit(o)
+  return cases
+
+
+def collectCases(pattern: str = None) -> dict[str, callable]:
+  """Returns every case, optionally only those whose name contains the
+  pattern."""
+  cases = {
+      **planeCases(),
+      **operatorCases(),
+      **mapCases(),
+      **regionCases(),
+      **sizeCases(),
+  }
+  if pattern is None:
+    return cases
+  return {k: v for k, v in cases.items() if pattern in k}
+
+
+def runCases(cases: dict[str, callable], repeat: int) -> dict[str, float]:
+  """Times every case and prints the results."""
+  out = {}
+  for name, stmt in cases.items():
+    out[name] = best(stmt, repeat)
+    print("""  %-44s %12.3f""" % (name, out[name]))
+  return out
+
+
+def compare(results: dict[str, float], baseline: dict[str, float],
+            threshold: float) -> list[str]:
+  """Returns a description of every case slower than the baseline by
+  more than the threshold percentage. Cases missing from either are
+  ignored."""
+  out = []
+  for name, timing in results.items():
+    if name not in baseline or not baseline[name]:
+      continue
+    change = 100. * (timing / baseline[name] - 1.)
+    if change > threshold:
+      infoSpec = """%s: %.3f -> %.3f microseconds (%+.1f%%)"""
+      out.append(infoSpec % (name, baseline[name], timing, change))
+  return out
+
+
+def parseArgs(argv: list[str] = None) -> argparse.Namespace:
+  """Parses the command line arguments."""
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument('--output', default=None,
+                      help="""JSON file receiving the results.""")
+  parser.add_argument('--baseline', default=None,
+                      help="""JSON file holding the baseline.""")
+  parser.add_argument('--threshold', type=float, default=25.,
+                      help="""Allowed slowdown in percent.""")
+  parser.add_argument('--save-baseline', action='store_true',
+                      help="""Write the results to the baseline file.""")
+  parser.add_argument('--filter', default=None,
+                      help="""Only run cases containing this string.""")
+  parser.add_argument('--repeat', type=int, default=5,
+                      help="""Number of timed repetitions per case.""")
+  return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+  """Runs the suite and returns 1 if any case regressed."""
+  args = parseArgs(argv)
+  cases = collectCases(args.filter)
+  print("""Best of %d (microseconds per call):""" % args.repeat)
+  results = runCases(cases, args.repeat)
+  document = {
+      'python'  : platform.python_version(),
+      'platform': platform.platform(),
+      'results' : results,
+  }
+  if args.output is not None:
+    with open(args.output, 'w') as file:
+      json.dump(document, file, indent=2, sort_keys=True)
+  if args.baseline is None:
+    return 0
+  if args.save_baseline:
+    with open(args.baseline, 'w') as file:
+      json.dump(document, file, indent=2, sort_keys=True)
+    print("""Saved baseline to '%s'.""" % args.baseline)
+    return 0
+  with open(args.baseline, 'r') as file:
+    baseline = json.load(file)['results']
+  regressions = compare(results, baseline, args.threshold)
+  if not regressions:
+    print("""No case regressed by more than %.1f%%.""" % args.threshold)
+    return 0
+  print("""%d case(s) regressed by more than %.1f%%:""" % (
+      len(regressions), args.threshold))
+  for line in regressions:
+    print("""  %s""" % line)
+  return 1
+
+
+if __name__ == '__main__':
+  sys.exit(main())
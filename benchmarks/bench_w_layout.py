@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of WLayout auto-placement, membership, dimensions,
+widget rectangles and building for dashboards of hundreds of tiles."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+from timeit import repeat
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(here, '..', 'src')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+
+from worQt.layouts import LayoutIndex, LayoutSpan, WLayout
+from worQt.widgets import BaseWidget
+
+TILES = 400
+
+
+def best(stmt: callable, number: int) -> float:
+  """Returns the best time per call in microseconds."""
+  return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+  """Runs the benchmark and prints the results."""
+  app = QApplication.instance() or QApplication([])
+  widgets = [BaseWidget() for _ in range(TILES)]
+
+  def fill() -> WLayout:
+    """Auto-places every widget in a new layout."""
+    layout = WLayout()
+    for widget in widgets:
+      layout.addWidget(widget)
+    return layout
+
+  spans = [LayoutSpan(1 + i % 3, 1 + i * 7 % 4) for i in range(TILES)]
+
+  def fitSpans() -> WLayout:
+    """Places every widget at a spanning rectangle in a new layout."""
+    out = WLayout()
+    for widget, span in zip(widgets, spans):
+      out.fitWidget(widget, span)
+    return out
+
+  layout = fill()
+  index = LayoutIndex(7, 11)
+  layout.build()
+  tile, spots = widgets[-1], [(20, 0), (19, 1)]
+
+  def move() -> None:
+    """Moves a single tile back and forth."""
+    spots.reverse()
+    layout.moveWidget(tile, LayoutIndex(*spots[0]))
+
+  def moveBuild() -> None:
+    """Moves a tile and builds a new layout."""
+    move()
+    layout.build()
+
+  def moveRebuild() -> None:
+    """Moves a tile and patches the built layout."""
+    move()
+    layout.rebuild()
+
+  results = {
+      'fill, %d' % TILES     : (fill, 1),
+      'fitWidget, %d' % TILES: (fitSpans, 1),
+      '_nextIndex'           : (lambda: layout._nextIndex(), 200),
+      '__contains__'         : (lambda: index in layout, 200),
+      'nCols'                : (lambda: layout.nCols, 200),
+      'nRows'                : (lambda: layout.nRows, 200),
+      '_getRectWidgets'      : (lambda: layout._getRectWidgets(), 1),
+      'move, build'          : (moveBuild, 1),
+      'move, rebuild'        : (moveRebuild, 1),
+  }
+  print("""Best of 5 (microseconds per call):""")
+  for name, (stmt, number) in results.items():
+    print("""  %-24s %12.2f""" % (name, best(stmt, number)))
+  del app
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,128 @@
+"""The '_layout_fit' module provides the maximal free rectangles placing
+spanning widgets in WLayout. Rectangles are tuples of (left, top, right,
+bottom) with inclusive edges, such as those of LayoutRect. The free space
+is the quadrant to the right of and below the top left cell, such that
+free rectangles touching the right or bottom extend to infinity. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from math import inf
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Callable, Optional, TypeAlias
+
+  Rect: TypeAlias = tuple[Any, Any, Any, Any]
+
+
+def columnRuns(masks: list[int]) -> list[Rect]:
+  """Returns the occupied cells of the occupancy bitmap as one rectangle
+  per run of consecutive occupied rows in each column."""
+  out = []
+  for col, mask in enumerate(masks):
+    while mask:
+      top = (mask & -mask).bit_length() - 1
+      shifted = mask >> top
+      length = (~shifted & (shifted + 1)).bit_length() - 1
+      out.append((col, top, col, top + length - 1))
+      mask &= ~(((1 << length) - 1) << top)
+  return out
+
+
+def _contains(outer: Rect, inner: Rect) -> bool:
+  """Returns True if the outer rectangle contains the inner."""
+  L0, T0, R0, B0 = outer
+  L1, T1, R1, B1 = inner
+  return L0 <= L1 and T0 <= T1 and R1 <= R0 and B1 <= B0
+
+
+def splitFreeRects(freeRects: list[Rect], used: Rect) -> list[Rect]:
+  """Returns the maximal free rectangles remaining after occupying the
+  used rectangle. Every free rectangle overlapping it is replaced by the
+  up to four maximal parts of it not overlapping it, after which the
+  parts contained in other free rectangles are discarded. Each part is
+  tested against every other free rectangle, such that the pruning is
+  quadratic in the number of free rectangles in the worst case."""
+  L, T, R, B = used
+  kept, parts = [], []
+  for free in freeRects:
+    fL, fT, fR, fB = free
+    if L > fR or R < fL or T > fB or B < fT:
+      kept.append(free)
+      continue
+    if fL < L:
+      parts.append((fL, fT, L - 1, fB))
+    if R < fR:
+      parts.append((R + 1, fT, fR, fB))
+    if fT < T:
+      parts.append((fL, fT, fR, T - 1))
+    if B < fB:
+      parts.append((fL, B + 1, fR, fB))
+  out = kept
+  for i, part in enumerate(parts):
+    if any([_contains(rect, part) for rect in out]):
+      continue
+    if any([_contains(rect, part) for rect in parts[i + 1:]]):
+      continue
+    out.append(part)
+  return out
+
+
+def freeRectsOf(masks: list[int]) -> list[Rect]:
+  """Returns the maximal free rectangles of the occupancy bitmap."""
+  freeRects = [(0, 0, inf, inf), ]
+  for used in columnRuns(masks):
+    freeRects = splitFreeRects(freeRects, used)
+  return freeRects
+
+
+def compactScore(left: int, top: int, width: int, height: int,
+                 nRows: int, nCols: int) -> tuple:
+  """Prefers the placement leaving the smallest bounding square, then the
+  smallest bounding area, then the top row and the left column."""
+  rows, cols = max(nRows, top + height), max(nCols, left + width)
+  return max(rows, cols), rows * cols, top, left
+
+
+def rowMajorScore(left: int, top: int, width: int, height: int,
+                  nRows: int, nCols: int) -> tuple:
+  """Prefers the top row, then the left column."""
+  return top, left
+
+
+def colMajorScore(left: int, top: int, width: int, height: int,
+                  nRows: int, nCols: int) -> tuple:
+  """Prefers the left column, then the top row."""
+  return left, top
+
+
+fitScores = {
+    'compact' : compactScore,
+    'rowMajor': rowMajorScore,
+    'colMajor': colMajorScore,
+}
+
+
+def bestFit(freeRects: list[Rect], width: int, height: int, nRows: int,
+            nCols: int, score: Callable) -> Optional[tuple[int, int]]:
+  """Returns the (left, top) of the best scoring placement of a rectangle
+  of the given width and height, or None if none of the free rectangles
+  is large enough. Only the top left corner of each free rectangle large
+  enough is scored, which finds the best placement for any score never
+  improving as the placement moves right or down, as do those above."""
+  best, bestKey = None, None
+  for L, T, R, B in freeRects:
+    if R - L + 1 < width or B - T + 1 < height:
+      continue
+    key = score(L, T, width, height, nRows, nCols)
+    if bestKey is None or key < bestKey:
+      best, bestKey = (L, T), key
+  return best
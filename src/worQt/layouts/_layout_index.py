@@ -20,19 +20,25 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-  from typing import Any, Self
+  from typing import Any, Self, Iterator
 
 
 class LayoutIndex(BaseObject):
   """This data class provides a hashable index for a position in the
   widget. It has fields:
   - col: int -> Column index indicating the number of columns to the left
-  - row: int -> Row index indicating the number of rows above"""
+  - row: int -> Row index indicating the number of rows above
 
-  __iter_contents__ = None
+  Indices are immutable, such that calling the class with non-negative
+  coordinates below '__intern_limit__' returns the same instance for the
+  same coordinates. Each subclass keeps its own interned instances. """
 
   __n_cols__ = None
   __n_rows__ = None
+  __hash_value__ = None
+
+  __intern_limit__ = 256
+  __interned_indices__ = None
 
   col = Field()  # Column index indicating the number of columns to the left
   row = Field()  # Row index indicating the number of rows above
@@ -73,15 +79,64 @@ class LayoutIndex(BaseObject):
       raise TypeError(typeMsg('__n_rows__', value, int))
     self.__n_rows__ = value
 
+  @classmethod
+  def _getInterned(cls) -> dict[int, Self]:
+    """Returns the interned instances of this class keyed by their packed
+    coordinates. """
+    interned = cls.__dict__.get('__interned_indices__', None)
+    if interned is None:
+      interned = dict()
+      setattr(cls, '__interned_indices__', interned)
+    return interned
+
+  @classmethod
+  def __class_call__(cls, *args, **kwargs) -> Self:
+    """Returns the interned index when the arguments resolve to
+    non-negative coordinates below '__intern_limit__', creating it on
+    first use. Other arguments are passed to the overloaded constructors.
+    Indices of this exact class are returned as they are. """
+    if kwargs or not args or len(args) > 2:
+      return type.__call__(cls, *args, **kwargs)
+    if len(args) == 2:
+      row, col = args
+    elif type(args[0]) is cls:
+      return args[0]
+    elif type(args[0]) is int:
+      row = col = args[0]
+    elif type(args[0]) in (tuple, list) and len(args[0]) == 2:
+      row, col = args[0]
+    else:
+      return type.__call__(cls, *args)
+    if type(row) is not int or type(col) is not int:
+      return type.__call__(cls, *args)
+    limit = cls.__intern_limit__
+    if row < 0 or col < 0 or row >= limit or col >= limit:
+      return type.__call__(cls, *args)
+    interned = cls.__dict__.get('__interned_indices__', None)
+    if interned is None:
+      interned = cls._getInterned()
+    key = row * limit + col
+    index = interned.get(key, None)
+    if index is None:
+      index = type.__call__(cls, row, col)
+      interned[key] = index
+    return index
+
   def __hash__(self, ) -> int:
     """Returns the hash of the index. """
-    return hash((self.col, self.row))
+    if self.__hash_value__ is None:
+      self.__hash_value__ = hash((self.__n_cols__, self.__n_rows__))
+    return self.__hash_value__
 
   def __eq__(self, other: Self) -> bool:
     """Returns True if the index is equal to the other index. """
-    if self.col == other.col and self.row == other.row:
+    if self is other:
       return True
-    return False
+    if not isinstance(other, LayoutIndex):
+      return NotImplemented
+    if self.__n_cols__ != other.__n_cols__:
+      return False
+    return True if self.__n_rows__ == other.__n_rows__ else False
 
   def __str__(self) -> str:
     """Returns the string representation of the index. """
@@ -95,25 +150,15 @@ class LayoutIndex(BaseObject):
     name = type(self).__name__
     return infoSpec % (name, self.row, self.col)
 
-  def __iter__(self) -> Self:
-    """Returns an iterator for the index. """
-    self.__iter_contents__ = [self.row, self.col]
-    return self
+  def __iter__(self) -> Iterator[int]:
+    """Yields the row and then the column of the index. """
+    yield self.row
+    yield self.col
 
   def __bool__(self) -> bool:
     """Returns True if the index is not empty. """
     return True if self.row or self.col else False
 
-  def __next__(self) -> Any:
-    """Returns the next item in the iterator. """
-    try:
-      return self.__iter_contents__.pop(0)
-    except IndexError:
-      raise StopIteration
-    finally:
-      if not self.__iter_contents__:
-        self.__iter_contents__ = None
-
   @overload(int, int)
   def __init__(self, row: int, col: int) -> None:
     """Initializes the index with the given row and column. """
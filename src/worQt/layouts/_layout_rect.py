@@ -21,13 +21,12 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-  from typing import Any, Self
+  from typing import Any, Self, Iterator
 
 
 class LayoutRect(BaseObject):
   """LayoutRect represents a rectangle in a layout."""
 
-  __iter_contents__ = None
   __set_key__ = None
 
   #  private variables
@@ -176,26 +175,17 @@ class LayoutRect(BaseObject):
 
   def __setattr__(self, key: str, value: Any) -> None:
     """Set the attribute of the rectangle."""
-    self.__set_key__ = key
+    BaseObject.__setattr__(self, '__set_key__', key)
     return BaseObject.__setattr__(self, key, value)
 
-  def __iter__(self, ) -> Self:
-    """Iterate over the rectangle."""
-    items = []
-    for i in range(self.colSpan):
-      for j in range(self.rowSpan):
-        col = self.left + i
-        row = self.top + j
-        items.append(LayoutIndex(col, row))
-    self.__iter_contents__ = items
-    return self
-
-  def __next__(self) -> LayoutIndex:
-    """Get the next item in the rectangle."""
-    if self.__iter_contents__:
-      return self.__iter_contents__.pop(0)
-    self.__iter_contents__ = None
-    raise StopIteration
+  def __iter__(self, ) -> Iterator[LayoutIndex]:
+    """Iterate over the rectangle column by column. The indices are
+    created as the iteration proceeds, and each call returns a new
+    generator, so nested and concurrent iteration is safe."""
+    rows = range(self.top, self.bottom + 1)
+    for col in range(self.left, self.right + 1):
+      for row in rows:
+        yield LayoutIndex(row, col)
 
   def __len__(self, ) -> int:
     """Get the length of the rectangle."""
@@ -9,7 +9,6 @@ from PySide6.QtWidgets import QGridLayout
 from worktoy.attr import Field
 from worktoy.ezdata import EZData
 from worktoy.mcls import BaseObject
-from worktoy.parse import maybe
 from worktoy.static import overload
 from worktoy.text import typeMsg
 from worktoy.waitaminute import MissingVariable, DispatchException
@@ -19,6 +18,7 @@ from ..widgets import BaseWidget
 from . import LayoutIndex as LIndex
 from . import LayoutSpan as LSpan
 from . import LayoutRect as LRect
+from ._layout_fit import fitScores, freeRectsOf, splitFreeRects, bestFit
 
 try:
   from typing import TYPE_CHECKING
@@ -37,11 +37,49 @@ if TYPE_CHECKING:
 class WLayout(BaseObject):
   """WLayout manages the layout of widgets across the 'worQt' library. It
   organizes both the main application windows and widgets with multiple child
-  widgets. """
+  widgets.
+
+  Occupied cells are kept in a dictionary from (row, col) to widget and in
+  an occupancy bitmap holding one integer per column, with bit 'row' set
+  for every occupied cell. Indices are never negative, shifting the
+  existing cells only when a widget is placed above or to the left of
+  them. Removing widgets may leave the top row or left column empty, in
+  which case the cells are shifted back when the layout is built.
+
+  Widgets added without coordinates are placed in the first free cell of
+  the smallest square at the top left having one, scanning the columns
+  from the left and each column from the bottom. The side of that square
+  only grows and is cached, such that auto-placement, membership tests
+  and the 'nCols' and 'nRows' fields need a few integer operations rather
+  than a scan of the cells.
+
+  The bounding rectangle of the cells of every widget is maintained as
+  the cells are added, such that 'getRect' and 'build' need no scan of
+  the cells either.
+
+  Spanning widgets are placed by 'fitWidget' at the best scoring free
+  position, found among the maximal free rectangles of the layout. These
+  are split as cells are occupied and recomputed from the bitmap after
+  widgets are removed or the cells shift.
+
+  'build' returns a new QGridLayout and remembers it along with the
+  rectangle of every widget placed in it. After adding, moving or removing
+  widgets, 'rebuild' patches that layout, removing and placing only the
+  widgets whose rectangle changed. Each widget has 'initUi' called once,
+  before it is first placed in a layout. """
 
   __iter_contents__ = None
 
   __widget_dict__ = None
+  __widget_rects__ = None
+  __built_layout__ = None
+  __built_rects__ = None
+  __initialized_widgets__ = None
+  __hidden_widgets__ = None
+  __col_masks__ = None
+  __free_rects__ = None
+  __row_count__ = 0
+  __fill_side__ = 1
 
   outerMargins = Field()  # Outer margins of the layout
   nCols = Field()  # Horizontal widget resolution
@@ -49,54 +87,185 @@ class WLayout(BaseObject):
   bottomCols = Field()  # Number of columns in the bottom row
   rightRows = Field()  # Number of rows in the right column
 
-  def _getWidgetDict(self, **kwargs) -> WDict:
-    """Getter-function for the widget dictionary. """
-    widgetDict = maybe(self.__widget_dict__, dict())
-    if not widgetDict:
-      return widgetDict
-    minRow = min([i.row for i in widgetDict.keys()])
-    minCol = min([i.col for i in widgetDict.keys()])
-    if not minRow ** 2 + minCol ** 2:
-      return widgetDict
-    if kwargs.get('_recursion', False):
-      raise RecursionError
-    newWidgetDict = {}
-    for key, value in widgetDict.items():
-      newKey = LIndex(key.col - minCol, key.row - minRow)
-      newWidgetDict[newKey] = value
-    self.__widget_dict__ = newWidgetDict
-    return self._getWidgetDict(_recursion=True)
-
-  def _getEmptyEdges(self, *args) -> list[LIndex]:
-    """Returns a list of empty edges in the widget dictionary. """
-    d = maybe([*args, None][0], 0)
+  def _getCells(self, ) -> dict[tuple[int, int], BaseWidget]:
+    """Getter-function for the dictionary from (row, col) to widget. """
+    if self.__widget_dict__ is None:
+      self.__widget_dict__ = dict()
+    return self.__widget_dict__
+
+  def _getWidgetRects(self, ) -> dict[BaseWidget, tuple]:
+    """Getter-function for the dictionary from widget to the bounding
+    (left, top, right, bottom) of its cells. """
+    if self.__widget_rects__ is None:
+      self.__widget_rects__ = dict()
+    return self.__widget_rects__
+
+  def _getColMasks(self, ) -> list[int]:
+    """Getter-function for the occupancy bitmap. Bit 'row' of the integer
+    at index 'col' is set if the cell is occupied. """
+    if self.__col_masks__ is None:
+      self.__col_masks__ = []
+    return self.__col_masks__
+
+  def _getWidgetDict(self, ) -> WDict:
+    """Returns a new dictionary from the index of every occupied cell to
+    its widget. """
+    return {LIndex(r, c): w for (r, c), w in self._getCells().items()}
+
+  def _isOccupied(self, row: int, col: int) -> bool:
+    """Returns True if the cell at the given row and column is occupied. """
+    masks = self._getColMasks()
+    if row < 0 or col < 0 or col >= len(masks):
+      return False
+    return True if masks[col] >> row & 1 else False
+
+  def _shiftCells(self, rows: int, cols: int) -> None:
+    """Moves every cell the given number of rows down and columns right.
+    Negative numbers move the cells up and left, and must not move any
+    cell past the top row or left column. """
+    cells = self._getCells()
+    self.__widget_dict__ = {
+        (r + rows, c + cols): w for (r, c), w in cells.items()
+    }
+    self.__widget_rects__ = {
+        w: (L + cols, T + rows, R + cols, B + rows)
+        for w, (L, T, R, B) in self._getWidgetRects().items()
+    }
+    masks = self._getColMasks()
+    if rows < 0:
+      masks = [mask >> -rows for mask in masks]
+    else:
+      masks = [mask << rows for mask in masks]
+    if cols < 0:
+      self.__col_masks__ = masks[-cols:]
+    else:
+      self.__col_masks__ = [0] * cols + masks
+    self.__row_count__ += rows
+    self.__fill_side__ = 1
+    self.__free_rects__ = None
+
+  def _addCells(self, item: BaseWidget, cells: list[tuple]) -> None:
+    """Places the widget in every cell given as (row, col), normalizing
+    the indices first. """
+    cellDict = self._getCells()
+    minRow = min([row for row, _ in cells])
+    minCol = min([col for _, col in cells])
+    if cellDict:
+      rows, cols = max(0, -minRow), max(0, -minCol)
+    else:
+      rows, cols = -minRow, -minCol
+    if rows or cols:
+      self._shiftCells(rows, cols)
+      cellDict = self._getCells()
+    masks = self._getColMasks()
+    displaced = []
+    for row, col in cells:
+      row, col = row + rows, col + cols
+      previous = cellDict.get((row, col), item)
+      if previous is not item and previous not in displaced:
+        displaced.append(previous)
+      cellDict[(row, col)] = item
+      if col >= len(masks):
+        masks.extend([0] * (col + 1 - len(masks)))
+      masks[col] |= 1 << row
+      if row >= self.__row_count__:
+        self.__row_count__ = row + 1
+    L, T = minCol + cols, minRow + rows
+    R = max([col for _, col in cells]) + cols
+    B = max([row for row, _ in cells]) + rows
+    self._splitFree(cells, (L, T, R, B), rows, cols)
+    widgetRects = self._getWidgetRects()
+    if item in widgetRects:
+      L0, T0, R0, B0 = widgetRects[item]
+      L, T, R, B = min(L, L0), min(T, T0), max(R, R0), max(B, B0)
+    widgetRects[item] = (L, T, R, B)
+    for widget in displaced:
+      self._updateRect(widget)
+
+  def _splitFree(self, cells: list[tuple], bounds: tuple, rows: int,
+                 cols: int) -> None:
+    """Splits the maximal free rectangles by the newly occupied cells,
+    given before normalization along with their normalized bounds. A
+    single split suffices when the cells fill their bounds. """
+    if self.__free_rects__ is None:
+      return
+    L, T, R, B = bounds
+    if len({*cells, }) == (R - L + 1) * (B - T + 1):
+      used = [bounds, ]
+    else:
+      used = [(c + cols, r + rows, c + cols, r + rows) for r, c in cells]
+    for rect in used:
+      self.__free_rects__ = splitFreeRects(self.__free_rects__, rect)
+
+  def _getFreeRects(self, ) -> list[tuple]:
+    """Getter-function for the maximal free rectangles. """
+    if self.__free_rects__ is None:
+      self.__free_rects__ = freeRectsOf(self._getColMasks())
+    return self.__free_rects__
+
+  def _updateRect(self, widget: BaseWidget) -> None:
+    """Recomputes the bounding rectangle of a widget from its remaining
+    cells, after some of them were taken by another widget. """
+    cells = [key for key, w in self._getCells().items() if w is widget]
+    widgetRects = self._getWidgetRects()
+    if not cells:
+      del widgetRects[widget]
+      return
+    rows, cols = [row for row, _ in cells], [col for _, col in cells]
+    widgetRects[widget] = (min(cols), min(rows), max(cols), max(rows))
+
+  def _isSquareFull(self, d: int) -> bool:
+    """Returns True if every cell of the square of side 'd' at the top
+    left is occupied. """
+    masks = self._getColMasks()
+    if len(masks) < d:
+      return False
+    full = (1 << d) - 1
+    for col in range(d):
+      if masks[col] & full != full:
+        return False
+    return True
+
+  def _getFillSide(self, ) -> int:
+    """Returns the side of the smallest square at the top left having a
+    free cell. """
+    d = self.__fill_side__
+    while self._isSquareFull(d):
+      d += 1
+    self.__fill_side__ = d
+    return d
+
+  def _getEmptyEdges(self, ) -> list[LIndex]:
+    """Returns the free cells of the smallest square at the top left
+    having any, in the order of auto-placement. """
+    d, masks = self._getFillSide(), self._getColMasks()
     emptyEdges = []
-    widgetDict = self._getWidgetDict()
-    for row in range(d):
-      for col in range(d):
-        index = LIndex(d - col - 1, row)
-        if index not in widgetDict:
-          emptyEdges.append(index)
-    if emptyEdges:
-      return emptyEdges
-    return self._getEmptyEdges(d + 1)
-
-  def _getOuterEdges(self, *args) -> list[LIndex]:
-    """Returns a list of outer edges in the widget dictionary. """
-    d = maybe([*args, None][0], 1)
-    outerEdges = []
-    widgetDict = self._getWidgetDict()
-    for row in range(d):
-      for col in range(d):
-        index = LIndex(d - col - 1, row)
-        if index in widgetDict:
-          return self._getOuterEdges(d + 1)
-        outerEdges.append(index)
+    for col in range(d):
+      mask = masks[col] if col < len(masks) else 0
+      for row in range(d - 1, -1, -1):
+        if not mask >> row & 1:
+          emptyEdges.append(LIndex(row, col))
+    return emptyEdges
+
+  def _getOuterEdges(self, ) -> list[LIndex]:
+    """Returns the cells bordering the square at the top left bounding
+    every occupied cell on the bottom and right, in the order of
+    auto-placement. These cells are free by construction. """
+    d = max(self.nRows, self.nCols) + 1
+    outerEdges = [LIndex(d - 1, col) for col in range(d - 1)]
+    outerEdges.extend([LIndex(row, d - 1) for row in range(d - 1, -1, -1)])
     return outerEdges
 
   def _nextIndex(self) -> LIndex:
     """Returns the next available index in the widget dictionary. """
-    return self._getEmptyEdges()[0]
+    d, masks = self._getFillSide(), self._getColMasks()
+    full = (1 << d) - 1
+    for col in range(d):
+      free = ~masks[col] & full if col < len(masks) else full
+      if free:
+        return LIndex(free.bit_length() - 1, col)
+    e = """Found no free cell in the square of side %d!"""
+    raise RuntimeError(e % d)
 
   @outerMargins.GET
   def _getOuterMargins(self) -> WMargins:
@@ -105,35 +274,61 @@ class WLayout(BaseObject):
   @overload(BaseWidget, LIndex)
   def _addItem(self, item: BaseWidget, index: LIndex) -> None:
     """Adds an item to the widget dictionary. """
-    existing = self._getWidgetDict()
-    self.__widget_dict__ = {**existing, index: item}
+    self._addCells(item, [(index.row, index.col), ])
 
   @overload(BaseWidget, LRect)
   def _addItem(self, item: BaseWidget, rect: LRect) -> None:
     """Adds an item to the widget dictionary. """
-    existing = self._getWidgetDict()
-    for index in rect:
-      self._addItem(item, index)
+    self._addCells(item, [(index.row, index.col) for index in rect])
+
+  @staticmethod
+  def _resolveScore(score: Any) -> Callable:
+    """Resolves the name of a score in 'fitScores' or a callable to the
+    scoring function. """
+    if score is None:
+      return fitScores['compact']
+    if callable(score):
+      return score
+    if score in fitScores:
+      return fitScores[score]
+    e = """Unknown placement score: '%s'! Expected one of: %s"""
+    raise ValueError(e % (score, ', '.join(fitScores)))
 
-  def _fitRect(self, rect: LRect) -> LRect:
+  def _fitRect(self, rect: LRect, score: Any = None) -> LRect:
     """Creates a new LRect object having same size as given LRect object,
-    but placed such that the bounding rect is smallest. """
-    emptyEdges = self._getEmptyEdges()
-    rects = []
-    for edge in emptyEdges:
-      rects.append(LRect(edge, rect))
-    maxDims = [max([r.right, r.bottom]) for r in rects]
-    return sorted(rects, key=lambda r: max([r.right, r.bottom]))[0]
+    but placed over free cells only, at the position scoring best. The
+    score is the name of one in 'fitScores', defaulting to 'compact', or
+    a callable taking the left, top, width and height of the placement
+    and the number of rows and columns of the layout. Lower scores are
+    better, and scores must not improve as the placement moves right or
+    down. If no free rectangle is large enough, the placement falls back
+    to the left column of the row below every occupied cell. """
+    scoreFunc = self._resolveScore(score)
+    width, height = rect.width, rect.height
+    freeRects = self._getFreeRects()
+    corner = bestFit(freeRects, width, height, self.nRows, self.nCols,
+                     scoreFunc)
+    L, T = (0, self.nRows) if corner is None else corner
+    return LRect(L, T, L + width - 1, T + height - 1)
+
+  def fitWidget(self, widget: BaseWidget, *args, **kwargs) -> LRect:
+    """Adds the widget over free cells at the best position for a
+    rectangle of the size given by the arguments, which are those accepted
+    by LayoutRect. The 'score' keyword argument is passed on to
+    '_fitRect'. Returns the rectangle occupied. """
+    rect = self._fitRect(LRect(*args), kwargs.get('score', None))
+    self._addItem(widget, rect)
+    return rect
 
   @nCols.GET
   def _getNCols(self) -> int:
     """Returns the number of columns in the layout. """
-    return max([i.col for i in self._getWidgetDict().keys()])
+    return len(self._getColMasks())
 
   @nRows.GET
   def _getNRows(self, ) -> int:
     """Returns the number of rows in the layout"""
-    return max([i.row for i in self._getWidgetDict().keys()])
+    return self.__row_count__
 
   def addWidget(self, widget: BaseWidget, *args) -> None:
     """Adds a widget to the layout. """
@@ -180,49 +375,123 @@ class WLayout(BaseObject):
     other = self._resolveOther(other)
     if other is NotImplemented:
       return False
-    widgetDict = self._getWidgetDict()
     if isinstance(other, LIndex):
-      return other in widgetDict
+      return self._isOccupied(other.row, other.col)
     if isinstance(other, LRect):
-      if other.topLeft in widgetDict and other.bottomRight in widgetDict:
-        return True
-      return False
+      masks = self._getColMasks()
+      if other.top < 0 or other.left < 0 or other.right >= len(masks):
+        return False
+      rows = ((1 << other.height) - 1) << other.top
+      for col in range(other.left, other.right + 1):
+        if masks[col] & rows != rows:
+          return False
+      return True
     return False
 
   def _getWidgets(self) -> list[BaseWidget]:
     """Returns a list of widgets in the layout. """
-    widgetDict = self._getWidgetDict()
-    return [*widgetDict.values()]
+    return [*self._getWidgetRects().keys()]
 
   def _getRectWidgets(self) -> dict[LRect, BaseWidget]:
     """Returns a dictionary of widgets in the layout. """
     rectWidgetDict = dict()
-    itemWidgetDict = self._getWidgetDict()
-    widgets = self._getWidgets()
-    for widget in widgets:
-      indices = []
-      for index, item in itemWidgetDict.items():
-        if item is widget:
-          indices.append(index)
-      else:
-        rect = LRect.fromIndices(*indices)
-        rectWidgetDict[rect] = widget
+    for widget, (L, T, R, B) in self._getWidgetRects().items():
+      rectWidgetDict[LRect(L, T, R, B)] = widget
     return rectWidgetDict
 
+  def getRect(self, widget: BaseWidget) -> LRect:
+    """Returns the rectangle bounding the cells of the given widget. """
+    widgetRects = self._getWidgetRects()
+    if widget not in widgetRects:
+      e = """Widget '%s' is not in the layout!"""
+      raise KeyError(e % widget)
+    return LRect(*widgetRects[widget])
+
+  def removeWidget(self, widget: BaseWidget) -> None:
+    """Removes the widget from every cell it occupies. """
+    widgetRects = self._getWidgetRects()
+    if widget not in widgetRects:
+      e = """Widget '%s' is not in the layout!"""
+      raise KeyError(e % widget)
+    L, T, R, B = widgetRects.pop(widget)
+    cellDict, masks = self._getCells(), self._getColMasks()
+    for col in range(L, R + 1):
+      for row in range(T, B + 1):
+        if cellDict.get((row, col), None) is widget:
+          del cellDict[(row, col)]
+          masks[col] &= ~(1 << row)
+    while masks and not masks[-1]:
+      masks.pop()
+    self.__row_count__ = max([mask.bit_length() for mask in masks] or [0])
+    self.__fill_side__ = 1
+    self.__free_rects__ = None
+
+  def _normalize(self, ) -> None:
+    """Shifts the cells up and left such that the top row and the left
+    column are occupied. Removing widgets may leave them empty, which is
+    undone here rather than on every removal, such that the remaining
+    widgets keep their cells until the layout is built. """
+    masks = self._getColMasks()
+    if not any(masks):
+      return
+    minCol = next(col for col, mask in enumerate(masks) if mask)
+    minRow = min([(mask & -mask).bit_length() - 1 for mask in masks if mask])
+    if minRow or minCol:
+      self._shiftCells(-minRow, -minCol)
+
+  def moveWidget(self, widget: BaseWidget, *args) -> None:
+    """Moves the widget to the rectangle given by the arguments, which are
+    those accepted by LayoutRect. """
+    self.removeWidget(widget)
+    self._addItem(widget, LRect(*args))
+
+  def _placeWidget(self, layout: QGridLayout, widget: BaseWidget,
+                   rect: tuple) -> None:
+    """Places the widget in the layout at the (left, top, right, bottom)
+    rectangle, calling 'initUi' on widgets not yet placed in a layout. """
+    if self.__initialized_widgets__ is None:
+      self.__initialized_widgets__ = dict()
+    if widget not in self.__initialized_widgets__:
+      widget.initUi()
+      self.__initialized_widgets__[widget] = True
+    hidden = self.__hidden_widgets__
+    if hidden is not None and hidden.pop(widget, False):
+      widget.setVisible(True)
+    L, T, R, B = rect
+    QGridLayout.addWidget(layout, widget, T, L, B - T + 1, R - L + 1)
+
   def build(self, ) -> QGridLayout:
     """Builds the layout. """
-    rectWidgets = self._getRectWidgets()
+    self._normalize()
     layout = QGridLayout()
     layout.setContentsMargins(0, 0, 0, 0)
-    for rect, widget in rectWidgets.items():
-      if TYPE_CHECKING:
-        assert isinstance(rect, LRect)
-        assert isinstance(widget, BaseWidget)
-        assert isinstance(rect.left, int)
-        assert isinstance(rect.top, int)
-        assert isinstance(rect.width, int)
-        assert isinstance(rect.height, int)
-      row, col, width, height = rect.top, rect.left, rect.width, rect.height
-      widget.initUi()
-      QGridLayout.addWidget(layout, widget, row, col, height, width)
+    widgetRects = self._getWidgetRects()
+    for widget, rect in widgetRects.items():
+      self._placeWidget(layout, widget, rect)
+    self.__built_layout__ = layout
+    self.__built_rects__ = {**widgetRects, }
+    return layout
+
+  def rebuild(self, ) -> QGridLayout:
+    """Applies the changes made since the last build to the layout it
+    returned, or builds a new layout if none was built. Widgets removed
+    from the layout are hidden, as Qt leaves them in place otherwise. """
+    layout = self.__built_layout__
+    if layout is None:
+      return self.build()
+    self._normalize()
+    built, current = self.__built_rects__, self._getWidgetRects()
+    for widget, rect in built.items():
+      if current.get(widget, None) == rect:
+        continue
+      QGridLayout.removeWidget(layout, widget)
+      if widget not in current:
+        if self.__hidden_widgets__ is None:
+          self.__hidden_widgets__ = dict()
+        self.__hidden_widgets__[widget] = True
+        widget.setVisible(False)
+    for widget, rect in current.items():
+      if built.get(widget, None) != rect:
+        self._placeWidget(layout, widget, rect)
+    self.__built_rects__ = {**current, }
     return layout
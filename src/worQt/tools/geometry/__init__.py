@@ -6,15 +6,30 @@ counterpart in the Qt library. """
 from __future__ import annotations
 
 from ._abstract_geometry import AbstractGeometry
+from ._dispatch_cache import DispatchCache, cacheDispatch, dispatchCacheInfo
 
 from ._plane import Plane
 from ._point import Point
 from ._vector import Vector
 from ._size import Size
+from ._frozen_plane import FrozenPlane
+from ._frozen_point import FrozenPoint
+from ._frozen_vector import FrozenVector
+from ._frozen_size import FrozenSize
 from ._region import Region
+from ._region_index import RegionIndex
+from ._point_view import PointView
+from ._point_array import PointArray
+from ._vector_array import VectorArray
+from ._region_array import RegionArray
+from ._damage_accumulator import DamageAccumulator
 from ._abstract_map import AbstractMap
 from ._region_map import RegionMap
 from ._move_map import MoveMap
 from ._scale_map import ScaleMap
 from ._rotate_map import RotateMap
 from ._rotate_point_map import RotatePointMap
+from ._affine_map import AffineMap
+from ._simplify import simplify
+from ._pack import packShelves
+from ._stream_pipeline import StreamPipeline
@@ -4,8 +4,32 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from array import array
 
+from PySide6.QtGui import QPolygonF, QTransform
+from worktoy.attr import Field
 from worktoy.mcls import BaseObject
+from worktoy.text import typeMsg
+
+from . import PointArray
+from . import _buffer_ops as ops
+from . import _qt_ops as qtOps
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, TypeAlias
+
+  from . import AffineMap
+
+  Coefficients: TypeAlias = tuple[float, float, float, float, float, float]
+  Matrix: TypeAlias = tuple[tuple[float, float, float], ...]
 
 
 class AbstractMap(BaseObject):
@@ -14,8 +38,96 @@ class AbstractMap(BaseObject):
   This is an abstract class that should be subclassed to create specific
   mapping implementations. The `__call__` method should be implemented to
   provide the actual mapping logic.
+
+  Every map is affine and subclasses must implement '_getCoefficients'
+  returning the six coefficients (a, b, c, d, e, f) such that a point
+  (x, y) maps to:
+    (a * x + b * y + c, d * x + e * y + f)
+  The 'matrix' field exposes these as the 3x3 homogeneous matrix. The @
+  operator composes two maps into a single AffineMap, such that
+  '(map1 @ map2)(point)' equals 'map1(map2(point))'.
+
+  The 'mapMany' method maps batches of points given as a PointArray, any
+  object supporting the buffer protocol (for example a NumPy array of
+  shape (N, 2)) or a sequence of points or of flat floats. Subclasses may
+  override '_mapArray' with a cheaper loop than the general affine one.
   """
 
+  #  public variables
+  coefficients = Field()
+  matrix = Field()
+
+  #  getter methods
+  @abstractmethod
+  @coefficients.GET
+  def _getCoefficients(self) -> Coefficients:
+    """Get the affine coefficients (a, b, c, d, e, f)."""
+
+  @matrix.GET
+  def _getMatrix(self) -> Matrix:
+    """Get the 3x3 homogeneous matrix."""
+    a, b, c, d, e, f = self.coefficients
+    return (a, b, c), (d, e, f), (0., 0., 1.)
+
   @abstractmethod
   def __call__(self, *args, **kwargs):
     """Call the mapping with the given arguments."""
+
+  def _mapArray(self, data: array) -> array:
+    """Returns a new buffer holding every point of the given buffer
+    mapped. The given buffer must not be modified."""
+    return ops.affine(data, *self.coefficients)
+
+  def toQ(self, ) -> QTransform:
+    """Returns the map as a QTransform. Qt applies the transposed matrix
+    to row vectors, hence the order of the coefficients."""
+    a, b, c, d, e, f = self.coefficients
+    return QTransform(a, d, b, e, c, f)
+
+  def mapToQPolygonF(self, points: Any) -> QPolygonF:
+    """Applies the mapping to every point in the batch and returns the
+    result as a QPolygonF, as passed to 'QPainter.drawPolyline'."""
+    points = self._resolvePoints(points)
+    return qtOps.toQPolygonF(self._mapArray(points.data))
+
+  @staticmethod
+  def _resolvePoints(points: Any) -> PointArray:
+    """Resolves points to a PointArray."""
+    if isinstance(points, PointArray):
+      return points
+    if isinstance(points, (list, tuple)):
+      return PointArray(points)
+    try:
+      return PointArray.fromBuffer(points)
+    except TypeError as typeError:
+      e = typeMsg('points', points, PointArray)
+      raise TypeError(e) from typeError
+
+  def mapMany(self, points: Any) -> PointArray:
+    """Applies the mapping to every point in the batch. PointArray
+    subclasses are preserved, any other input returns a PointArray."""
+    points = self._resolvePoints(points)
+    return points._fromArray(self._mapArray(points.data))
+
+  @staticmethod
+  def _composeCoefficients(outer: Coefficients,
+                           inner: Coefficients) -> Coefficients:
+    """Returns the coefficients of applying 'inner' followed by 'outer'."""
+    a1, b1, c1, d1, e1, f1 = outer
+    a2, b2, c2, d2, e2, f2 = inner
+    return (
+        a1 * a2 + b1 * d2,
+        a1 * b2 + b1 * e2,
+        a1 * c2 + b1 * f2 + c1,
+        d1 * a2 + e1 * d2,
+        d1 * b2 + e1 * e2,
+        d1 * c2 + e1 * f2 + f1,
+    )
+
+  def __matmul__(self, other: Any) -> AffineMap:
+    """Composes this map with other, such that other applies first."""
+    if not isinstance(other, AbstractMap):
+      return NotImplemented
+    from . import AffineMap
+    outer, inner = self.coefficients, other.coefficients
+    return AffineMap(self._composeCoefficients(outer, inner))
@@ -0,0 +1,157 @@
+"""AffineMap applies a general affine transformation given by six
+precomputed coefficients. Composing maps with the @ operator returns an
+AffineMap. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from PySide6.QtGui import QTransform
+from worktoy.static import overload, THIS
+from worktoy.text import monoSpace
+
+from . import AbstractMap, Point, Vector, Region, PointArray, VectorArray
+from . import cacheDispatch
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Self
+
+  from ._abstract_map import Coefficients
+
+
+@cacheDispatch
+class AffineMap(AbstractMap):
+  """AffineMap applies a general affine transformation given by six
+  precomputed coefficients (a, b, c, d, e, f), mapping (x, y) to:
+    (a * x + b * y + c, d * x + e * y + f)
+  """
+
+  #  fallback variables
+  __fallback_coefficients__ = (1., 0., 0., 0., 1., 0.)
+
+  #  private variables
+  __affine_coefficients__ = None
+
+  #  getter methods
+  def _getCoefficients(self) -> Coefficients:
+    """Get the affine coefficients (a, b, c, d, e, f)."""
+    if self.__affine_coefficients__ is None:
+      return self.__fallback_coefficients__
+    return self.__affine_coefficients__
+
+  #  caller overloads
+  @overload(int, int)
+  @overload(float, int)
+  @overload(int, float)
+  @overload(float, float)
+  def __call__(self, x: float, y: float) -> tuple[float, float]:
+    """Apply the mapping to a point."""
+    a, b, c, d, e, f = self.coefficients
+    return a * x + b * y + c, d * x + e * y + f
+
+  @overload(complex)
+  def __call__(self, z: complex) -> complex:
+    """Apply the mapping to a complex number."""
+    a, b, c, d, e, f = self.coefficients
+    x, y = z.real, z.imag
+    return (a * x + b * y + c) + (d * x + e * y + f) * 1j
+
+  @overload(Point)
+  def __call__(self, point: Point) -> Point:
+    """Apply the mapping to a point."""
+    a, b, c, d, e, f = self.coefficients
+    x, y = point.x, point.y
+    return Point._fromFloats(a * x + b * y + c, d * x + e * y + f)
+
+  @overload(Vector)
+  def __call__(self, vector: Vector) -> Vector:
+    """Apply the mapping to a vector."""
+    a, b, c, d, e, f = self.coefficients
+    x, y = vector.x, vector.y
+    return Vector._fromFloats(a * x + b * y + c, d * x + e * y + f)
+
+  @overload(Region)
+  def __call__(self, region: Region) -> Region:
+    """Apply the mapping to a region. As a general affine map may rotate
+    or shear the region, the bounding region of the mapped corners is
+    returned."""
+    if TYPE_CHECKING:
+      assert callable(self)
+    corners = [region.topLeft, region.topRight, region.bottomRight,
+               region.bottomLeft]
+    points = [self(corner) for corner in corners]
+    xs, ys = [p.x for p in points], [p.y for p in points]
+    return Region(min(xs), min(ys), max(xs), max(ys))
+
+  @overload(PointArray)
+  @overload(VectorArray)
+  def __call__(self, points: PointArray) -> PointArray:
+    """Apply the mapping to every point in the array."""
+    return self.mapMany(points)
+
+  #  constructor overloads
+  @overload(tuple)
+  @overload(list)
+  def __init__(self, values: Any) -> None:
+    """Create an AffineMap from six coefficients or from the rows of a
+    3x3 or 2x3 matrix."""
+    if all([isinstance(row, (tuple, list)) for row in values]):
+      values = [*values[0], *values[1]] if len(values) in (2, 3) else []
+    if len(values) != 6:
+      e = """Expected 6 coefficients or the rows of a 3x3 matrix, but
+      received: '%s'""" % (str(values),)
+      raise ValueError(monoSpace(e))
+    self.__affine_coefficients__ = (*[float(v) for v in values],)
+
+  @overload(float, float, float, float, float, float)
+  def __init__(self, *args) -> None:
+    """Create an AffineMap from six coefficients."""
+    self.__affine_coefficients__ = (*[float(arg) for arg in args],)
+
+  @overload(QTransform)
+  def __init__(self, transform: QTransform) -> None:
+    """Create an AffineMap from an affine QTransform."""
+    if not transform.isAffine():
+      e = """Unable to create an AffineMap from a projective QTransform!"""
+      raise ValueError(e)
+    t = transform
+    coefficients = t.m11(), t.m21(), t.dx(), t.m12(), t.m22(), t.dy()
+    self.__affine_coefficients__ = (*[float(c) for c in coefficients],)
+
+  @classmethod
+  def fromQ(cls, transform: QTransform) -> Self:
+    """Creates a new AffineMap from an affine QTransform."""
+    return cls(transform)
+
+  @overload(THIS)
+  def __init__(self, other: Self) -> None:
+    """Create a copy of another AffineMap."""
+    self.__affine_coefficients__ = other.coefficients
+
+  @overload(AbstractMap)
+  def __init__(self, other: AbstractMap) -> None:
+    """Create an AffineMap applying the same transformation as other."""
+    coefficients = [float(c) for c in other.coefficients]
+    self.__affine_coefficients__ = (*coefficients,)
+
+  @overload()
+  def __init__(self) -> None:
+    """Create the identity map."""
+    pass
+
+  def __str__(self, ) -> str:
+    """Return the string representation of the map."""
+    infoSpec = """%s[(%.3f, %.3f, %.3f), (%.3f, %.3f, %.3f)]"""
+    return infoSpec % (type(self).__name__, *self.coefficients)
+
+  def __repr__(self, ) -> str:
+    """Return the code representation of the map."""
+    infoSpec = """%s(%r, %r, %r, %r, %r, %r)"""
+    return infoSpec % (type(self).__name__, *self.coefficients)
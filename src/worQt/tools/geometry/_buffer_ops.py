@@ -0,0 +1,181 @@
+"""The '_buffer_ops' module provides the loops shared by the batch geometry
+types. Every function operates on flat 'array.array' objects of typecode
+'d' holding interleaved coordinates: [x0, y0, x1, y1, ...]. The loops are
+expressed through 'map' over the 'operator' functions wherever possible,
+such that no Python level frame is entered per coordinate. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+from functools import partial
+from itertools import repeat
+from math import hypot
+from operator import add, mul, neg, sub, truediv
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Iterable
+
+
+def zeros(n: int) -> array:
+  """Returns a flat buffer of 'n' zero valued floats."""
+  return array('d', bytes(8 * n))
+
+
+def interleave(xs: Iterable, ys: Iterable) -> array:
+  """Returns a flat buffer interleaving the given columns."""
+  if not isinstance(xs, array):
+    xs = array('d', xs)
+  if not isinstance(ys, array):
+    ys = array('d', ys)
+  if len(xs) != len(ys):
+    e = """Unable to interleave columns of lengths %d and %d!"""
+    raise ValueError(e % (len(xs), len(ys)))
+  out = zeros(2 * len(xs))
+  out[0::2] = xs
+  out[1::2] = ys
+  return out
+
+
+def flatten(values: Iterable) -> array:
+  """Returns a flat buffer from an iterable of either floats or pairs of
+  floats. Pairs may be given as tuples, lists, complex numbers or any
+  object supporting iteration over exactly two floats. """
+  out = array('d')
+  for value in values:
+    if isinstance(value, (int, float)):
+      out.append(float(value))
+      continue
+    if isinstance(value, complex):
+      out.append(value.real)
+      out.append(value.imag)
+      continue
+    x, y = value
+    out.append(float(x))
+    out.append(float(y))
+  if len(out) % 2:
+    e = """Expected an even number of coordinates, but received %d!"""
+    raise ValueError(e % len(out))
+  return out
+
+
+def fromBuffer(buffer: Any) -> array:
+  """Returns a flat buffer copied from any object supporting the buffer
+  protocol, such as 'array.array', 'memoryview' or NumPy arrays of shape
+  (N, 2) or (2N,). Float64 contiguous buffers are copied in a single
+  memcpy, other formats are converted value by value. """
+  view = memoryview(buffer)
+  out = array('d')
+  if view.format in ('d', '<d', '=d', '@d') and view.c_contiguous:
+    out.frombytes(view.cast('B'))
+  else:
+    out = flatten(_flatList(view.tolist()))
+  if len(out) % 2:
+    e = """Expected an even number of coordinates, but received %d!"""
+    raise ValueError(e % len(out))
+  return out
+
+
+def _flatList(values: list) -> list:
+  """Flattens nested lists as returned by 'memoryview.tolist'."""
+  out = []
+  for value in values:
+    if isinstance(value, list):
+      out.extend(_flatList(value))
+    else:
+      out.append(value)
+  return out
+
+
+def negate(data: array) -> array:
+  """Returns the negation of every coordinate."""
+  return array('d', map(neg, data))
+
+
+def addArrays(data: array, other: array) -> array:
+  """Returns the coordinate wise sum of two buffers of equal length."""
+  return array('d', map(add, data, other))
+
+
+def subArrays(data: array, other: array) -> array:
+  """Returns the coordinate wise difference of two buffers of equal
+  length."""
+  return array('d', map(sub, data, other))
+
+
+def offset(data: array, dx: float, dy: float) -> array:
+  """Returns the buffer with (dx, dy) added to every point."""
+  if dx == dy:
+    return array('d', map(partial(add, dx), data))
+  xs = array('d', map(partial(add, dx), data[0::2]))
+  ys = array('d', map(partial(add, dy), data[1::2]))
+  return interleave(xs, ys)
+
+
+def scale(data: array, sx: float, sy: float) -> array:
+  """Returns the buffer with every point scaled by (sx, sy)."""
+  if sx == sy:
+    return array('d', map(partial(mul, sx), data))
+  xs = array('d', map(partial(mul, sx), data[0::2]))
+  ys = array('d', map(partial(mul, sy), data[1::2]))
+  return interleave(xs, ys)
+
+
+def affine(data: array, *coefficients: float) -> array:
+  """Returns the buffer with every point (x, y) replaced by:
+    (a * x + b * y + c, d * x + e * y + f)
+  where the coefficients are given in the order: a, b, c, d, e, f. """
+  a, b, c, d, e, f = coefficients
+  if not b and not d:
+    return axisAffine(data, a, c, e, f)
+  xs, ys = data[0::2], data[1::2]
+  outX = array('d', [a * x + b * y + c for x, y in zip(xs, ys)])
+  outY = array('d', [d * x + e * y + f for x, y in zip(xs, ys)])
+  return interleave(outX, outY)
+
+
+def axisAffine(data: array, sx: float, ox: float, sy: float,
+               oy: float) -> array:
+  """Returns the buffer with every point (x, y) replaced by:
+    (sx * x + ox, sy * y + oy)
+  This is the affine transformation without rotation or shear. """
+  xs = map(add, map(mul, data[0::2], repeat(sx)), repeat(ox))
+  ys = map(add, map(mul, data[1::2], repeat(sy)), repeat(oy))
+  return interleave(array('d', xs), array('d', ys))
+
+
+def norms(data: array) -> array:
+  """Returns the length of every point."""
+  return array('d', map(hypot, data[0::2], data[1::2]))
+
+
+def dots(data: array, other: array) -> array:
+  """Returns the dot product of every pair of points."""
+  xx = map(mul, data[0::2], other[0::2])
+  yy = map(mul, data[1::2], other[1::2])
+  return array('d', map(add, xx, yy))
+
+
+def crosses(data: array, other: array) -> array:
+  """Returns the cross product of every pair of points."""
+  xy = map(mul, data[0::2], other[1::2])
+  yx = map(mul, data[1::2], other[0::2])
+  return array('d', map(sub, xy, yx))
+
+
+def broadcast(x: float, y: float, n: int) -> array:
+  """Returns a buffer of 'n' copies of the point (x, y)."""
+  return array('d', (x, y)) * n
+
+
+def divide(data: array, value: float) -> array:
+  """Returns the buffer with every coordinate divided by the value."""
+  return array('d', map(truediv, data, repeat(value)))
@@ -0,0 +1,332 @@
+"""DamageAccumulator collects dirty regions between repaints and coalesces
+them into a short list of rectangles covering every dirty region. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from math import floor, ceil
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QRegion
+from worktoy.attr import Field
+from worktoy.mcls import BaseObject
+from worktoy.static import overload
+from worktoy.text import typeMsg
+
+from . import Region, cacheDispatch
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Optional
+
+  Edges = tuple[float, float, float, float]
+
+
+def _area(edges: Edges) -> float:
+  """Returns the area of the edges."""
+  left, top, right, bottom = edges
+  return (right - left) * (bottom - top)
+
+
+def _bounds(edges: Edges, other: Edges) -> Edges:
+  """Returns the edges bounding both edges."""
+  return (min(edges[0], other[0]), min(edges[1], other[1]),
+          max(edges[2], other[2]), max(edges[3], other[3]))
+
+
+def _overlap(edges: Edges, other: Edges) -> float:
+  """Returns the area shared by both edges."""
+  width = min(edges[2], other[2]) - max(edges[0], other[0])
+  height = min(edges[3], other[3]) - max(edges[1], other[1])
+  if width <= 0 or height <= 0:
+    return 0.
+  return width * height
+
+
+def _contains(edges: Edges, other: Edges) -> bool:
+  """Returns True if the first edges contain the other edges."""
+  if edges[0] <= other[0] and edges[1] <= other[1]:
+    return True if other[2] <= edges[2] and other[3] <= edges[3] else False
+  return False
+
+
+def _waste(edges: Edges, other: Edges) -> float:
+  """Returns the area covered by the bounds of the edges, but by neither
+  of the edges themselves."""
+  covered = _area(edges) + _area(other) - _overlap(edges, other)
+  return _area(_bounds(edges, other)) - covered
+
+
+@cacheDispatch
+class DamageAccumulator(BaseObject):
+  """DamageAccumulator collects dirty regions between repaints and
+  coalesces them into a short list of rectangles covering every dirty
+  region.
+
+  Repainting a rectangle costs its area plus a fixed overhead per
+  rectangle given by 'rectCost' in units of area. Two rectangles are
+  merged into their bounds whenever the area the bounds cover beyond the
+  two rectangles, the waste, is no greater than 'rectCost'. Hence,
+  overlapping and adjacent rectangles merge readily, while distant
+  rectangles remain separate. Should the number of rectangles exceed
+  'maxRects', the pair of least waste is merged regardless of cost.
+
+  The 'rects' method returns the coalesced rectangles as Region objects
+  and 'toQRegion' returns them as a QRegion suitable for
+  'QWidget.update'. The 'flush' method returns the rectangles and clears
+  the accumulator, as at the start of a paint event. The 'savedArea'
+  field reports how much less area the rectangles cover than the single
+  bounding region of every dirty region would have. """
+
+  #  fallback variables
+  __fallback_rect_cost__ = 1024.
+  __fallback_max_rects__ = 16
+
+  #  private variables
+  __rect_cost__ = None
+  __max_rects__ = None
+  __damage_rects__ = None
+  __damage_bounds__ = None
+  __dirty_area__ = 0.
+
+  #  public variables
+  rectCost = Field()
+  maxRects = Field()
+
+  #  virtual variables
+  count = Field()
+  area = Field()
+  dirtyArea = Field()
+  bounds = Field()
+  boundingArea = Field()
+  savedArea = Field()
+
+  #  getters and setters
+  @rectCost.GET
+  def _getRectCost(self) -> float:
+    """Get the overhead in units of area of repainting a rectangle."""
+    if self.__rect_cost__ is None:
+      return self.__fallback_rect_cost__
+    return self.__rect_cost__
+
+  @rectCost.SET
+  def _setRectCost(self, value: float) -> None:
+    """Set the overhead in units of area of repainting a rectangle."""
+    if not isinstance(value, (int, float)):
+      raise TypeError(typeMsg('rectCost', value, float))
+    if value < 0:
+      raise ValueError("""'rectCost' must not be negative!""")
+    self.__rect_cost__ = float(value)
+
+  @maxRects.GET
+  def _getMaxRects(self) -> int:
+    """Get the maximum number of rectangles."""
+    if self.__max_rects__ is None:
+      return self.__fallback_max_rects__
+    return self.__max_rects__
+
+  @maxRects.SET
+  def _setMaxRects(self, value: int) -> None:
+    """Set the maximum number of rectangles."""
+    if not isinstance(value, int):
+      raise TypeError(typeMsg('maxRects', value, int))
+    if value < 1:
+      raise ValueError("""'maxRects' must be at least 1!""")
+    self.__max_rects__ = value
+
+  def _getRects(self, ) -> list[Edges]:
+    """Get the list of edges of the coalesced rectangles."""
+    if self.__damage_rects__ is None:
+      self.__damage_rects__ = []
+    return self.__damage_rects__
+
+  @count.GET
+  def _getCount(self) -> int:
+    """Get the number of coalesced rectangles."""
+    return len(self._getRects())
+
+  @area.GET
+  def _getArea(self) -> float:
+    """Get the total area of the coalesced rectangles."""
+    return sum([_area(edges) for edges in self._getRects()])
+
+  @dirtyArea.GET
+  def _getDirtyArea(self) -> float:
+    """Get the total area of the dirty regions as added, counting
+    overlapping area once per region."""
+    return self.__dirty_area__
+
+  @bounds.GET
+  def _getBounds(self) -> Region:
+    """Get the region bounding every dirty region."""
+    if self.__damage_bounds__ is None:
+      return Region._fromEdges(0., 0., 0., 0.)
+    return Region._fromEdges(*self.__damage_bounds__)
+
+  @boundingArea.GET
+  def _getBoundingArea(self) -> float:
+    """Get the area of the region bounding every dirty region."""
+    if self.__damage_bounds__ is None:
+      return 0.
+    return _area(self.__damage_bounds__)
+
+  @savedArea.GET
+  def _getSavedArea(self) -> float:
+    """Get the area saved by the coalesced rectangles compared to the
+    region bounding every dirty region."""
+    return self.boundingArea - self.area
+
+  #  constructors
+  @overload(int, int)
+  @overload(float, int)
+  def __init__(self, rectCost: float, maxRects: int) -> None:
+    """Initialize with the given cost per rectangle and the maximum
+    number of rectangles."""
+    self.rectCost = rectCost
+    self.maxRects = maxRects
+
+  @overload(int)
+  @overload(float)
+  def __init__(self, rectCost: float) -> None:
+    """Initialize with the given cost per rectangle."""
+    self.rectCost = rectCost
+
+  @overload()
+  def __init__(self, ) -> None:
+    """Initialize with the fallback cost and maximum."""
+
+  #  functionality
+  def _resolveEdges(self, region: Any) -> Edges:
+    """Resolves the argument to the edges of a region."""
+    if isinstance(region, Region):
+      return region._getEdges()
+    if isinstance(region, QRect):
+      left, top = float(region.x()), float(region.y())
+      return left, top, left + region.width(), top + region.height()
+    try:
+      return Region(region)._getEdges()
+    except Exception as exception:
+      raise TypeError(typeMsg('region', region, Region)) from exception
+
+  def _cheapestMerge(self, edges: Edges) -> Optional[int]:
+    """Returns the index of the rectangle merging with the given edges at
+    the least waste not exceeding 'rectCost' or None."""
+    rectCost, bestIndex, bestWaste = self.rectCost, None, None
+    for i, other in enumerate(self._getRects()):
+      waste = _waste(edges, other)
+      if waste > rectCost:
+        continue
+      if bestWaste is None or waste < bestWaste:
+        bestIndex, bestWaste = i, waste
+    return bestIndex
+
+  def _mergeCheapestPair(self, ) -> None:
+    """Merges the pair of rectangles of least waste."""
+    rects = self._getRects()
+    bestPair, bestWaste = None, None
+    for i, edges in enumerate(rects):
+      for j in range(i + 1, len(rects)):
+        waste = _waste(edges, rects[j])
+        if bestWaste is None or waste < bestWaste:
+          bestPair, bestWaste = (i, j), waste
+    i, j = bestPair
+    other = rects.pop(j)
+    rects[i] = _bounds(rects[i], other)
+
+  def add(self, region: Any) -> None:
+    """Adds a dirty region. Accepts Region, QRect or any argument
+    accepted by the Region constructor. Empty regions are ignored."""
+    edges = self._resolveEdges(region)
+    if _area(edges) <= 0:
+      return
+    self.__dirty_area__ += _area(edges)
+    if self.__damage_bounds__ is None:
+      self.__damage_bounds__ = edges
+    else:
+      self.__damage_bounds__ = _bounds(self.__damage_bounds__, edges)
+    rects = self._getRects()
+    for other in rects:
+      if _contains(other, edges):
+        return
+    while True:
+      index = self._cheapestMerge(edges)
+      if index is None:
+        break
+      edges = _bounds(edges, rects.pop(index))
+    rects.append(edges)
+    while len(rects) > self.maxRects:
+      self._mergeCheapestPair()
+
+  def addMany(self, regions: Any) -> None:
+    """Adds every region in the iterable."""
+    for region in regions:
+      self.add(region)
+
+  def clear(self, ) -> None:
+    """Removes every dirty region."""
+    self.__damage_rects__ = None
+    self.__damage_bounds__ = None
+    self.__dirty_area__ = 0.
+
+  def rects(self, ) -> list[Region]:
+    """Returns the coalesced rectangles as new Region objects."""
+    return [Region._fromEdges(*edges) for edges in self._getRects()]
+
+  def toQRects(self, ) -> list[QRect]:
+    """Returns the coalesced rectangles as QRect objects. The edges are
+    rounded outwards to whole pixels."""
+    out = []
+    for left, top, right, bottom in self._getRects():
+      x, y = floor(left), floor(top)
+      out.append(QRect(x, y, ceil(right) - x, ceil(bottom) - y))
+    return out
+
+  def toQRegion(self, ) -> QRegion:
+    """Returns the coalesced rectangles as a QRegion."""
+    out = QRegion()
+    for rect in self.toQRects():
+      out = out.united(rect)
+    return out
+
+  def flush(self, ) -> list[Region]:
+    """Returns the coalesced rectangles and clears the accumulator."""
+    out = self.rects()
+    self.clear()
+    return out
+
+  def __len__(self, ) -> int:
+    """Returns the number of coalesced rectangles."""
+    return len(self._getRects())
+
+  def __bool__(self, ) -> bool:
+    """Returns True if any dirty region has been added."""
+    return True if self._getRects() else False
+
+  def __iter__(self, ) -> Any:
+    """Yields the coalesced rectangles as new Region objects."""
+    for edges in self._getRects():
+      yield Region._fromEdges(*edges)
+
+  def __iadd__(self, other: Any) -> DamageAccumulator:
+    """Adds a dirty region in place."""
+    self.add(other)
+    return self
+
+  def __str__(self, ) -> str:
+    """Returns the string representation of the accumulator."""
+    infoSpec = """%s[%d rects, area %.1f of %.1f bounding]"""
+    name = type(self).__name__
+    return infoSpec % (name, len(self), self.area, self.boundingArea)
+
+  def __repr__(self, ) -> str:
+    """Returns the code representation of the accumulator."""
+    infoSpec = """%s(%r, %r)"""
+    name = type(self).__name__
+    return infoSpec % (name, self.rectCost, self.maxRects)
@@ -0,0 +1,172 @@
+"""DispatchCache memoizes the overload resolution of a dispatched function
+on the types of the positional arguments. The 'cacheDispatch' class
+decorator installs a DispatchCache in place of every overloaded method
+defined in the namespace of the decorated class. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worktoy.static import Dispatch
+from worktoy.waitaminute import HashMismatch, DispatchException
+from worktoy.waitaminute import ResolveException
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Callable, Optional, TypeAlias
+
+  Types: TypeAlias = tuple[type, ...]
+  Cache: TypeAlias = dict[Types, Optional[Callable]]
+
+
+class DispatchCache(Dispatch):
+  """DispatchCache memoizes the overload resolution of a dispatched
+  function on the types of the positional arguments.
+
+  The first call with a given tuple of argument types searches the type
+  signatures exactly as Dispatch does and stores the matching function.
+  Later calls with the same types skip the search. Only exact type
+  matches are cached, as casting in the flexible path depends on the
+  argument values. Types with no exact match are cached as such, so that
+  later calls go directly to the flexible path. As in Dispatch, a
+  DispatchException raised by the exact match falls through to the
+  flexible path.
+
+  The cache holds at most 'maxSize' entries and evicts the oldest entry
+  when full. The 'hits' and 'misses' counters and 'cacheInfo' report how
+  well the cache performs. """
+
+  #  fallback variables
+  __fallback_max_size__ = 128
+
+  #  private variables
+  __type_cache__ = None
+  __max_size__ = None
+  __cache_hits__ = 0
+  __cache_misses__ = 0
+
+  def __init__(self, dispatch: Dispatch, maxSize: int = None) -> None:
+    """Creates a cache over the signatures of the given Dispatch."""
+    Dispatch.__init__(self, dispatch.__call_map__)
+    self.__type_cache__ = dict()
+    if maxSize is None:
+      maxSize = self.__fallback_max_size__
+    self.__max_size__ = maxSize
+
+  @property
+  def hits(self) -> int:
+    """The number of calls resolved by the cache."""
+    return self.__cache_hits__
+
+  @property
+  def misses(self) -> int:
+    """The number of calls requiring the signature search."""
+    return self.__cache_misses__
+
+  @property
+  def size(self) -> int:
+    """The number of cached argument type tuples."""
+    return len(self.__type_cache__)
+
+  @property
+  def maxSize(self) -> int:
+    """The maximum number of cached argument type tuples."""
+    return self.__max_size__
+
+  def cacheInfo(self) -> dict[str, int]:
+    """Returns the counters and the size of the cache."""
+    return dict(hits=self.hits, misses=self.misses, size=self.size,
+                maxSize=self.maxSize)
+
+  def cacheClear(self) -> None:
+    """Empties the cache and resets the counters."""
+    self.__type_cache__.clear()
+    self.__cache_hits__ = 0
+    self.__cache_misses__ = 0
+
+  def _searchFast(self, *args: Any) -> Optional[Callable]:
+    """Returns the function whose signature matches the exact types of
+    the arguments or None if no such signature exists."""
+    for sig, call in self.__call_map__.items():
+      try:
+        sig.fast(*args)
+      except HashMismatch:
+        continue
+      except TypeError as typeError:
+        if 'required positional argument' in str(typeError):
+          continue
+        raise typeError
+      return call
+    return None
+
+  def _slowCall(self, *args: Any, **kwargs: Any) -> Any:
+    """Tries the flexible path and then resolves tuple and list
+    arguments, as Dispatch does after the exact path fails."""
+    try:
+      return self._flexCall(*args, **kwargs)
+    except DispatchException:
+      pass
+    try:
+      posArgs = self._resolveArgs(*args)
+    except ResolveException as resolveException:
+      raise DispatchException(self, *args) from resolveException
+    while True:
+      try:
+        posArgs = self._resolveArgs(*posArgs)
+      except ResolveException:
+        break
+    return self(*posArgs, **kwargs)
+
+  def __call__(self, *args: Any, **kwargs: Any) -> Any:
+    """Calls the function matching the argument types."""
+    instance = self._getBoundInstance()
+    key = (*map(type, args),)
+    cache = self.__type_cache__
+    if key in cache:
+      self.__cache_hits__ += 1
+      call = cache[key]
+    else:
+      self.__cache_misses__ += 1
+      call = self._searchFast(*args)
+      if len(cache) >= self.__max_size__:
+        del cache[next(iter(cache))]
+      cache[key] = call
+    if call is None:
+      return self._slowCall(*args, **kwargs)
+    try:
+      if instance is None:
+        return call(*args, **kwargs)
+      return call(instance, *args, **kwargs)
+    except DispatchException:
+      return self._slowCall(*args, **kwargs)
+
+
+def cacheDispatch(cls: type) -> type:
+  """Class decorator replacing every Dispatch defined in the namespace of
+  the class with a DispatchCache. Subclasses receive their own Dispatch
+  objects and must be decorated as well."""
+  for name in getattr(cls, '__dispatch_names__', ()):
+    dispatch = cls.__dict__.get(name, None)
+    if type(dispatch) is not Dispatch:
+      continue
+    cached = DispatchCache(dispatch)
+    cached.__set_name__(cls, name)
+    setattr(cls, name, cached)
+  return cls
+
+
+def dispatchCacheInfo(cls: type) -> dict[str, dict[str, int]]:
+  """Returns the cache info of every DispatchCache on the class by name,
+  including those inherited from base classes."""
+  out = dict()
+  for name in dir(cls):
+    dispatch = getattr(cls, name, None)
+    if isinstance(dispatch, DispatchCache):
+      out[name] = dispatch.cacheInfo()
+  return out
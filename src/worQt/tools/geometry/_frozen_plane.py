@@ -0,0 +1,231 @@
+"""FrozenPlane provides an immutable, hashable counterpart to Plane. The
+frozen classes subclass 'tuple' with empty '__slots__', such that each
+instance has the footprint of a tuple of two floats. These include:
+- FrozenPoint -> Immutable counterpart to Point
+- FrozenVector -> Immutable counterpart to Vector
+- FrozenSize -> Immutable counterpart to Size
+"""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from operator import itemgetter
+
+from worktoy.text import monoSpace, typeMsg
+
+from . import Plane
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Self, Optional
+
+  Floats = Optional[tuple[float, float]]
+
+
+class FrozenPlane(tuple):
+  """FrozenPlane provides an immutable, hashable counterpart to Plane.
+
+  Instances are tuples of two floats and accept the same constructor
+  arguments as Plane: two numbers, a complex number, a Plane or frozen
+  plane, a pair of numbers or nothing. Equality and hashing are those of
+  the tuple, so frozen objects may be used as dict keys and set members.
+  Equality against mutable Plane objects compares the coordinates.
+
+  Indexing, slicing and unpacking are those of the tuple. Unlike Plane,
+  indexing by the keys 'x' and 'y' is not supported, as overriding
+  '__getitem__' would slow down every coordinate access. Arithmetic
+  mirrors Plane and returns new frozen objects, except that batches of
+  points broadcast to the batch type of Plane. Use 'thaw' to obtain the
+  mutable counterpart and 'Plane.freeze' to go the other way.
+  """
+
+  __slots__ = ()
+
+  __mutable_type__ = Plane
+  __frozen_types__ = dict()
+
+  r0 = property(itemgetter(0), doc="""The first coordinate.""")
+  r1 = property(itemgetter(1), doc="""The second coordinate.""")
+
+  def __init_subclass__(cls, **kwargs) -> None:
+    """Registers the subclass as the frozen type of its mutable type."""
+    super().__init_subclass__(**kwargs)
+    FrozenPlane.__frozen_types__[cls.__mutable_type__] = cls
+
+  @staticmethod
+  def _getFrozenType(mutableType: type) -> type:
+    """Returns the frozen type of the nearest registered base of the given
+    mutable type."""
+    for base in mutableType.__mro__:
+      if base in FrozenPlane.__frozen_types__:
+        return FrozenPlane.__frozen_types__[base]
+    return FrozenPlane
+
+  @classmethod
+  def _fromFloats(cls, r0: float, r1: float) -> Self:
+    """Fast constructor bypassing the argument parsing of '__new__'. The
+    values are not validated nor converted, so callers must pass floats."""
+    return tuple.__new__(cls, (r0, r1))
+
+  @staticmethod
+  def _parseArgs(*args) -> Floats:
+    """Parses the constructor arguments to two floats or returns None."""
+    if not args:
+      return 0., 0.
+    if len(args) == 2:
+      r0, r1 = args
+      if isinstance(r0, (int, float)) and isinstance(r1, (int, float)):
+        return float(r0), float(r1)
+      return None
+    if len(args) > 1:
+      return None
+    arg = args[0]
+    if isinstance(arg, complex):
+      return arg.real, arg.imag
+    if isinstance(arg, Plane):
+      return float(arg.r0), float(arg.r1)
+    if isinstance(arg, (tuple, list)) and len(arg) == 2:
+      return FrozenPlane._parseArgs(*arg)
+    return None
+
+  def __new__(cls, *args) -> Self:
+    """Creates a new frozen plane object."""
+    values = cls._parseArgs(*args)
+    if values is None:
+      raise TypeError(typeMsg('args', args, cls))
+    return tuple.__new__(cls, values)
+
+  def thaw(self, ) -> Plane:
+    """Returns a mutable copy of the frozen object."""
+    return self.__mutable_type__._fromFloats(self[0], self[1])
+
+  def __eq__(self, other: Any) -> bool:
+    """Compares by value to tuples, frozen planes and Plane objects."""
+    if isinstance(other, tuple):
+      return tuple.__eq__(self, other)
+    if isinstance(other, Plane):
+      return True if self[0] == other.r0 and self[1] == other.r1 else False
+    return NotImplemented
+
+  def __ne__(self, other: Any) -> bool:
+    """Negation of '__eq__'."""
+    isEqual = self.__eq__(other)
+    return isEqual if isEqual is NotImplemented else not isEqual
+
+  __hash__ = tuple.__hash__
+
+  def __abs__(self, ) -> float:
+    """Return the length of the vector."""
+    return (self[0] ** 2 + self[1] ** 2) ** 0.5
+
+  def __bool__(self, ) -> bool:
+    """Return True if the vector is not zero."""
+    return True if self[0] ** 2 + self[1] ** 2 else False
+
+  def __complex__(self, ) -> complex:
+    """Return the complex representation of the vector."""
+    return self[0] + self[1] * 1j
+
+  def __str__(self, ) -> str:
+    """Return the string representation of the vector."""
+    infoSpec = """%s[%s: float, %s: float]"""
+    r0, r1 = self
+    rStr0 = '%d' % int(r0) if r0.is_integer() else '%.3f' % r0
+    rStr1 = '%d' % int(r1) if r1.is_integer() else '%.3f' % r1
+    name = type(self).__name__
+    return monoSpace(infoSpec % (name, rStr0, rStr1))
+
+  def __repr__(self, ) -> str:
+    """Return the code representation of the vector."""
+    infoSpec = """%s(%r, %r)"""
+    return infoSpec % (type(self).__name__, self[0], self[1])
+
+  def _isBatch(self, other: Any) -> bool:
+    """Returns True if other resolves to a batch of points, in which case
+    the arithmetic broadcasts through the mutable type."""
+    if self.__mutable_type__._resolveBatch(other) is None:
+      return False
+    return True
+
+  def _resolveOther(self, other: Any) -> Floats:
+    """Resolve the other object to a pair of floats or NotImplemented."""
+    if isinstance(other, (int, float)):
+      return float(other), float(other)
+    values = self._parseArgs(other)
+    return NotImplemented if values is None else values
+
+  def __neg__(self, ) -> Self:
+    """Return the negation of the vector."""
+    return self._fromFloats(-self[0], -self[1])
+
+  def __add__(self, other: Any) -> Self:
+    """Return the sum of the vector and another vector."""
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      return self.thaw() + other if self._isBatch(other) else resolved
+    return self._fromFloats(self[0] + resolved[0], self[1] + resolved[1])
+
+  def __radd__(self, other: Any) -> Self:
+    """Return the sum of the vector and another vector."""
+    return self + other
+
+  def __sub__(self, other: Any) -> Self:
+    """Return the difference of the vector and another vector."""
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      return self.thaw() - other if self._isBatch(other) else resolved
+    return self._fromFloats(self[0] - resolved[0], self[1] - resolved[1])
+
+  def __rsub__(self, other: Any) -> Self:
+    """Return the difference of the vector and another vector."""
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      if self._isBatch(other):
+        return self.thaw().__rsub__(other)
+      return NotImplemented
+    return self._fromFloats(resolved[0] - self[0], resolved[1] - self[1])
+
+  def __mul__(self, other: Any) -> Self:
+    """Return the product of the vector and a scalar."""
+    if isinstance(other, (int, float)):
+      return self._fromFloats(self[0] * other, self[1] * other)
+    return NotImplemented
+
+  def __rmul__(self, other: Any) -> Self:
+    """Return the product of the vector and a scalar."""
+    if isinstance(other, (int, float)):
+      return self._fromFloats(self[0] * other, self[1] * other)
+    return NotImplemented
+
+  def __truediv__(self, other: Any) -> Self:
+    """Return the division of the vector by a scalar."""
+    if isinstance(other, (int, float)):
+      if not other:
+        raise ZeroDivisionError
+      return self._fromFloats(self[0] / other, self[1] / other)
+    return NotImplemented
+
+  def __rtruediv__(self, other: Any) -> Self:
+    """Return the division of a scalar by the vector."""
+    if isinstance(other, (int, float)):
+      return self._fromFloats(other / self[0], other / self[1])
+    return NotImplemented
+
+  def __mod__(self, other: Any) -> Self:
+    """Return the modulus of the vector and a scalar."""
+    if isinstance(other, (int, float)):
+      return self._fromFloats(self[0] % other, self[1] % other)
+    return NotImplemented
+
+  def __rmod__(self, other: Any) -> Self:
+    """Return the modulus of a scalar and the vector."""
+    if isinstance(other, (int, float)):
+      return self._fromFloats(other % self[0], other % self[1])
+    return NotImplemented
@@ -0,0 +1,25 @@
+"""FrozenPoint provides an immutable, hashable counterpart to Point. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from . import FrozenPlane, Point
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class FrozenPoint(FrozenPlane):
+  """FrozenPoint provides an immutable, hashable counterpart to Point."""
+
+  __slots__ = ()
+
+  __mutable_type__ = Point
+
+  x = FrozenPlane.r0
+  y = FrozenPlane.r1
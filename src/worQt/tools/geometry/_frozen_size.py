@@ -0,0 +1,47 @@
+"""FrozenSize provides an immutable, hashable counterpart to Size. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from . import FrozenPlane, Size
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Self
+
+
+class FrozenSize(FrozenPlane):
+  """FrozenSize provides an immutable, hashable counterpart to Size."""
+
+  __slots__ = ()
+
+  __mutable_type__ = Size
+
+  @property
+  def width(self) -> float:
+    """Get the width of the size."""
+    return abs(self[0])
+
+  @property
+  def height(self) -> float:
+    """Get the height of the size."""
+    return abs(self[1])
+
+  @property
+  def aspectRatio(self) -> float:
+    """Get the aspect ratio of the size."""
+    if not self[1]:
+      raise ZeroDivisionError
+    return abs(self[0] / self[1])
+
+  def fit(self, other: Any) -> Self:
+    """Creates a new size preserving the aspect ratio of 'self', whilst
+    being strictly smaller than 'other'."""
+    return self._fromFloats(*self.thaw().fit(other))
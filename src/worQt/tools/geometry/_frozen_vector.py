@@ -0,0 +1,97 @@
+"""FrozenVector provides an immutable, hashable counterpart to Vector. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from . import FrozenPoint, Vector
+from . import _buffer_ops as ops
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Self
+
+
+class FrozenVector(FrozenPoint):
+  """FrozenVector provides an immutable, hashable counterpart to Vector.
+  As for Vector, '*' applies the dot product unless the other operand is
+  a scalar, '@' applies the cross product and '~' returns the
+  hat-vector."""
+
+  __slots__ = ()
+
+  __mutable_type__ = Vector
+
+  def __mul__(self, other: Any) -> Any:
+    """The * multiplication with float or int applies component wise,
+    otherwise it applies the dot product."""
+    if isinstance(other, (int, float)):
+      return self._fromFloats(self[0] * other, self[1] * other)
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      return self.thaw()._batchProduct(other, False)
+    return self[0] * resolved[0] + self[1] * resolved[1]
+
+  def __rmul__(self, other: Any) -> Any:
+    """The * multiplication is commutative."""
+    return self * other
+
+  def __matmul__(self, other: Any) -> Any:
+    """The @ operator applies the cross product."""
+    if isinstance(other, (int, float)):
+      return self._fromFloats(self[0] * other, self[1] * other)
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      return self.thaw()._batchProduct(other, True)
+    return self[0] * resolved[1] - self[1] * resolved[0]
+
+  def __rmatmul__(self, other: Any) -> Any:
+    """The @ operator applies the cross product with reversed sign."""
+    out = self @ other
+    if out is NotImplemented:
+      return NotImplemented
+    return ops.negate(out) if isinstance(out, array) else -out
+
+  def __invert__(self) -> Self:
+    """Returns the hat-vector. """
+    return self._fromFloats(-self[1], self[0])
+
+  def __rshift__(self, other: Any) -> Self:
+    """The >> projects self onto other vector."""
+    if isinstance(other, (int, float)):
+      return NotImplemented
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
+    other = self._fromFloats(*other)
+    if not other:
+      raise ZeroDivisionError
+    return self * other / (other * other) * other
+
+  def __lshift__(self, other: Any) -> Self:
+    """The << projects other vector onto self."""
+    if isinstance(other, (int, float)):
+      return NotImplemented
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
+    if not self:
+      raise ZeroDivisionError
+    other = self._fromFloats(*other)
+    return other * self / (self * self) * self
+
+  def __rrshift__(self, other: Any) -> Self:
+    """The >> operator projects self onto other vector."""
+    return self << other
+
+  def __rlshift__(self, other: Any) -> Self:
+    """The << operator projects other vector onto self."""
+    return self >> other
@@ -7,7 +7,9 @@ from worktoy.parse import maybe
 from worktoy.static import overload
 from worktoy.attr import Field
 
-from . import AbstractMap, Point, Region
+from . import AbstractMap, Point, Region, PointArray, VectorArray
+from . import cacheDispatch
+from . import _buffer_ops as ops
 
 try:
   from typing import TYPE_CHECKING
@@ -18,9 +20,10 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-  pass
+  from array import array
 
 
+@cacheDispatch
 class MoveMap(AbstractMap):
   """MoveMap maps by translating the values."""
 
@@ -47,6 +50,10 @@ class MoveMap(AbstractMap):
     """Get the vertical scale."""
     return maybe(self.__vertical_move__, self.__fallback_vertical__)
 
+  def _getCoefficients(self) -> tuple[float, ...]:
+    """Get the affine coefficients (a, b, c, d, e, f)."""
+    return 1., 0., self.horizontalMove, 0., 1., self.verticalMove
+
   #  Caller overloads
   @overload(int, int)
   @overload(float, int)
@@ -80,6 +87,16 @@ class MoveMap(AbstractMap):
     """Apply the mapping to a region."""
     return Region(self(region.topLeft), region.size)
 
+  @overload(PointArray)
+  @overload(VectorArray)
+  def __call__(self, points: PointArray) -> PointArray:
+    """Apply the mapping to every point in the array."""
+    return self.mapMany(points)
+
+  def _mapArray(self, data: array) -> array:
+    """Translates every point in the buffer."""
+    return ops.offset(data, self.horizontalMove, self.verticalMove)
+
   #  Constructor overloads
   @overload(int, int)
   @overload(float, int)
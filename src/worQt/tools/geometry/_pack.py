@@ -0,0 +1,68 @@
+"""The 'packShelves' function places many sizes into a container region
+in rows, as in a grid of thumbnails. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worktoy.text import typeMsg
+
+from . import Size, Region
+from ._size import _fitFloats
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Optional
+
+
+def packShelves(sizes: Any, container: Region, rowHeight: float = None,
+                spacing: float = 0.) -> list[Optional[Region]]:
+  """Places the sizes left to right in shelves from the top of the
+  container, starting a new shelf below the tallest item of the current
+  one when the next item does not fit in the remaining width. The items
+  keep their order, such that reading the shelves left to right and top
+  to bottom visits them in the order given.
+
+  When 'rowHeight' is given, every item is scaled to that height with its
+  aspect ratio preserved, and narrowed further only if wider than the
+  container. Otherwise, items are placed at their own size. 'spacing'
+  separates neighbouring items and shelves, but not the items from the
+  container.
+
+  Returns a Region for every size in the order given, or None for items
+  wider than the container or too tall for the height remaining below
+  the current shelf."""
+  if not isinstance(container, Region):
+    raise TypeError(typeMsg('container', container, Region))
+  if rowHeight is not None and rowHeight <= 0:
+    raise ValueError("""'rowHeight' must be positive!""")
+  if spacing < 0:
+    raise ValueError("""'spacing' must not be negative!""")
+  left, top, right, bottom = container._getEdges()
+  width = right - left
+  x, y, shelfHeight = left, top, 0.
+  out = []
+  for size in sizes:
+    w, h = (size.r0, size.r1) if isinstance(size, Size) else size
+    if rowHeight is not None:
+      w, h = _fitFloats(w, h, width, rowHeight)
+    else:
+      w, h = abs(w), abs(h)
+    if w > width:
+      out.append(None)
+      continue
+    if x > left and x + w > right:
+      x, y = left, y + shelfHeight + spacing
+      shelfHeight = 0.
+    if y + h > bottom:
+      out.append(None)
+      continue
+    out.append(Region._fromEdges(x, y, x + w, y + h))
+    x, shelfHeight = x + w + spacing, max(shelfHeight, h)
+  return out
@@ -7,13 +7,15 @@
 #  Copyright (c) 2025 Asger Jon Vistisen
 from __future__ import annotations
 
+from PySide6.QtCore import QPoint, QPointF
 from worktoy.attr import AttriBox
 from worktoy.mcls import BaseObject
 from worktoy.static import overload, THIS
 from worktoy.text import monoSpace, typeMsg
 from worktoy.waitaminute import DispatchException
 
-from . import AbstractGeometry
+from . import AbstractGeometry, cacheDispatch
+from . import _buffer_ops as ops
 
 try:
   from typing import TYPE_CHECKING
@@ -24,17 +26,23 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-  from typing import Self, Any
+  from typing import Self, Any, Iterator, Optional
 
+  from . import FrozenPlane, PointArray
 
+
+@cacheDispatch
 class Plane(BaseObject):
   """Plane provides a baseclass for two component classes. These include:
   - Point -> Denoting a position in the plane
   - Size -> Denoting a size in the plane
   - Vector -> Denoting a vector in the plane
-  """
 
-  __iter_contents__ = None
+  Addition and subtraction broadcast across batches of points given as a
+  PointArray, a sequence of points or an object supporting the buffer
+  protocol, returning a batch computed in one pass. PointArray operands
+  keep their type, other batches resolve to the batch type of the class.
+  """
 
   __r0_keys__ = ['x', 'r0']
   __r1_keys__ = ['y', 'r1']
@@ -42,6 +50,17 @@ class Plane(BaseObject):
   r0 = AttriBox[float](0.0)
   r1 = AttriBox[float](0.0)
 
+  @classmethod
+  def _fromFloats(cls, r0: float, r1: float) -> Self:
+    """Fast constructor bypassing the overload dispatch of '__init__'.
+    The values are written directly to the private names used by the
+    'r0' and 'r1' boxes and are neither validated nor converted, so
+    callers must pass floats. The operators use this constructor
+    internally, as their results are always floats."""
+    self = object.__new__(cls)
+    self.__r0__, self.__r1__ = r0, r1
+    return self
+
   @classmethod
   def _getR0Keys(cls) -> list[str]:
     """Return the r0 keys."""
@@ -131,17 +150,29 @@ class Plane(BaseObject):
     name = type(self).__name__
     return monoSpace(infoSpec % (name, rStr0, rStr1))
 
-  def __iter__(self, ) -> Self:
-    """Return an iterator for the vector."""
-    self.__iter_contents__ = [self.r0, self.r1]
-    return self
+  def __iter__(self, ) -> Iterator[float]:
+    """Yields the coordinates of the vector. Each call returns a new
+    generator, so nested and concurrent iteration is safe."""
+    yield self.r0
+    yield self.r1
 
-  def __next__(self) -> Any:
-    """Return the next item in the iterator."""
-    if self.__iter_contents__:
-      return self.__iter_contents__.pop(0)
-    self.__iter_contents__ = None
-    raise StopIteration
+  def toQ(self, ) -> QPointF:
+    """Returns the coordinates as a QPointF."""
+    return QPointF(self.r0, self.r1)
+
+  @classmethod
+  def fromQ(cls, qPoint: Any) -> Self:
+    """Creates a new object from a QPointF or QPoint."""
+    if not isinstance(qPoint, (QPointF, QPoint)):
+      raise TypeError(typeMsg('qPoint', qPoint, QPointF))
+    return cls._fromFloats(float(qPoint.x()), float(qPoint.y()))
+
+  def freeze(self, ) -> FrozenPlane:
+    """Returns an immutable, hashable copy. Point, Vector and Size freeze
+    to FrozenPoint, FrozenVector and FrozenSize respectively."""
+    from . import FrozenPlane
+    frozenType = FrozenPlane._getFrozenType(type(self))
+    return frozenType._fromFloats(self.r0, self.r1)
 
   def _parseIndex(self, index: int) -> str:
     """Return the indexed item in the vector."""
@@ -176,14 +207,23 @@ class Plane(BaseObject):
     if isinstance(other, cls):
       return other
     if isinstance(other, (tuple, list)):
+      if len(other) != 2:
+        return NotImplemented
+      x, y = other
+      if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+        return cls._fromFloats(float(x), float(y))
+      if isinstance(x, (tuple, list, complex, Plane)):
+        return NotImplemented
       try:
-        return cls(other[0], other[1])
-      except IndexError:
+        return cls(x, y)
+      except DispatchException:
         return NotImplemented
     if isinstance(other, (float, int)):
-      return cls(other, other)
+      return cls._fromFloats(float(other), float(other))
     if isinstance(other, complex):
-      return cls(other.real, other.imag)
+      return cls._fromFloats(other.real, other.imag)
+    if self._resolveBatch(other) is not None:
+      return NotImplemented
     try:
       out = cls(other)
     except DispatchException:
@@ -193,18 +233,52 @@ class Plane(BaseObject):
     finally:
       pass
 
+  @classmethod
+  def _getBatchType(cls) -> type:
+    """Returns the batch type holding many objects of this class."""
+    from . import PointArray
+    return PointArray
+
+  @classmethod
+  def _resolveBatch(cls, other: Any) -> Optional[PointArray]:
+    """Resolves other to a batch of points or returns None. PointArray
+    objects are returned as they are. Sequences of points and objects
+    supporting the buffer protocol, such as NumPy arrays of shape (N, 2),
+    resolve to the batch type. Pairs of numbers are single points."""
+    from . import PointArray
+    if isinstance(other, PointArray):
+      return other
+    if isinstance(other, (str, bytes, bytearray, Plane)):
+      return None
+    if isinstance(other, (tuple, list)):
+      if len(other) == 2:
+        if all([isinstance(arg, (int, float)) for arg in other]):
+          return None
+      try:
+        return cls._getBatchType()._fromArray(ops.flatten(other))
+      except (TypeError, ValueError):
+        return None
+    try:
+      data = ops.fromBuffer(other)
+    except (TypeError, ValueError):
+      return None
+    return cls._getBatchType()._fromArray(data)
+
   def __neg__(self, ) -> Self:
     """Return the negation of the vector."""
     cls = type(self)
-    return cls(-self.r0, -self.r1)
+    return cls._fromFloats(-self.r0, -self.r1)
 
   def __add__(self, other: Self) -> Self:
     """Return the sum of the vector and another vector."""
-    other = self._resolveOther(other)
-    if other is NotImplemented:
-      return NotImplemented
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      batch = self._resolveBatch(other)
+      if batch is None:
+        return NotImplemented
+      return batch._fromArray(ops.offset(batch.data, self.r0, self.r1))
     cls = type(self)
-    return cls(self.r0 + other.r0, self.r1 + other.r1)
+    return cls._fromFloats(self.r0 + resolved.r0, self.r1 + resolved.r1)
 
   def __iadd__(self, other: Self) -> Self:
     """Return the sum of the vector and another vector."""
@@ -221,32 +295,40 @@ class Plane(BaseObject):
 
   def __sub__(self, other: Self) -> Self:
     """Return the difference of the vector and another vector."""
-    other = self._resolveOther(other)
-    if other is NotImplemented:
-      return NotImplemented
-    cls = type(self)
-    return self + (-other)
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      batch = self._resolveBatch(other)
+      if batch is None:
+        return NotImplemented
+      data = ops.offset(ops.negate(batch.data), self.r0, self.r1)
+      return batch._fromArray(data)
+    return self + (-resolved)
 
   def __isub__(self, other: Self) -> Self:
     """Return the difference of the vector and another vector."""
     other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
     self.r0 -= other.r0
     self.r1 -= other.r1
     return self
 
   def __rsub__(self, other: Self) -> Self:
     """Return the difference of the vector and another vector."""
-    other = self._resolveOther(other)
-    if other is NotImplemented:
-      return NotImplemented
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      batch = self._resolveBatch(other)
+      if batch is None:
+        return NotImplemented
+      return batch._fromArray(ops.offset(batch.data, -self.r0, -self.r1))
     cls = type(self)
-    return cls(other.r0 - self.r0, other.r1 - self.r1)
+    return cls._fromFloats(resolved.r0 - self.r0, resolved.r1 - self.r1)
 
   def __mul__(self, other: Self) -> Self:
     """Return the product of the vector and another vector."""
     if isinstance(other, (int, float)):
       cls = type(self)
-      return cls(self.r0 * other, self.r1 * other)
+      return cls._fromFloats(self.r0 * other, self.r1 * other)
     return NotImplemented
 
   def __imul__(self, other: Self) -> Self:
@@ -261,7 +343,7 @@ class Plane(BaseObject):
     """Return the product of the vector and another vector."""
     if isinstance(other, (int, float)):
       cls = type(self)
-      return cls(self.r0 * other, self.r1 * other)
+      return cls._fromFloats(self.r0 * other, self.r1 * other)
     return NotImplemented
 
   def __truediv__(self, other: Self) -> Self:
@@ -270,7 +352,7 @@ class Plane(BaseObject):
       if not other:
         raise ZeroDivisionError
       cls = type(self)
-      return cls(self.r0 / other, self.r1 / other)
+      return cls._fromFloats(self.r0 / other, self.r1 / other)
     return NotImplemented
 
   def __itruediv__(self, other: Self) -> Self:
@@ -289,14 +371,14 @@ class Plane(BaseObject):
       if not other:
         raise ZeroDivisionError
       cls = type(self)
-      return cls(other / self.r0, other / self.r1)
+      return cls._fromFloats(other / self.r0, other / self.r1)
     return NotImplemented
 
   def __mod__(self, other: Self) -> Self:
     """Return the modulus of the vector and another vector."""
     if isinstance(other, (int, float)):
       cls = type(self)
-      return cls(self.r0 % other, self.r1 % other)
+      return cls._fromFloats(self.r0 % other, self.r1 % other)
     return NotImplemented
 
   def __imod__(self, other: Self) -> Self:
@@ -311,7 +393,7 @@ class Plane(BaseObject):
     """Return the modulus of the vector and another vector."""
     if isinstance(other, (int, float)):
       cls = type(self)
-      return cls(other % self.r0, other % self.r1)
+      return cls._fromFloats(other % self.r0, other % self.r1)
     return NotImplemented
 
   def __pow__(self, other: Self) -> Self:
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from moreworktoy.attr import Alias
-from . import Plane
+from . import Plane, cacheDispatch
 
 try:
   from typing import TYPE_CHECKING
@@ -15,6 +15,7 @@ except ImportError:
     TYPE_CHECKING = False
 
 
+@cacheDispatch
 class Point(Plane):
   """Point subclasses Plane and provides a point in 2D space."""
 
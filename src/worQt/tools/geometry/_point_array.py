@@ -0,0 +1,359 @@
+"""PointArray provides a batch of points held in a single contiguous buffer
+of 64-bit floats. Arithmetic applies to every point in one pass without
+creating a Point object per coordinate. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from PySide6.QtGui import QPolygonF
+
+from worktoy.attr import Field
+from worktoy.mcls import BaseObject
+from worktoy.static import overload, THIS
+from worktoy.text import monoSpace, typeMsg
+
+from . import Plane, Point, PointView, cacheDispatch
+from . import _buffer_ops as ops
+from . import _qt_ops as qtOps
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Self, Iterator, Union
+
+  Other = Union[array, tuple[float, float]]
+
+
+@cacheDispatch
+class PointArray(BaseObject):
+  """PointArray provides a batch of points held in a single contiguous
+  buffer of 64-bit floats. The coordinates are interleaved, such that the
+  buffer reads: [x0, y0, x1, y1, ...].
+
+  Indexing with an integer returns a PointView writing through to the
+  buffer. Indexing with a slice returns a new PointArray. The arithmetic
+  operators follow the semantics of the Plane class: addition and
+  subtraction apply to arrays of equal length or broadcast a single
+  point, tuple, complex number or scalar across every point.
+  Multiplication and division accept scalars only.
+
+  Any object supporting the buffer protocol, such as NumPy arrays of
+  shape (N, 2), may be converted through the 'fromBuffer' method.
+  Conversely, the 'data' field exposes the underlying 'array.array',
+  which NumPy wraps without copying through 'numpy.frombuffer'. """
+
+  __item_type__ = Point
+
+  #  private variables
+  __point_data__ = None
+
+  #  public variables
+  data = Field()
+  x = Field()
+  y = Field()
+
+  #  getter methods
+  @data.GET
+  def _getData(self) -> array:
+    """Get the underlying buffer."""
+    if self.__point_data__ is None:
+      return array('d')
+    return self.__point_data__
+
+  @x.GET
+  def _getX(self) -> array:
+    """Get a copy of the first coordinate of every point."""
+    return self.data[0::2]
+
+  @y.GET
+  def _getY(self) -> array:
+    """Get a copy of the second coordinate of every point."""
+    return self.data[1::2]
+
+  #  constructor overloads
+  @overload(array)
+  def __init__(self, data: array) -> None:
+    """Initialize from a flat buffer of interleaved coordinates. The
+    buffer is copied."""
+    self.__point_data__ = ops.fromBuffer(data)
+
+  @overload(list)
+  @overload(tuple)
+  def __init__(self, values: Any) -> None:
+    """Initialize from a sequence of points or of flat coordinates."""
+    self.__point_data__ = ops.flatten(values)
+
+  @overload(int)
+  def __init__(self, n: int) -> None:
+    """Initialize 'n' points at the origin."""
+    self.__point_data__ = ops.zeros(2 * n)
+
+  @overload(THIS)
+  def __init__(self, other: Self) -> None:
+    """Initialize a copy of another array."""
+    self.__point_data__ = array('d', other.data)
+
+  @overload()
+  def __init__(self, ) -> None:
+    """Initialize an empty array."""
+    self.__point_data__ = array('d')
+
+  @classmethod
+  def fromBuffer(cls, buffer: Any) -> Self:
+    """Creates a new array copying the coordinates from any object
+    supporting the buffer protocol."""
+    return cls._fromArray(ops.fromBuffer(buffer))
+
+  @classmethod
+  def fromColumns(cls, xs: Any, ys: Any) -> Self:
+    """Creates a new array from separate columns of coordinates."""
+    return cls._fromArray(ops.interleave(xs, ys))
+
+  @classmethod
+  def _fromArray(cls, data: array) -> Self:
+    """Creates a new array adopting the given buffer without copying it.
+    This bypasses overload dispatch and is reserved for buffers created
+    by the batch operations themselves."""
+    self = object.__new__(cls)
+    self.__point_data__ = data
+    return self
+
+  def _writeData(self, data: array) -> None:
+    """Writes the coordinates into the existing buffer, such that views
+    taken from this array see the change."""
+    if self.__point_data__ is None:
+      self.__point_data__ = data
+    else:
+      self.__point_data__[:] = data
+
+  def toList(self, ) -> list[Point]:
+    """Returns a new list of objects of the item type."""
+    fromFloats = self.__item_type__._fromFloats
+    data = self.data
+    return [fromFloats(data[i], data[i + 1]) for i in range(0, len(data), 2)]
+
+  def toQPolygonF(self, ) -> QPolygonF:
+    """Returns a new QPolygonF holding every point, copied from the
+    buffer in a single pass."""
+    return qtOps.toQPolygonF(self.data)
+
+  @classmethod
+  def fromQPolygonF(cls, polygon: QPolygonF) -> Self:
+    """Creates a new array holding the points of the QPolygonF, copied in
+    a single pass."""
+    if not isinstance(polygon, QPolygonF):
+      raise TypeError(typeMsg('polygon', polygon, QPolygonF))
+    return cls._fromArray(qtOps.fromQPolygonF(polygon))
+
+  def toQ(self, ) -> QPolygonF:
+    """Returns a new QPolygonF holding every point."""
+    return self.toQPolygonF()
+
+  @classmethod
+  def fromQ(cls, polygon: QPolygonF) -> Self:
+    """Creates a new array from a QPolygonF."""
+    return cls.fromQPolygonF(polygon)
+
+  def simplify(self, tolerance: float = 1., method: str = 'minmax') -> Self:
+    """Returns the points needed to paint the polyline within 'tolerance'
+    device pixels. See the 'simplify' function for the methods."""
+    from . import simplify
+    return simplify(self, tolerance, method)
+
+  #  container protocol
+  def __len__(self, ) -> int:
+    """Returns the number of points."""
+    return len(self.data) // 2
+
+  def __iter__(self, ) -> Iterator[PointView]:
+    """Yields a view of each point."""
+    data, itemType = self.data, self.__item_type__
+    for i in range(len(data) // 2):
+      yield PointView(data, i, itemType)
+
+  def _parseIndex(self, index: int) -> int:
+    """Returns the index wrapped to the number of points."""
+    n = len(self)
+    if index < 0:
+      index += n
+    if index < 0 or index >= n:
+      raise IndexError('Index out of range')
+    return index
+
+  def __getitem__(self, item: Any) -> Any:
+    """Returns a view of the indexed point or a new array of the sliced
+    points."""
+    if isinstance(item, int):
+      index = self._parseIndex(item)
+      return PointView(self.data, index, self.__item_type__)
+    if isinstance(item, slice):
+      xs, ys = self.x[item], self.y[item]
+      return self._fromArray(ops.interleave(xs, ys))
+    raise TypeError(typeMsg('item', item, int))
+
+  def __setitem__(self, item: int, value: Any) -> None:
+    """Sets the coordinates of the indexed point."""
+    if not isinstance(item, int):
+      raise TypeError(typeMsg('item', item, int))
+    index = self._parseIndex(item)
+    other = self._resolveOther(value)
+    if not isinstance(other, tuple):
+      raise TypeError(typeMsg('value', value, Plane))
+    self.data[2 * index], self.data[2 * index + 1] = other
+
+  def append(self, value: Any) -> None:
+    """Appends a single point."""
+    other = self._resolveOther(value)
+    if not isinstance(other, tuple):
+      raise TypeError(typeMsg('value', value, Plane))
+    self.data.extend(other)
+
+  def extend(self, values: Any) -> None:
+    """Appends a sequence of points or another array."""
+    if isinstance(values, PointArray):
+      return self.data.extend(values.data)
+    self.data.extend(ops.flatten(values))
+
+  def __eq__(self, other: Any) -> bool:
+    """Arrays are equal if they hold the same coordinates."""
+    if not isinstance(other, PointArray):
+      return NotImplemented
+    return True if self.data == other.data else False
+
+  __hash__ = None
+
+  def __bool__(self, ) -> bool:
+    """Returns True if the array holds any points."""
+    return True if self.data else False
+
+  def __str__(self, ) -> str:
+    """Returns the string representation of the array."""
+    infoSpec = """%s[%d points]"""
+    name = type(self).__name__
+    return monoSpace(infoSpec % (name, len(self)))
+
+  def __repr__(self, ) -> str:
+    """Returns the string representation of the array."""
+    infoSpec = """%s(%s)"""
+    name = type(self).__name__
+    pairs = ['(%s, %s)' % (x, y) for x, y in zip(self.x, self.y)]
+    return infoSpec % (name, '[%s]' % ', '.join(pairs))
+
+  #  arithmetic
+  def _resolveOther(self, other: Any) -> Other:
+    """Resolves other to either the buffer of an array of the same length
+    or to a pair of floats to be broadcast across every point."""
+    if isinstance(other, PointArray):
+      if len(other) != len(self):
+        e = """Unable to combine arrays of %d and %d points!"""
+        raise ValueError(e % (len(self), len(other)))
+      return other.data
+    if isinstance(other, (int, float)):
+      return float(other), float(other)
+    if isinstance(other, complex):
+      return other.real, other.imag
+    if isinstance(other, (Plane, PointView)):
+      return other.r0, other.r1
+    if isinstance(other, (tuple, list)) and len(other) == 2:
+      if all([isinstance(arg, (int, float)) for arg in other]):
+        return float(other[0]), float(other[1])
+    return NotImplemented
+
+  def __neg__(self, ) -> Self:
+    """Returns the negation of every point."""
+    return self._fromArray(ops.negate(self.data))
+
+  def __abs__(self, ) -> array:
+    """Returns the length of every point."""
+    return ops.norms(self.data)
+
+  def __add__(self, other: Any) -> Self:
+    """Returns the sum of every point and other."""
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
+    if isinstance(other, tuple):
+      return self._fromArray(ops.offset(self.data, *other))
+    return self._fromArray(ops.addArrays(self.data, other))
+
+  def __radd__(self, other: Any) -> Self:
+    """Returns the sum of every point and other."""
+    return self + other
+
+  def __iadd__(self, other: Any) -> Self:
+    """Adds other to every point in place."""
+    out = self + other
+    if out is NotImplemented:
+      return NotImplemented
+    self._writeData(out.data)
+    return self
+
+  def __sub__(self, other: Any) -> Self:
+    """Returns the difference of every point and other."""
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
+    if isinstance(other, tuple):
+      return self._fromArray(ops.offset(self.data, -other[0], -other[1]))
+    return self._fromArray(ops.subArrays(self.data, other))
+
+  def __rsub__(self, other: Any) -> Self:
+    """Returns the difference of other and every point."""
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
+    if isinstance(other, tuple):
+      return self._fromArray(ops.offset(ops.negate(self.data), *other))
+    return self._fromArray(ops.subArrays(other, self.data))
+
+  def __isub__(self, other: Any) -> Self:
+    """Subtracts other from every point in place."""
+    out = self - other
+    if out is NotImplemented:
+      return NotImplemented
+    self._writeData(out.data)
+    return self
+
+  def __mul__(self, other: Any) -> Self:
+    """Returns every point scaled by a scalar."""
+    if isinstance(other, (int, float)):
+      return self._fromArray(ops.scale(self.data, other, other))
+    return NotImplemented
+
+  def __rmul__(self, other: Any) -> Self:
+    """Returns every point scaled by a scalar."""
+    if isinstance(other, (int, float)):
+      return self._fromArray(ops.scale(self.data, other, other))
+    return NotImplemented
+
+  def __imul__(self, other: Any) -> Self:
+    """Scales every point by a scalar in place."""
+    if isinstance(other, (int, float)):
+      self._writeData(ops.scale(self.data, other, other))
+      return self
+    return NotImplemented
+
+  def __truediv__(self, other: Any) -> Self:
+    """Returns every point divided by a scalar."""
+    if isinstance(other, (int, float)):
+      if not other:
+        raise ZeroDivisionError
+      return self._fromArray(ops.divide(self.data, other))
+    return NotImplemented
+
+  def __itruediv__(self, other: Any) -> Self:
+    """Divides every point by a scalar in place."""
+    if isinstance(other, (int, float)):
+      if not other:
+        raise ZeroDivisionError
+      self._writeData(ops.divide(self.data, other))
+      return self
+    return NotImplemented
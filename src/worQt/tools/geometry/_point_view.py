@@ -0,0 +1,116 @@
+"""PointView provides a lightweight view of a single point held by a
+PointArray. The view owns no coordinates of its own. Reading and writing
+'x' and 'y' goes directly to the buffer of the array. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worktoy.text import monoSpace, typeMsg
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Iterator
+  from array import array
+
+  from . import Point
+
+
+class PointView:
+  """PointView provides a lightweight view of a single point held by a
+  PointArray. The view owns no coordinates of its own. Reading and writing
+  'x' and 'y' goes directly to the buffer of the array. """
+
+  __slots__ = ('__point_data__', '__point_index__', '__item_type__')
+
+  def __init__(self, data: array, index: int, itemType: type) -> None:
+    """Initializes the view on the point at the given index."""
+    self.__point_data__ = data
+    self.__point_index__ = 2 * index
+    self.__item_type__ = itemType
+
+  def _getX(self) -> float:
+    """Get the first coordinate."""
+    return self.__point_data__[self.__point_index__]
+
+  def _setX(self, value: float) -> None:
+    """Set the first coordinate."""
+    self.__point_data__[self.__point_index__] = float(value)
+
+  def _getY(self) -> float:
+    """Get the second coordinate."""
+    return self.__point_data__[self.__point_index__ + 1]
+
+  def _setY(self, value: float) -> None:
+    """Set the second coordinate."""
+    self.__point_data__[self.__point_index__ + 1] = float(value)
+
+  x = r0 = property(_getX, _setX)
+  y = r1 = property(_getY, _setY)
+
+  def __len__(self, ) -> int:
+    """Returns 2"""
+    return 2
+
+  def __iter__(self, ) -> Iterator[float]:
+    """Yields the coordinates of the point."""
+    yield self.__point_data__[self.__point_index__]
+    yield self.__point_data__[self.__point_index__ + 1]
+
+  def __getitem__(self, item: Any) -> float:
+    """Returns the indexed or keyed coordinate."""
+    if isinstance(item, int):
+      if item in (0, -2):
+        return self.x
+      if item in (1, -1):
+        return self.y
+      raise IndexError('Index out of range')
+    if isinstance(item, str):
+      if item.lower() in ('x', 'r0'):
+        return self.x
+      if item.lower() in ('y', 'r1'):
+        return self.y
+      raise KeyError("""Key: '%s' not found!""" % item)
+    raise TypeError(typeMsg('item', item, int))
+
+  def __complex__(self, ) -> complex:
+    """Returns the complex representation of the point."""
+    return self.x + self.y * 1j
+
+  def __abs__(self, ) -> float:
+    """Returns the length of the point."""
+    return (self.x ** 2 + self.y ** 2) ** 0.5
+
+  def __eq__(self, other: Any) -> bool:
+    """Compares the coordinates to those of a view, a plane object or a
+    pair of numbers."""
+    try:
+      x, y = other
+    except (TypeError, ValueError):
+      return NotImplemented
+    return True if self.x == x and self.y == y else False
+
+  __hash__ = None
+
+  def toPoint(self, ) -> Point:
+    """Returns a new object of the item type of the array owning the
+    view, holding a copy of the coordinates."""
+    return self.__item_type__._fromFloats(self.x, self.y)
+
+  def __str__(self, ) -> str:
+    """Returns the string representation of the view."""
+    infoSpec = """%sView[x: %.3f, y: %.3f]"""
+    name = self.__item_type__.__name__
+    return monoSpace(infoSpec % (name, self.x, self.y))
+
+  def __repr__(self, ) -> str:
+    """Returns the string representation of the view."""
+    infoSpec = """%sView(%.3f, %.3f)"""
+    name = self.__item_type__.__name__
+    return monoSpace(infoSpec % (name, self.x, self.y))
@@ -0,0 +1,51 @@
+"""The '_qt_ops' module provides the conversions between the flat buffers
+used by the batch geometry types and the Qt containers. A QPolygonF stores
+its points contiguously as pairs of qreal, which is a 64-bit float on
+every platform supported by PySide6. The conversions therefore copy the
+buffer in a single memcpy through a shiboken 'VoidPtr' rather than
+creating a QPointF per point. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from PySide6.QtGui import QPolygonF
+from shiboken6 import VoidPtr
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  pass
+
+
+def _polygonView(polygon: QPolygonF, writable: bool) -> memoryview:
+  """Returns a byte view of the points stored by the polygon. The view is
+  only valid while the polygon is neither resized nor destroyed."""
+  size = 16 * polygon.size()
+  return memoryview(VoidPtr(polygon.data(), size, writable))
+
+
+def toQPolygonF(data: array) -> QPolygonF:
+  """Returns a new QPolygonF holding the points of the flat buffer."""
+  polygon = QPolygonF()
+  if not data:
+    return polygon
+  polygon.resize(len(data) // 2)
+  _polygonView(polygon, True)[:] = memoryview(data).cast('B')
+  return polygon
+
+
+def fromQPolygonF(polygon: QPolygonF) -> array:
+  """Returns a new flat buffer holding the points of the polygon."""
+  out = array('d')
+  if polygon.isEmpty():
+    return out
+  out.frombytes(_polygonView(polygon, False))
+  return out
@@ -3,13 +3,14 @@
 #  Copyright (c) 2025 Asger Jon Vistisen
 from __future__ import annotations
 
+from PySide6.QtCore import QRect, QRectF
 from worktoy.attr import Field
 from worktoy.mcls import BaseObject
-from worktoy.parse import maybe
 from worktoy.static import overload, THIS
+from worktoy.text import typeMsg
 from worktoy.waitaminute import DispatchException
 
-from . import Point, Size
+from . import Point, Size, cacheDispatch
 
 try:
   from typing import TYPE_CHECKING
@@ -20,23 +21,19 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-  from typing import Any, Self, Never
+  from typing import Any, Callable, Self, Never
 
 
+@cacheDispatch
 class Region(BaseObject):
   """Region represents a region spanning between two points in 2D space."""
 
   #  fallback value
-  __fallback_left__ = 0
-  __fallback_top__ = 0
-  __fallback_right__ = 0
-  __fallback_bottom__ = 0
+  __fallback_edges__ = (0., 0., 0., 0.)
 
   #  private variables
-  __left_edge__ = None
-  __top_edge__ = None
-  __right_edge__ = None
-  __bottom_edge__ = None
+  __region_edges__ = None
+  __derived_cache__ = None
 
   #  public variables
   left = Field()
@@ -63,34 +60,53 @@ class Region(BaseObject):
   size = Field()
   aspect = Field()
 
+  #  private getters and setters
+  def _getEdges(self, ) -> tuple[float, float, float, float]:
+    """Get the normalized edges as (left, top, right, bottom)."""
+    if self.__region_edges__ is None:
+      return self.__fallback_edges__
+    return self.__region_edges__
+
+  def _setEdges(self, *edges: float) -> None:
+    """Normalizes and sets the edges, clearing the cached points and
+    sizes. Every change to the edges must go through this method."""
+    left, top, right, bottom = [float(edge) for edge in edges]
+    if right < left:
+      left, right = right, left
+    if bottom < top:
+      top, bottom = bottom, top
+    self.__region_edges__ = (left, top, right, bottom)
+    self.__derived_cache__ = None
+
+  def _getDerived(self, name: str, factory: Callable) -> tuple:
+    """Get the named pair of floats, computing it with the factory on
+    first access since the edges were last set."""
+    if self.__derived_cache__ is None:
+      self.__derived_cache__ = dict()
+    if name not in self.__derived_cache__:
+      self.__derived_cache__[name] = factory()
+    return self.__derived_cache__[name]
+
   #  public getters
   @left.GET
   def _getLeft(self) -> float:
     """Get the left edge of the region."""
-    left = maybe(self.__left_edge__, self.__fallback_left__)
-    right = maybe(self.__right_edge__, self.__fallback_right__)
-    return min(left, right)
+    return self._getEdges()[0]
 
   @top.GET
   def _getTop(self) -> float:
     """Get the top edge of the region."""
-    top = maybe(self.__top_edge__, self.__fallback_top__)
-    bottom = maybe(self.__bottom_edge__, self.__fallback_bottom__)
-    return min(top, bottom)
+    return self._getEdges()[1]
 
   @right.GET
   def _getRight(self) -> float:
     """Get the right edge of the region."""
-    left = maybe(self.__left_edge__, self.__fallback_left__)
-    right = maybe(self.__right_edge__, self.__fallback_right__)
-    return max(left, right)
+    return self._getEdges()[2]
 
   @bottom.GET
   def _getBottom(self) -> float:
     """Get the bottom edge of the region."""
-    top = maybe(self.__top_edge__, self.__fallback_top__)
-    bottom = maybe(self.__bottom_edge__, self.__fallback_bottom__)
-    return max(top, bottom)
+    return self._getEdges()[3]
 
   #  virtual getters
   # - Edges
@@ -98,73 +114,118 @@ class Region(BaseObject):
   @horizontalCenter.GET
   def _getHorizontalCenter(self) -> float:
     """Get the horizontal center of the region."""
-    return (self.left + self.right) / 2
+    left, _, right, _ = self._getEdges()
+    return (left + right) / 2
 
   @vCenter.GET
   @verticalCenter.GET
   def _getVerticalCenter(self) -> float:
     """Get the vertical center of the region."""
-    return (self.top + self.bottom) / 2
+    _, top, _, bottom = self._getEdges()
+    return (top + bottom) / 2
 
   # - Points
+  #  The points and the size are cached as pairs of floats, from which a
+  #  new point or size is created on every access, such that modifying
+  #  them leaves the region unchanged.
+  def _createTopLeft(self) -> tuple[float, float]:
+    """Create the top left pair of the region."""
+    left, top, _, _ = self._getEdges()
+    return left, top
+
+  def _createTopRight(self) -> tuple[float, float]:
+    """Create the top right pair of the region."""
+    _, top, right, _ = self._getEdges()
+    return right, top
+
+  def _createBottomRight(self) -> tuple[float, float]:
+    """Create the bottom right pair of the region."""
+    _, _, right, bottom = self._getEdges()
+    return right, bottom
+
+  def _createBottomLeft(self) -> tuple[float, float]:
+    """Create the bottom left pair of the region."""
+    left, _, _, bottom = self._getEdges()
+    return left, bottom
+
+  def _createCenter(self) -> tuple[float, float]:
+    """Create the center pair of the region."""
+    left, top, right, bottom = self._getEdges()
+    return (left + right) / 2, (top + bottom) / 2
+
+  def _createSize(self) -> tuple[float, float]:
+    """Create the size pair of the region."""
+    left, top, right, bottom = self._getEdges()
+    return right - left, bottom - top
+
   @topLeft.GET
   def _getTopLeft(self) -> Point:
     """Get the top left point of the region."""
-    return Point(self.left, self.top)
+    return Point._fromFloats(*self._getDerived('topLeft',
+                                               self._createTopLeft))
 
   @topRight.GET
   def _getTopRight(self) -> Point:
     """Get the top right point of the region."""
-    return Point(self.right, self.top)
+    return Point._fromFloats(*self._getDerived('topRight',
+                                               self._createTopRight))
 
   @bottomRight.GET
   def _getBottomRight(self) -> Point:
     """Get the bottom right point of the region."""
-    return Point(self.right, self.bottom)
+    return Point._fromFloats(*self._getDerived('bottomRight',
+                                               self._createBottomRight))
 
   @bottomLeft.GET
   def _getBottomLeft(self) -> Point:
     """Get the bottom left point of the region."""
-    return Point(self.left, self.bottom)
+    return Point._fromFloats(*self._getDerived('bottomLeft',
+                                               self._createBottomLeft))
 
   @center.GET
   def _getCenter(self) -> Point:
     """Get the center point of the region."""
-    return Point(self.horizontalCenter, self.verticalCenter)
+    return Point._fromFloats(*self._getDerived('center',
+                                               self._createCenter))
 
   # - Dimensions
   @width.GET
   def _getWidth(self) -> float:
     """Get the width of the region."""
-    return self.right - self.left
+    left, _, right, _ = self._getEdges()
+    return right - left
 
   @height.GET
   def _getHeight(self) -> float:
     """Get the height of the region."""
-    return self.bottom - self.top
+    _, top, _, bottom = self._getEdges()
+    return bottom - top
 
   @area.GET
   def _getArea(self) -> float:
     """Get the area of the region."""
-    return self.width * self.height
+    left, top, right, bottom = self._getEdges()
+    return (right - left) * (bottom - top)
 
   @aspect.GET
   def _getAspect(self) -> float:
     """Get the aspect ratio of the region."""
-    if not self.height:
+    left, top, right, bottom = self._getEdges()
+    if bottom == top:
       raise ZeroDivisionError
-    if not self.width:
+    if right == left:
       return 0
-    return self.width / self.height
+    return (right - left) / (bottom - top)
 
   @size.GET
   def _getSize(self) -> Size:
     """Get the size of the region."""
-    return Size(self.width, self.height)
+    return Size._fromFloats(*self._getDerived('size', self._createSize))
 
   def __bool__(self) -> bool:
     """Check if the region is empty."""
-    return True if self.width and self.height else False
+    left, top, right, bottom = self._getEdges()
+    return True if right > left and bottom > top else False
 
   #  Constructors
 
@@ -172,10 +233,7 @@ class Region(BaseObject):
   @overload(float, float, float, float)
   def __init__(self, *args, **kwargs) -> None:
     """Initialize the region with the given edges."""
-    self.__left_edge__ = float(args[0])
-    self.__top_edge__ = float(args[1])
-    self.__right_edge__ = float(args[2])
-    self.__bottom_edge__ = float(args[3])
+    self._setEdges(*args)
 
   @overload(Point, Point)
   def __init__(self, *args, **kwargs) -> None:
@@ -185,10 +243,7 @@ class Region(BaseObject):
     except Exception as exception:
       raise DispatchException from exception
     else:
-      self.__left_edge__ = float(min(p1.x, p2.x))
-      self.__top_edge__ = float(min(p1.y, p2.y))
-      self.__right_edge__ = float(max(p1.x, p2.x))
-      self.__bottom_edge__ = float(max(p1.y, p2.y))
+      self._setEdges(p1.x, p1.y, p2.x, p2.y)
     finally:
       pass
 
@@ -208,10 +263,7 @@ class Region(BaseObject):
       print("""args: %s""" % (str(args),))
       print("""kwargs: %s""" % (str(kwargs),))
     p, s = args
-    self.__left_edge__ = float(p.x)
-    self.__top_edge__ = float(p.y)
-    self.__right_edge__ = float(p.x + s.width)
-    self.__bottom_edge__ = float(p.y + s.height)
+    self._setEdges(p.x, p.y, p.x + s.width, p.y + s.height)
 
   @overload(Size, Point)
   def __init__(self, *args, **kwargs) -> None:
@@ -278,6 +330,30 @@ class Region(BaseObject):
       assert callable(self.__init__)
     self.__init__(*vals)
 
+  @classmethod
+  def _fromEdges(cls, *edges: float) -> Self:
+    """Fast constructor bypassing overload dispatch. The edges must be
+    floats given as (left, top, right, bottom) and already normalized."""
+    self = object.__new__(cls)
+    self.__region_edges__ = edges
+    return self
+
+  def toQ(self, ) -> QRectF:
+    """Returns the region as a QRectF."""
+    left, top, right, bottom = self._getEdges()
+    return QRectF(left, top, right - left, bottom - top)
+
+  @classmethod
+  def fromQ(cls, qRect: Any) -> Self:
+    """Creates a new region from a QRectF or QRect. A rectangle of
+    negative width or height is normalized."""
+    if not isinstance(qRect, (QRectF, QRect)):
+      raise TypeError(typeMsg('qRect', qRect, QRectF))
+    left, top = float(qRect.x()), float(qRect.y())
+    self = object.__new__(cls)
+    self._setEdges(left, top, left + qRect.width(), top + qRect.height())
+    return self
+
   #  Functionality
 
   def _resolveOther(self, other: Any) -> Self:
@@ -318,18 +394,93 @@ class Region(BaseObject):
     bottom = max(self.bottom, other.bottom)
     return cls(left, top, right, bottom)
 
-  def __sub__(self, other: Any) -> Self:
-    """Subtraction returns the region that contains part of self, but no
-    part of other."""
-    cls = type(self)
-    other = self._resolveOther(other)
-    if other is NotImplemented:
+  def subtract(self, other: Any) -> list[Self]:
+    """Returns the part of this region not covered by other as a list of
+    at most four disjoint regions: a band above other and a band below
+    other, both spanning the full width, and a band on either side of
+    other spanning the height between them. Empty bands are omitted, such
+    that the list is empty when other covers this region."""
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      raise TypeError(typeMsg('other', other, type(self)))
+    left, top, right, bottom = self._getEdges()
+    oLeft, oTop, oRight, oBottom = resolved._getEdges()
+    fromEdges = type(self)._fromEdges
+    if oRight <= left or right <= oLeft or oBottom <= top or bottom <= oTop:
+      return [fromEdges(left, top, right, bottom)] if self else []
+    innerTop, innerBottom = max(top, oTop), min(bottom, oBottom)
+    out = []
+    if top < oTop:
+      out.append(fromEdges(left, top, right, oTop))
+    if left < oLeft:
+      out.append(fromEdges(left, innerTop, oLeft, innerBottom))
+    if oRight < right:
+      out.append(fromEdges(oRight, innerTop, right, innerBottom))
+    if oBottom < bottom:
+      out.append(fromEdges(left, oBottom, right, bottom))
+    return out
+
+  def subtractMany(self, occluders: Any) -> list[Self]:
+    """Returns the part of this region not covered by any of the
+    occluders as a list of disjoint regions ordered by top and then left
+    edge.
+
+    The occluders are clipped to this region and the region is swept from
+    top to bottom between consecutive horizontal edges. In each slab the
+    uncovered horizontal intervals are found from the active occluders.
+    An interval uncovered in consecutive slabs extends a single region,
+    such that a region is only emitted once its interval changes."""
+    left, top, right, bottom = self._getEdges()
+    fromEdges = type(self)._fromEdges
+    clipped = []
+    for occluder in occluders:
+      resolved = self._resolveOther(occluder)
+      if resolved is NotImplemented:
+        raise TypeError(typeMsg('occluder', occluder, type(self)))
+      oLeft, oTop, oRight, oBottom = resolved._getEdges()
+      oLeft, oTop = max(oLeft, left), max(oTop, top)
+      oRight, oBottom = min(oRight, right), min(oBottom, bottom)
+      if oLeft < oRight and oTop < oBottom:
+        clipped.append((oTop, oBottom, oLeft, oRight))
+    if not clipped:
+      return [fromEdges(left, top, right, bottom)] if self else []
+    clipped.sort()
+    edges = {top, bottom}
+    for oTop, oBottom, _, _ in clipped:
+      edges.add(oTop)
+      edges.add(oBottom)
+    ys = sorted(edges)
+    active, nextIndex, opened, out = [], 0, dict(), []
+    for y0, y1 in zip(ys, ys[1:]):
+      while nextIndex < len(clipped) and clipped[nextIndex][0] <= y0:
+        active.append(clipped[nextIndex])
+        nextIndex += 1
+      active = [occluder for occluder in active if occluder[1] > y0]
+      free, x = [], left
+      for _, _, oLeft, oRight in sorted(active, key=lambda o: o[2]):
+        if x < oLeft:
+          free.append((x, oLeft))
+        x = max(x, oRight)
+      if x < right:
+        free.append((x, right))
+      for interval in [*opened.keys()]:
+        if interval not in free:
+          out.append(fromEdges(interval[0], opened.pop(interval),
+                               interval[1], y0))
+      for interval in free:
+        if interval not in opened:
+          opened[interval] = y0
+    for (x0, x1), y0 in opened.items():
+      out.append(fromEdges(x0, y0, x1, bottom))
+    out.sort(key=lambda region: region._getEdges()[1::-1])
+    return out
+
+  def __sub__(self, other: Any) -> list[Self]:
+    """Subtraction returns the part of self not covered by other as a list
+    of at most four disjoint regions. See 'subtract'."""
+    if self._resolveOther(other) is NotImplemented:
       return NotImplemented
-    left = self.left
-    top = self.top
-    right = max(left, min(self.right, other.left))
-    bottom = max(top, min(self.bottom, other.top))
-    return cls(left, top, right, bottom)
+    return self.subtract(other)
 
   def __mul__(self, other: Any) -> Self:
     """Multiplication returns the region contained by both self and
@@ -0,0 +1,469 @@
+"""RegionArray provides a batch of regions held in four contiguous columns
+of 64-bit floats. Set operations apply to every region in one pass without
+creating a Region object per region. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+from operator import mul, sub, truediv
+
+from worktoy.attr import Field
+from worktoy.mcls import BaseObject
+from worktoy.static import overload, THIS
+from worktoy.text import monoSpace, typeMsg
+
+from . import Plane, Region, PointArray, PointView, cacheDispatch
+from . import _buffer_ops as ops
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Self, Iterable, Iterator, Union
+
+  Columns = tuple[array, array, array, array]
+  Edges = tuple[float, float, float, float]
+  Other = Union[Columns, Edges]
+
+
+@cacheDispatch
+class RegionArray(BaseObject):
+  """RegionArray provides a batch of regions held in four contiguous
+  columns of 64-bit floats: 'left', 'top', 'right' and 'bottom'. The
+  edges are normalized on the way in, such that left <= right and
+  top <= bottom for every region.
+
+  Indexing with an integer returns a new Region, while indexing with a
+  slice returns a new RegionArray. The operators follow the semantics of
+  the Region class: addition returns the bounding union and
+  multiplication the intersection, either pairwise with an array of
+  equal length or broadcasting a single region across every region.
+
+  Queries returning one value per region, such as 'contains' and
+  'intersects', return lists of booleans, while the dimensions are
+  returned as 'array.array' columns. The 'intersectAll' method returns
+  the index pairs of every intersecting pair of regions between two
+  arrays. """
+
+  #  private variables
+  __left_data__ = None
+  __top_data__ = None
+  __right_data__ = None
+  __bottom_data__ = None
+
+  #  public variables
+  left = Field()
+  top = Field()
+  right = Field()
+  bottom = Field()
+
+  #  virtual variables
+  width = Field()
+  height = Field()
+  area = Field()
+  aspect = Field()
+  bounds = Field()
+
+  #  getter methods
+  @left.GET
+  def _getLeft(self) -> array:
+    """Get the column of left edges."""
+    if self.__left_data__ is None:
+      return array('d')
+    return self.__left_data__
+
+  @top.GET
+  def _getTop(self) -> array:
+    """Get the column of top edges."""
+    if self.__top_data__ is None:
+      return array('d')
+    return self.__top_data__
+
+  @right.GET
+  def _getRight(self) -> array:
+    """Get the column of right edges."""
+    if self.__right_data__ is None:
+      return array('d')
+    return self.__right_data__
+
+  @bottom.GET
+  def _getBottom(self) -> array:
+    """Get the column of bottom edges."""
+    if self.__bottom_data__ is None:
+      return array('d')
+    return self.__bottom_data__
+
+  @width.GET
+  def _getWidth(self) -> array:
+    """Get the width of every region."""
+    return array('d', map(sub, self.right, self.left))
+
+  @height.GET
+  def _getHeight(self) -> array:
+    """Get the height of every region."""
+    return array('d', map(sub, self.bottom, self.top))
+
+  @area.GET
+  def _getArea(self) -> array:
+    """Get the area of every region."""
+    return array('d', map(mul, self.width, self.height))
+
+  @aspect.GET
+  def _getAspect(self) -> array:
+    """Get the aspect ratio of every region. Where Region raises
+    ZeroDivisionError on regions of zero height, the array holds 'nan'
+    for such regions."""
+    nan = float('nan')
+    out = array('d')
+    for width, height in zip(self.width, self.height):
+      out.append(truediv(width, height) if height else nan)
+    return out
+
+  @bounds.GET
+  def _getBounds(self) -> Region:
+    """Get the smallest region containing every region. An empty array
+    returns the empty region at the origin."""
+    if not self:
+      return Region._fromEdges(0., 0., 0., 0.)
+    left, top = min(self.left), min(self.top)
+    right, bottom = max(self.right), max(self.bottom)
+    return Region._fromEdges(left, top, right, bottom)
+
+  #  constructor overloads
+  @overload(list)
+  @overload(tuple)
+  def __init__(self, values: Any) -> None:
+    """Initialize from a sequence of regions or of tuples of edges."""
+    self._setColumns(*self._parseRegions(values))
+
+  @overload(int)
+  def __init__(self, n: int) -> None:
+    """Initialize 'n' empty regions at the origin."""
+    self._setColumns(*[ops.zeros(n) for _ in range(4)])
+
+  @overload(THIS)
+  def __init__(self, other: Self) -> None:
+    """Initialize a copy of another array."""
+    columns = other.left, other.top, other.right, other.bottom
+    self._setColumns(*[array('d', column) for column in columns])
+
+  @overload()
+  def __init__(self, ) -> None:
+    """Initialize an empty array."""
+    self._setColumns(*[array('d') for _ in range(4)])
+
+  @classmethod
+  def fromColumns(cls, *columns: Iterable) -> Self:
+    """Creates a new array from separate columns of left, top, right and
+    bottom edges. The columns are copied and normalized."""
+    if len(columns) != 4:
+      e = """Expected 4 columns, but received %d!"""
+      raise ValueError(e % len(columns))
+    left, top, right, bottom = [array('d', col) for col in columns]
+    n = len(left)
+    if any([len(column) != n for column in (top, right, bottom)]):
+      e = """Unable to combine columns of different lengths!"""
+      raise ValueError(e)
+    minX, maxX = map(min, left, right), map(max, left, right)
+    minY, maxY = map(min, top, bottom), map(max, top, bottom)
+    columns = minX, minY, maxX, maxY
+    return cls._fromColumns(*[array('d', col) for col in columns])
+
+  @classmethod
+  def _fromColumns(cls, *columns: array) -> Self:
+    """Creates a new array adopting the given columns without copying nor
+    normalizing them. This bypasses overload dispatch and is reserved for
+    columns created by the batch operations themselves."""
+    self = object.__new__(cls)
+    self._setColumns(*columns)
+    return self
+
+  def _setColumns(self, *columns: array) -> None:
+    """Sets the four columns."""
+    self.__left_data__, self.__top_data__ = columns[0], columns[1]
+    self.__right_data__, self.__bottom_data__ = columns[2], columns[3]
+
+  def _getColumns(self, ) -> Columns:
+    """Returns the four columns."""
+    return self.left, self.top, self.right, self.bottom
+
+  @staticmethod
+  def _parseEdges(value: Any) -> Edges:
+    """Returns the normalized edges of a region or of a tuple of four
+    numbers."""
+    if isinstance(value, Region):
+      return value._getEdges()
+    if isinstance(value, RegionArray):
+      raise TypeError(typeMsg('value', value, Region))
+    left, top, right, bottom = [float(edge) for edge in value]
+    if right < left:
+      left, right = right, left
+    if bottom < top:
+      top, bottom = bottom, top
+    return left, top, right, bottom
+
+  @classmethod
+  def _parseRegions(cls, values: Iterable) -> Columns:
+    """Returns the columns of a sequence of regions or tuples of edges."""
+    columns = array('d'), array('d'), array('d'), array('d')
+    for value in values:
+      for column, edge in zip(columns, cls._parseEdges(value)):
+        column.append(edge)
+    return columns
+
+  def toList(self, ) -> list[Region]:
+    """Returns a new list of Region objects."""
+    fromEdges = Region._fromEdges
+    return [fromEdges(*edges) for edges in zip(*self._getColumns())]
+
+  #  container protocol
+  def __len__(self, ) -> int:
+    """Returns the number of regions."""
+    return len(self.left)
+
+  def __iter__(self, ) -> Iterator[Region]:
+    """Yields a new Region for each region."""
+    fromEdges = Region._fromEdges
+    for edges in zip(*self._getColumns()):
+      yield fromEdges(*edges)
+
+  def _parseIndex(self, index: int) -> int:
+    """Returns the index wrapped to the number of regions."""
+    n = len(self)
+    if index < 0:
+      index += n
+    if index < 0 or index >= n:
+      raise IndexError('Index out of range')
+    return index
+
+  def __getitem__(self, item: Any) -> Any:
+    """Returns a new Region of the indexed region or a new array of the
+    sliced regions."""
+    if isinstance(item, int):
+      index = self._parseIndex(item)
+      edges = [column[index] for column in self._getColumns()]
+      return Region._fromEdges(*edges)
+    if isinstance(item, slice):
+      columns = [column[item] for column in self._getColumns()]
+      return self._fromColumns(*columns)
+    raise TypeError(typeMsg('item', item, int))
+
+  def __setitem__(self, item: int, value: Any) -> None:
+    """Sets the edges of the indexed region."""
+    if not isinstance(item, int):
+      raise TypeError(typeMsg('item', item, int))
+    index = self._parseIndex(item)
+    for column, edge in zip(self._getColumns(), self._parseEdges(value)):
+      column[index] = edge
+
+  def append(self, value: Any) -> None:
+    """Appends a single region."""
+    for column, edge in zip(self._getColumns(), self._parseEdges(value)):
+      column.append(edge)
+
+  def extend(self, values: Any) -> None:
+    """Appends a sequence of regions or another array."""
+    if isinstance(values, RegionArray):
+      others = values._getColumns()
+    else:
+      others = self._parseRegions(values)
+    for column, other in zip(self._getColumns(), others):
+      column.extend(other)
+
+  def __eq__(self, other: Any) -> bool:
+    """Arrays are equal if they hold the same edges."""
+    if not isinstance(other, RegionArray):
+      return NotImplemented
+    for column, otherColumn in zip(self._getColumns(), other._getColumns()):
+      if column != otherColumn:
+        return False
+    return True
+
+  __hash__ = None
+
+  def __bool__(self, ) -> bool:
+    """Returns True if the array holds any regions."""
+    return True if self.left else False
+
+  def __str__(self, ) -> str:
+    """Returns the string representation of the array."""
+    infoSpec = """%s[%d regions]"""
+    name = type(self).__name__
+    return monoSpace(infoSpec % (name, len(self)))
+
+  def __repr__(self, ) -> str:
+    """Returns the string representation of the array."""
+    infoSpec = """%s(%s)"""
+    name = type(self).__name__
+    edges = ['(%s, %s, %s, %s)' % e for e in zip(*self._getColumns())]
+    return infoSpec % (name, '[%s]' % ', '.join(edges))
+
+  #  set operations
+  def _resolveOther(self, other: Any) -> Other:
+    """Resolves other to either the columns of an array of the same length
+    or to the edges of a single region to be broadcast across every
+    region."""
+    if isinstance(other, RegionArray):
+      if len(other) != len(self):
+        e = """Unable to combine arrays of %d and %d regions!"""
+        raise ValueError(e % (len(self), len(other)))
+      return other._getColumns()
+    if isinstance(other, Region):
+      return other._getEdges()
+    if isinstance(other, (tuple, list)) and len(other) == 4:
+      if all([isinstance(arg, (int, float)) for arg in other]):
+        return self._parseEdges(other)
+    return NotImplemented
+
+  def _broadcast(self, other: Other) -> Columns:
+    """Returns the columns of other, repeating the edges of a single
+    region across every region."""
+    if isinstance(other[0], array):
+      return other
+    n = len(self)
+    return (*[array('d', (edge,)) * n for edge in other],)
+
+  def contains(self, other: Any) -> list[bool]:
+    """Returns for every region whether it contains other. Other may be a
+    single point or region, which is tested against every region, or an
+    array of equal length, which is tested pairwise. Edges count as
+    inside, as in Region."""
+    if isinstance(other, PointArray):
+      if len(other) != len(self):
+        e = """Unable to combine arrays of %d and %d points!"""
+        raise ValueError(e % (len(self), len(other)))
+      xs, ys = other.x, other.y
+      otherColumns = xs, ys, xs, ys
+    elif isinstance(other, (Plane, PointView)):
+      x, y = other.r0, other.r1
+      otherColumns = self._broadcast((x, y, x, y))
+    elif isinstance(other, complex):
+      x, y = other.real, other.imag
+      otherColumns = self._broadcast((x, y, x, y))
+    else:
+      resolved = self._resolveOther(other)
+      if resolved is NotImplemented:
+        raise TypeError(typeMsg('other', other, Region))
+      otherColumns = self._broadcast(resolved)
+    left, top, right, bottom = self._getColumns()
+    oLeft, oTop, oRight, oBottom = otherColumns
+    return [
+        l <= x0 and t <= y0 and x1 <= r and y1 <= b
+        for l, t, r, b, x0, y0, x1, y1 in zip(
+            left, top, right, bottom, oLeft, oTop, oRight, oBottom)
+    ]
+
+  def intersects(self, other: Any) -> list[bool]:
+    """Returns for every region whether it overlaps other in a region of
+    positive area, such that the result agrees with the truth value of
+    the intersection. Other is broadcast or paired as in 'contains'."""
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      raise TypeError(typeMsg('other', other, Region))
+    left, top, right, bottom = self._getColumns()
+    oLeft, oTop, oRight, oBottom = self._broadcast(other)
+    return [
+        l < x1 and x0 < r and t < y1 and y0 < b
+        for l, t, r, b, x0, y0, x1, y1 in zip(
+            left, top, right, bottom, oLeft, oTop, oRight, oBottom)
+    ]
+
+  def intersection(self, other: Any) -> Self:
+    """Returns the intersection of every region with other. Regions not
+    overlapping other collapse to an empty region, as in Region."""
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
+    left, top, right, bottom = self._getColumns()
+    oLeft, oTop, oRight, oBottom = self._broadcast(other)
+    newLeft = array('d', map(max, left, oLeft))
+    newTop = array('d', map(max, top, oTop))
+    newRight = array('d', map(max, newLeft, map(min, right, oRight)))
+    newBottom = array('d', map(max, newTop, map(min, bottom, oBottom)))
+    return self._fromColumns(newLeft, newTop, newRight, newBottom)
+
+  def union(self, other: Any) -> Self:
+    """Returns the smallest region containing both every region and
+    other."""
+    other = self._resolveOther(other)
+    if other is NotImplemented:
+      return NotImplemented
+    left, top, right, bottom = self._getColumns()
+    oLeft, oTop, oRight, oBottom = self._broadcast(other)
+    newLeft = array('d', map(min, left, oLeft))
+    newTop = array('d', map(min, top, oTop))
+    newRight = array('d', map(max, right, oRight))
+    newBottom = array('d', map(max, bottom, oBottom))
+    return self._fromColumns(newLeft, newTop, newRight, newBottom)
+
+  def intersectAll(self, other: Self = None) -> list[tuple[int, int]]:
+    """Returns the pairs of indices (i, j) such that region i of this
+    array and region j of other overlap in a region of positive area.
+    Without other, the array is tested against itself and only pairs
+    with i < j are returned.
+
+    The regions of both arrays are swept once in the order of their left
+    edges. For each array, the regions reaching past the left edge swept
+    are kept active, evicting those ending at or before it. Each region
+    is compared only to the active regions of the other array, such that
+    the cost is O((n + m) log(n + m)) for the sort plus the number of
+    pairs overlapping horizontally."""
+    selfPairs = other is None
+    if selfPairs:
+      other = self
+    if not isinstance(other, RegionArray):
+      raise TypeError(typeMsg('other', other, RegionArray))
+    columns = self._getColumns(), other._getColumns()
+    events = [(left, 0, i) for i, left in enumerate(columns[0][0])]
+    if not selfPairs:
+      events.extend([(left, 1, j) for j, left in enumerate(columns[1][0])])
+    events.sort()
+    active, out = ([], []), []
+    for l, side, i in events:
+      _, t, r, b = [column[i] for column in columns[side]]
+      against = side if selfPairs else 1 - side
+      oLeft, oTop, oRight, oBottom = columns[against]
+      kept = []
+      for j in active[against]:
+        if oRight[j] <= l:
+          continue
+        kept.append(j)
+        if min(r, oRight[j]) <= max(l, oLeft[j]):
+          continue
+        if min(b, oBottom[j]) <= max(t, oTop[j]):
+          continue
+        if selfPairs:
+          out.append((j, i) if j < i else (i, j))
+        else:
+          out.append((j, i) if side else (i, j))
+      active[against][:] = kept
+      active[side].append(i)
+    return out
+
+  def __add__(self, other: Any) -> Self:
+    """Addition returns the bounding union of every region and other."""
+    if self._resolveOther(other) is NotImplemented:
+      return NotImplemented
+    return self.union(other)
+
+  def __radd__(self, other: Any) -> Self:
+    """Addition returns the bounding union of every region and other."""
+    return self + other
+
+  def __mul__(self, other: Any) -> Self:
+    """Multiplication returns the intersection of every region and
+    other."""
+    if self._resolveOther(other) is NotImplemented:
+      return NotImplemented
+    return self.intersection(other)
+
+  def __rmul__(self, other: Any) -> Self:
+    """Multiplication returns the intersection of every region and
+    other."""
+    return self * other
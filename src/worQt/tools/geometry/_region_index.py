@@ -0,0 +1,425 @@
+"""RegionIndex provides an R-tree spatial index over Region objects
+supporting point, intersection and nearest-region queries. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from heapq import heappush, heappop
+from math import ceil
+
+from worktoy.attr import Field
+from worktoy.mcls import BaseObject
+from worktoy.static import overload, THIS
+from worktoy.text import typeMsg
+
+from . import Point, Region, cacheDispatch
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Iterator, Optional, Self, TypeAlias
+
+  Entry: TypeAlias = tuple[float, float, float, float, Region]
+  Box: TypeAlias = tuple[float, float, float, float]
+
+
+class _RegionNode:
+  """_RegionNode is a node of the R-tree. The children of a leaf are
+  entries of the form (left, top, right, bottom, region), and the
+  children of other nodes are nodes. """
+
+  __slots__ = ('box', 'children', 'isLeaf')
+
+  def __init__(self, children: list, isLeaf: bool) -> None:
+    """Creates the node and computes its bounding box."""
+    self.children = children
+    self.isLeaf = isLeaf
+    self.box = None
+    self.updateBox()
+
+  def updateBox(self, ) -> None:
+    """Recomputes the bounding box from the children."""
+    if not self.children:
+      self.box = (0., 0., 0., 0.)
+    elif self.isLeaf:
+      self.box = _boundingBox(self.children)
+    else:
+      self.box = _boundingBox([child.box for child in self.children])
+
+  def entries(self, ) -> Iterator[Entry]:
+    """Yields every entry held by the node and its descendants."""
+    stack = [self]
+    while stack:
+      node = stack.pop()
+      if node.isLeaf:
+        yield from node.children
+      else:
+        stack.extend(node.children)
+
+
+def _getBox(item: Any) -> Box:
+  """Returns the bounding box of a node or an entry."""
+  return item.box if isinstance(item, _RegionNode) else item
+
+
+def _boundingBox(boxes: list) -> Box:
+  """Returns the bounding box of the boxes. Only the first four items of
+  each box are used, so entries may be passed directly."""
+  first = boxes[0]
+  left, top, right, bottom = first[0], first[1], first[2], first[3]
+  for box in boxes:
+    if box[0] < left:
+      left = box[0]
+    if box[1] < top:
+      top = box[1]
+    if box[2] > right:
+      right = box[2]
+    if box[3] > bottom:
+      bottom = box[3]
+  return left, top, right, bottom
+
+
+def _area(box: Box) -> float:
+  """Returns the area of the box."""
+  return (box[2] - box[0]) * (box[3] - box[1])
+
+
+def _unionArea(box: Box, other: Box) -> float:
+  """Returns the area of the bounding box of both boxes."""
+  width = max(box[2], other[2]) - min(box[0], other[0])
+  height = max(box[3], other[3]) - min(box[1], other[1])
+  return width * height
+
+
+@cacheDispatch
+class RegionIndex(BaseObject):
+  """RegionIndex provides an R-tree spatial index over Region objects.
+
+  The constructor bulk loads the given regions using Sort-Tile-Recursive
+  packing. Regions can then be inserted and removed one at a time. The
+  index answers the following queries in logarithmic time on typical
+  data:
+    - queryPoint: regions containing a point
+    - queryRegion: regions intersecting a region
+    - nearest and nearestMany: regions closest to a point
+  Edges are inclusive, matching 'Region.__contains__', so regions merely
+  touching a query still match. Regions must not change while indexed.
+  Removal is by identity rather than equality."""
+
+  #  fallback variables
+  __max_entries__ = 16
+  __min_entries__ = 6
+
+  #  private variables
+  __root_node__ = None
+  __region_count__ = 0
+
+  #  public variables
+  bounds = Field()
+
+  #  getter methods
+  def _getRoot(self, ) -> _RegionNode:
+    """Returns the root node, creating an empty leaf if necessary."""
+    if self.__root_node__ is None:
+      self.__root_node__ = _RegionNode([], True)
+    return self.__root_node__
+
+  @bounds.GET
+  def _getBounds(self, ) -> Region:
+    """Returns the bounding region of every indexed region."""
+    return Region(*self._getRoot().box)
+
+  #  constructor overloads
+  @overload(list)
+  @overload(tuple)
+  def __init__(self, regions: Any) -> None:
+    """Creates the index by bulk loading the regions."""
+    self.load(regions)
+
+  @overload(THIS)
+  def __init__(self, other: Self) -> None:
+    """Creates a copy of another index."""
+    self.load([*other])
+
+  @overload()
+  def __init__(self, ) -> None:
+    """Creates an empty index."""
+
+  #  bulk loading
+  @staticmethod
+  def _createEntry(region: Any) -> Entry:
+    """Returns the leaf entry of the region."""
+    if not isinstance(region, Region):
+      raise TypeError(typeMsg('region', region, Region))
+    return region.left, region.top, region.right, region.bottom, region
+
+  def _packNodes(self, items: list, isLeaf: bool) -> list[_RegionNode]:
+    """Packs the items into nodes using Sort-Tile-Recursive."""
+    size = self.__max_entries__
+    nodeCount = ceil(len(items) / size)
+    sliceCount = ceil(nodeCount ** 0.5)
+    sliceSize = sliceCount * size
+    xKey = lambda item: _getBox(item)[0] + _getBox(item)[2]
+    yKey = lambda item: _getBox(item)[1] + _getBox(item)[3]
+    items = sorted(items, key=xKey)
+    nodes = []
+    for i in range(0, len(items), sliceSize):
+      tile = sorted(items[i:i + sliceSize], key=yKey)
+      for j in range(0, len(tile), size):
+        nodes.append(_RegionNode(tile[j:j + size], isLeaf))
+    return nodes
+
+  def load(self, regions: Any) -> None:
+    """Bulk loads the regions together with any already indexed and
+    rebuilds the tree."""
+    entries = [*self._getRoot().entries()]
+    entries.extend([self._createEntry(region) for region in regions])
+    self.__region_count__ = len(entries)
+    if len(entries) <= self.__max_entries__:
+      self.__root_node__ = _RegionNode(entries, True)
+      return
+    nodes = self._packNodes(entries, True)
+    while len(nodes) > self.__max_entries__:
+      nodes = self._packNodes(nodes, False)
+    self.__root_node__ = _RegionNode(nodes, False)
+
+  def clear(self, ) -> None:
+    """Removes every region from the index."""
+    self.__root_node__ = None
+    self.__region_count__ = 0
+
+  #  insertion
+  def _chooseLeaf(self, box: Any) -> list[_RegionNode]:
+    """Returns the path from the root to the leaf whose bounding box needs
+    the least enlargement to include the box."""
+    node = self._getRoot()
+    path = [node]
+    while not node.isLeaf:
+      best, bestCost = None, None
+      for child in node.children:
+        area = _area(child.box)
+        cost = (_unionArea(child.box, box) - area, area)
+        if bestCost is None or cost < bestCost:
+          best, bestCost = child, cost
+      node = best
+      path.append(node)
+    return path
+
+  def _splitNode(self, node: _RegionNode) -> _RegionNode:
+    """Splits the children of an overfull node in two. The node keeps the
+    first group and the new sibling holding the second is returned. The
+    split is chosen by sorting along each axis and minimizing the overlap
+    and then the total area of the two groups."""
+    low = self.__min_entries__
+    children = node.children
+    best, bestCost = None, None
+    for lo, hi in ((0, 2), (1, 3)):
+      items = sorted(children, key=lambda c: _getBox(c)[lo] + _getBox(c)[hi])
+      boxes = [_getBox(item) for item in items]
+      for k in range(low, len(items) - low + 1):
+        box1 = _boundingBox(boxes[:k])
+        box2 = _boundingBox(boxes[k:])
+        width = min(box1[2], box2[2]) - max(box1[0], box2[0])
+        height = min(box1[3], box2[3]) - max(box1[1], box2[1])
+        overlap = max(width, 0.) * max(height, 0.)
+        cost = (overlap, _area(box1) + _area(box2))
+        if bestCost is None or cost < bestCost:
+          best, bestCost = (items[:k], items[k:]), cost
+    node.children = best[0]
+    node.updateBox()
+    return _RegionNode(best[1], node.isLeaf)
+
+  def _insertEntry(self, entry: Entry) -> None:
+    """Inserts the entry into the tree."""
+    path = self._chooseLeaf(entry)
+    path[-1].children.append(entry)
+    sibling = None
+    for node in reversed(path):
+      if sibling is not None:
+        node.children.append(sibling)
+        sibling = None
+      if len(node.children) > self.__max_entries__:
+        sibling = self._splitNode(node)
+      else:
+        node.updateBox()
+    if sibling is not None:
+      self.__root_node__ = _RegionNode([path[0], sibling], False)
+
+  def insert(self, region: Region) -> None:
+    """Inserts the region into the index."""
+    self._insertEntry(self._createEntry(region))
+    self.__region_count__ += 1
+
+  #  removal
+  def _findLeaf(self, region: Region) -> Optional[list]:
+    """Returns the path from the root to the leaf holding the region or
+    None if the region is not indexed."""
+    left, top, right, bottom = (region.left, region.top, region.right,
+                                region.bottom)
+    stack = [[self._getRoot()]]
+    while stack:
+      path = stack.pop()
+      node = path[-1]
+      if node.isLeaf:
+        for entry in node.children:
+          if entry[4] is region:
+            return path
+        continue
+      for child in node.children:
+        L, T, R, B = child.box
+        if L <= left and T <= top and R >= right and B >= bottom:
+          stack.append([*path, child])
+    return None
+
+  def remove(self, region: Region) -> None:
+    """Removes the region from the index. Raises KeyError if the region is
+    not indexed."""
+    path = self._findLeaf(region)
+    if path is None:
+      raise KeyError("""Region: '%s' is not indexed!""" % (region,))
+    leaf = path[-1]
+    for i, entry in enumerate(leaf.children):
+      if entry[4] is region:
+        del leaf.children[i]
+        break
+    self.__region_count__ -= 1
+    orphans = []
+    for depth in range(len(path) - 1, 0, -1):
+      node, parent = path[depth], path[depth - 1]
+      if len(node.children) < self.__min_entries__:
+        parent.children.remove(node)
+        orphans.extend(node.entries())
+      else:
+        node.updateBox()
+    root = path[0]
+    root.updateBox()
+    while not root.isLeaf and len(root.children) == 1:
+      root = root.children[0]
+    if not root.isLeaf and not root.children:
+      root = _RegionNode([], True)
+    self.__root_node__ = root
+    for entry in orphans:
+      self._insertEntry(entry)
+
+  #  queries
+  @staticmethod
+  def _resolvePoint(*args) -> tuple[float, float]:
+    """Resolves the arguments to the coordinates of a point."""
+    if len(args) == 1:
+      arg = args[0]
+      if isinstance(arg, Point):
+        return arg.x, arg.y
+      if isinstance(arg, complex):
+        return arg.real, arg.imag
+    if len(args) == 2:
+      if all([isinstance(arg, (int, float)) for arg in args]):
+        return float(args[0]), float(args[1])
+    point = Point(*args)
+    return point.x, point.y
+
+  @staticmethod
+  def _resolveBox(*args) -> Box:
+    """Resolves the arguments to the edges of a region."""
+    region = args[0] if len(args) == 1 else None
+    if not isinstance(region, Region):
+      region = Region(*args)
+    return region.left, region.top, region.right, region.bottom
+
+  def queryPoint(self, *args) -> list[Region]:
+    """Returns the regions containing the point."""
+    x, y = self._resolvePoint(*args)
+    out = []
+    stack = [self._getRoot()]
+    while stack:
+      node = stack.pop()
+      if node.isLeaf:
+        for L, T, R, B, region in node.children:
+          if L <= x <= R and T <= y <= B:
+            out.append(region)
+        continue
+      for child in node.children:
+        L, T, R, B = child.box
+        if L <= x <= R and T <= y <= B:
+          stack.append(child)
+    return out
+
+  def queryRegion(self, *args) -> list[Region]:
+    """Returns the regions intersecting the region."""
+    left, top, right, bottom = self._resolveBox(*args)
+    out = []
+    stack = [self._getRoot()]
+    while stack:
+      node = stack.pop()
+      if node.isLeaf:
+        for L, T, R, B, region in node.children:
+          if L <= right and R >= left and T <= bottom and B >= top:
+            out.append(region)
+        continue
+      for child in node.children:
+        L, T, R, B = child.box
+        if L <= right and R >= left and T <= bottom and B >= top:
+          stack.append(child)
+    return out
+
+  def nearestMany(self, count: int, *args) -> list[Region]:
+    """Returns up to 'count' regions ordered by increasing distance from
+    the point. Regions containing the point have distance zero."""
+    x, y = self._resolvePoint(*args)
+    out = []
+    heap = [(0., 0, self._getRoot())]
+    tieBreak = 1
+    while heap and len(out) < count:
+      _, _, item = heappop(heap)
+      if isinstance(item, tuple):
+        out.append(item[4])
+        continue
+      for child in item.children:
+        L, T, R, B = _getBox(child)[:4]
+        dx = max(L - x, 0., x - R)
+        dy = max(T - y, 0., y - B)
+        heappush(heap, (dx * dx + dy * dy, tieBreak, child))
+        tieBreak += 1
+    return out
+
+  def nearest(self, *args) -> Optional[Region]:
+    """Returns the region nearest the point or None if the index is
+    empty."""
+    found = self.nearestMany(1, *args)
+    return found[0] if found else None
+
+  #  container protocol
+  def __len__(self, ) -> int:
+    """Returns the number of indexed regions."""
+    return self.__region_count__
+
+  def __bool__(self, ) -> bool:
+    """Returns True if any region is indexed."""
+    return True if self.__region_count__ else False
+
+  def __iter__(self, ) -> Iterator[Region]:
+    """Yields every indexed region."""
+    for entry in self._getRoot().entries():
+      yield entry[4]
+
+  def __contains__(self, region: Any) -> bool:
+    """Returns True if the region object is indexed."""
+    if not isinstance(region, Region):
+      return False
+    return False if self._findLeaf(region) is None else True
+
+  def __str__(self, ) -> str:
+    """Returns the string representation of the index."""
+    infoSpec = """%s[%d regions]"""
+    return infoSpec % (type(self).__name__, len(self))
+
+  def __repr__(self, ) -> str:
+    """Returns the code representation of the index."""
+    infoSpec = """%s([%s])"""
+    regionStr = ', '.join([repr(region) for region in self])
+    return infoSpec % (type(self).__name__, regionStr)
@@ -6,8 +6,11 @@ from __future__ import annotations
 
 from worktoy.attr import Field
 from worktoy.static import overload, THIS
+from worktoy.text import typeMsg
 
-from . import AbstractMap, Point, Region, Size
+from . import AbstractMap, Point, Region, Size, PointArray, VectorArray
+from . import cacheDispatch
+from . import _buffer_ops as ops
 
 try:
   from typing import TYPE_CHECKING
@@ -18,20 +21,32 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
+  from array import array
   from typing import Any, Callable, Self
 
 
+@cacheDispatch
 class RegionMap(AbstractMap):
   """RegionMap subclasses AbstractMap and provides a mapping between two
-  regions applied to points. """
+  regions applied to points.
+
+  The scale and offset along each axis are computed when the regions are
+  set, such that every point maps by a multiplication and an addition per
+  coordinate. Setting the 'source' or 'target' fields pans or zooms the
+  map and computes them again. Regions given to the map must not be
+  changed in place afterwards. A source region of zero width or height
+  raises ZeroDivisionError. The 'inverse' method returns the map from the
+  target back to the source. """
 
   #  fallback variables
   __fallback_source_region__ = (0, 0, 1, 1,)
   __fallback_target_region__ = (0, 0, 1, 1,)
+  __fallback_scale_offset__ = (1., 0., 1., 0.)
 
   #  private variables
   __source_region__ = None
   __target_region__ = None
+  __scale_offset__ = None
 
   #  public variables
   source = Field()
@@ -52,23 +67,73 @@ class RegionMap(AbstractMap):
       return Region(*self.__fallback_target_region__)
     return self.__target_region__
 
+  def _getScaleOffset(self) -> tuple[float, float, float, float]:
+    """Get the cached (sx, ox, sy, oy) such that a point (x, y) maps to
+    (sx * x + ox, sy * y + oy)."""
+    if self.__scale_offset__ is None:
+      return self.__fallback_scale_offset__
+    return self.__scale_offset__
+
+  def _getCoefficients(self) -> tuple[float, ...]:
+    """Get the affine coefficients (a, b, c, d, e, f)."""
+    sx, ox, sy, oy = self._getScaleOffset()
+    return sx, 0., ox, 0., sy, oy
+
+  #  setter methods
+  @source.SET
+  def _setSource(self, source: Region) -> None:
+    """Set the source region."""
+    if not isinstance(source, Region):
+      raise TypeError(typeMsg('source', source, Region))
+    self._setRegions(source, self.target)
+
+  @target.SET
+  def _setTarget(self, target: Region) -> None:
+    """Set the target region."""
+    if not isinstance(target, Region):
+      raise TypeError(typeMsg('target', target, Region))
+    self._setRegions(self.source, target)
+
+  def _setRegions(self, source: Region, target: Region) -> None:
+    """Set the source and target regions and cache the scale and offset
+    along each axis. Missing regions are replaced by the fallback."""
+    if source is None:
+      source = Region(*self.__fallback_source_region__)
+    if target is None:
+      target = Region(*self.__fallback_target_region__)
+    self.__source_region__ = source
+    self.__target_region__ = target
+    self._cacheScaleOffset()
+
+  def _cacheScaleOffset(self) -> None:
+    """Cache the scale and offset along each axis."""
+    left, top, right, bottom = self.__source_region__._getEdges()
+    tLeft, tTop, tRight, tBottom = self.__target_region__._getEdges()
+    if right == left or bottom == top:
+      e = """Unable to map from a source region of zero width or height!"""
+      raise ZeroDivisionError(e)
+    sx = (tRight - tLeft) / (right - left)
+    sy = (tBottom - tTop) / (bottom - top)
+    self.__scale_offset__ = sx, tLeft - left * sx, sy, tTop - top * sy
+
+  def inverse(self, ) -> Self:
+    """Returns the map from the target region to the source region."""
+    return type(self)(self.target, self.source)
+
   #  caller overloads
   @overload(Region)
   def __call__(self, region: Region, **kwargs) -> Region:
     """Apply the mapping to a region."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    return Region(self(region.topLeft), self(region.bottomRight), **kwargs)
+    sx, ox, sy, oy = self._getScaleOffset()
+    left, top, right, bottom = region._getEdges()
+    return Region._fromEdges(sx * left + ox, sy * top + oy,
+                             sx * right + ox, sy * bottom + oy)
 
   @overload(Point)
   def __call__(self, point: Point, **kwargs) -> Point:
     """Apply the mapping to a point."""
-    x = point.x - self.source.left
-    y = point.y - self.source.top
-    dx, dy = x / self.source.width, y / self.source.height
-    outX = self.target.left + dx * self.target.width
-    outY = self.target.top + dy * self.target.height
-    return Point(outX, outY, **kwargs)
+    sx, ox, sy, oy = self._getScaleOffset()
+    return Point._fromFloats(sx * point.x + ox, sy * point.y + oy)
 
   @overload(int, int)
   @overload(float, int)
@@ -76,56 +141,60 @@ class RegionMap(AbstractMap):
   @overload(float, float)
   def __call__(self, x: float, y: float, **kwargs) -> tuple[float, float]:
     """Apply the mapping to a point."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    point = self(Point(x, y), **kwargs)
-    return point.x, point.y
+    sx, ox, sy, oy = self._getScaleOffset()
+    return sx * x + ox, sy * y + oy
 
   @overload(complex)
   def __call__(self, z: complex, **kwargs) -> complex:
     """Apply the mapping to a point."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    point = self(Point(z), **kwargs)
-    return point.x + point.y * 1j
+    sx, ox, sy, oy = self._getScaleOffset()
+    return (sx * z.real + ox) + (sy * z.imag + oy) * 1j
 
   @overload(tuple)
   @overload(list)
   def __call__(self, vals: Any, **kwargs) -> tuple[float, float]:
     """Apply the mapping to a point."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    return self(*vals, **kwargs)
+    sx, ox, sy, oy = self._getScaleOffset()
+    x, y = vals
+    return sx * x + ox, sy * y + oy
+
+  @overload(PointArray)
+  @overload(VectorArray)
+  def __call__(self, points: PointArray, **kwargs) -> PointArray:
+    """Apply the mapping to every point in the array."""
+    return self.mapMany(points)
+
+  def _mapArray(self, data: array) -> array:
+    """Maps every point in the buffer from the source to the target."""
+    sx, ox, sy, oy = self._getScaleOffset()
+    return ops.axisAffine(data, sx, ox, sy, oy)
 
   #  constructor overloads
 
   @overload(Region, Region)
   def __init__(self, source: Region, target: Region) -> None:
     """Apply the mapping to a region."""
-    self.__source_region__ = source
-    self.__target_region__ = target
+    self._setRegions(source, target)
 
   @overload(Region, Size)
   def __init__(self, source: Region, target: Size) -> None:
     """Apply the mapping to a region."""
-    self.__source_region__ = source
-    self.__target_region__ = Region(target)
+    self._setRegions(source, Region(target))
 
   @overload(Size, Region)
   def __init__(self, source: Size, target: Region) -> None:
     """Apply the mapping to a region."""
-    self.__source_region__ = Region(source)
-    self.__target_region__ = target
+    self._setRegions(Region(source), target)
 
   @overload(Region)
   def __init__(self, target: Region) -> None:
     """Apply the mapping to a region."""
-    self.__target_region__ = target
+    self._setRegions(None, target)
 
   @overload(Size)
   def __init__(self, target: Size) -> None:
     """Apply the mapping to a region."""
-    self.__target_region__ = Region(target)
+    self._setRegions(None, Region(target))
 
   @overload()
   def __init__(self) -> None:
@@ -3,7 +3,7 @@
 #  Copyright (c) 2025 Asger Jon Vistisen
 from __future__ import annotations
 
-from math import atan2, cos, sin
+from math import cos, sin
 
 from worktoy.attr import Field
 from worktoy.mcls import AbstractMetaclass
@@ -12,7 +12,9 @@ from worktoy.static import overload
 from worktoy.text import typeMsg
 from worktoy.waitaminute import MissingVariable, VariableNotNone
 
-from . import AbstractMap, Point, Region, Size, Vector
+from . import AbstractMap, Point, Region, Size, Vector, PointArray
+from . import cacheDispatch
+from . import VectorArray
 
 try:
   from typing import TYPE_CHECKING
@@ -28,14 +30,23 @@ if TYPE_CHECKING:
   Floats: TypeAlias = Optional[tuple[float, float]]
 
 
+@cacheDispatch
 class RotateMap(AbstractMap):
-  """RotateMap rotates points about the origin. """
+  """RotateMap rotates points about the origin.
+
+  The cosine and sine of the angle are computed once when the map is
+  constructed, such that every point is rotated by a plain 2x2 matrix
+  multiplication."""
 
   #  fallback variables
   __fallback_angle__ = 0
+  __fallback_cos__ = 1.
+  __fallback_sin__ = 0.
 
   #  private variables
   __rotation_angle__ = None
+  __rotation_cos__ = None
+  __rotation_sin__ = None
 
   #  public variables
   angle = Field()
@@ -46,18 +57,31 @@ class RotateMap(AbstractMap):
     """Get the angle of rotation."""
     return maybe(self.__rotation_angle__, self.__fallback_angle__)
 
+  def _getCoefficients(self) -> tuple[float, ...]:
+    """Get the affine coefficients (a, b, c, d, e, f)."""
+    c, s = self._getCosSin()
+    return c, -s, 0., s, c, 0.
+
+  def _getCosSin(self, ) -> tuple[float, float]:
+    """Get the cached cosine and sine of the angle."""
+    c = maybe(self.__rotation_cos__, self.__fallback_cos__)
+    s = maybe(self.__rotation_sin__, self.__fallback_sin__)
+    return c, s
+
+  #  setter methods
+  def _setAngle(self, angle: float) -> None:
+    """Set the angle and cache its cosine and sine."""
+    self.__rotation_angle__ = float(angle)
+    self.__rotation_cos__ = cos(self.__rotation_angle__)
+    self.__rotation_sin__ = sin(self.__rotation_angle__)
+
   #  caller overloads
   @overload(Point)
   def __call__(self, point: Point) -> Point:
     """Rotate point about the origin."""
-    if not point.x ** 2 + point.y ** 2:
-      raise ZeroDivisionError
-    r = (point.x ** 2 + point.y ** 2) ** 0.5
-    t0 = atan2(point.y, point.x)
-    t = t0 + self.angle
-    x = r * cos(t)
-    y = r * sin(t)
-    return Point(x, y)
+    c, s = self._getCosSin()
+    x, y = point.x, point.y
+    return Point._fromFloats(c * x - s * y, s * x + c * y)
 
   @overload(int, int)
   @overload(float, int)
@@ -65,56 +89,47 @@ class RotateMap(AbstractMap):
   @overload(float, float)
   def __call__(self, x: float, y: float) -> Floats:
     """Rotate point about the origin."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    if not x ** 2 + y ** 2:
-      try:
-        print("""Before ZeroDivisionError""")
-        print("""Received: x = %s, y = %s""" % (str(x), str(y)))
-        raise ZeroDivisionError
-      finally:
-        print("""After ZeroDivisionError""")
-    p = self(Point(x, y))
-    return p.x, p.y
+    c, s = self._getCosSin()
+    return c * x - s * y, s * x + c * y
 
   @overload(Vector)
   def __call__(self, vector: Vector) -> Vector:
     """Rotate vector about the origin."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    p0 = Point(vector.x, vector.y)
-    p = self(p0)
-    return Vector(p.x, p.y)
+    c, s = self._getCosSin()
+    x, y = vector.x, vector.y
+    return Vector._fromFloats(c * x - s * y, s * x + c * y)
 
   @overload(complex)
   def __call__(self, z: complex) -> complex:
     """Rotate complex number about the origin."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    if not z.real ** 2 + z.imag ** 2:
-      raise ZeroDivisionError
-    x, y = self(z.real, z.imag)
-    return x + y * 1j
+    c, s = self._getCosSin()
+    x, y = z.real, z.imag
+    return (c * x - s * y) + (s * x + c * y) * 1j
 
   @overload(float)
   @overload(int)
   def __call__(self, value: float) -> tuple[float, float]:
     """Rotate float about the origin."""
-    if TYPE_CHECKING:
-      assert callable(self)
-    return self(value, value)
+    c, s = self._getCosSin()
+    return (c - s) * value, (s + c) * value
+
+  @overload(PointArray)
+  @overload(VectorArray)
+  def __call__(self, points: PointArray) -> PointArray:
+    """Rotate every point in the array about the origin."""
+    return self.mapMany(points)
 
   #  constructor overloads
   @overload(float)
   @overload(int)
   def __init__(self, angle: float) -> None:
     """RotateMap constructor."""
-    self.__rotation_angle__ = float(angle)
+    self._setAngle(angle)
 
   @overload(complex)
   def __init__(self, z: complex) -> None:
     """RotateMap constructor."""
-    self.__rotation_angle__ = float(abs(z))
+    self._setAngle(abs(z))
 
   @overload(int, int)
   @overload(float, int)
@@ -11,6 +11,8 @@ from worktoy.static import overload, THIS
 from worktoy.waitaminute import VariableNotNone
 
 from . import AbstractMap, Point, Region, Size, MoveMap, RotateMap, Vector
+from . import cacheDispatch
+from . import PointArray, VectorArray
 
 try:
   from typing import TYPE_CHECKING
@@ -24,6 +26,7 @@ if TYPE_CHECKING:
   from typing import Any, Callable, Self
 
 
+@cacheDispatch
 class RotatePointMap(AbstractMap):
   """RotatePointMap rotates points by a given angle about a given point."""
 
@@ -37,6 +40,7 @@ class RotatePointMap(AbstractMap):
   __move_map__ = None
   __rotate_map__ = None
   __return_map__ = None
+  __affine_coefficients__ = None
 
   #  public variables
   angle = Field()
@@ -64,6 +68,14 @@ class RotatePointMap(AbstractMap):
       raise VariableNotNone('__return_map__', )
     self.__return_map__ = MoveMap(-self.center.x, -self.center.y)
 
+  def _createCoefficients(self, ) -> None:
+    """Folds the move, rotate and return maps into a single set of affine
+    coefficients."""
+    if self.__affine_coefficients__ is not None:
+      raise VariableNotNone('__affine_coefficients__', )
+    pipeline = self.returnMap @ self.rotateMap @ self.moveMap
+    self.__affine_coefficients__ = pipeline.coefficients
+
   #  getter methods
   @angle.GET
   def _getAngle(self, ) -> float:
@@ -107,15 +119,25 @@ class RotatePointMap(AbstractMap):
       return self._getReturnMap(_recursion=True)
     return self.__return_map__
 
+  def _getCoefficients(self, **kwargs) -> tuple[float, ...]:
+    """Get the affine coefficients (a, b, c, d, e, f) of the composed
+    move, rotate and return maps."""
+    if self.__affine_coefficients__ is None:
+      if kwargs.get('_recursion', False):
+        raise RecursionError
+      self._createCoefficients()
+      return self._getCoefficients(_recursion=True)
+    return self.__affine_coefficients__
+
   #  caller overloads
   @overload(Point)
   def __call__(self, point: Point) -> Point:
     """Rotate point about the center."""
     if not point.x ** 2 + point.y ** 2:
       raise ZeroDivisionError
-    move = self.moveMap(point)
-    rotate = self.rotateMap(move)
-    return self.returnMap(rotate)
+    a, b, c, d, e, f = self.coefficients
+    x, y = point.x, point.y
+    return Point._fromFloats(a * x + b * y + c, d * x + e * y + f)
 
   @overload(int, int)
   @overload(float, int)
@@ -135,8 +157,14 @@ class RotatePointMap(AbstractMap):
     """Rotate point about the center."""
     if TYPE_CHECKING:
       assert callable(self)
-    z1 = self(z.real, z.imag)
-    return z1.x + z1.y * 1j
+    x, y = self(z.real, z.imag)
+    return x + y * 1j
+
+  @overload(PointArray)
+  @overload(VectorArray)
+  def __call__(self, points: PointArray) -> PointArray:
+    """Rotate every point in the array about the center."""
+    return self.mapMany(points)
 
   #  constructor overloads
   @overload(Point, float)
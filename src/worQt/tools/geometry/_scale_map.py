@@ -7,7 +7,10 @@ from worktoy.parse import maybe
 from worktoy.static import overload, THIS
 from worktoy.attr import Field
 
-from . import AbstractMap, Point, Region, Size, Vector
+from . import AbstractMap, Point, Region, Size, Vector, PointArray
+from . import cacheDispatch
+from . import VectorArray
+from . import _buffer_ops as ops
 
 try:
   from typing import TYPE_CHECKING
@@ -18,9 +21,11 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
+  from array import array
   from typing import Any, Callable, Self
 
 
+@cacheDispatch
 class ScaleMap(AbstractMap):
   """ScaleMap provides a mapping between two objects that linearly scales."""
 
@@ -47,6 +52,10 @@ class ScaleMap(AbstractMap):
     """Get the vertical scale."""
     return maybe(self.__vertical_scale__, self.__fallback_vertical__)
 
+  def _getCoefficients(self) -> tuple[float, ...]:
+    """Get the affine coefficients (a, b, c, d, e, f)."""
+    return self.horizontalScale, 0., 0., 0., self.verticalScale, 0.
+
   #  Caller overloads
   @overload(int, int)
   @overload(float, int)
@@ -84,6 +93,16 @@ class ScaleMap(AbstractMap):
     y2 = y0 + dy * self.verticalScale
     return Region(x0, y0, x2, y2, **kwargs)
 
+  @overload(PointArray)
+  @overload(VectorArray)
+  def __call__(self, points: PointArray, **kwargs) -> PointArray:
+    """Apply the mapping to every point in the array."""
+    return self.mapMany(points)
+
+  def _mapArray(self, data: array) -> array:
+    """Scales every point in the buffer."""
+    return ops.scale(data, self.horizontalScale, self.verticalScale)
+
   #  Constructor overloads
   @overload(int, int)
   @overload(float, int)
@@ -0,0 +1,137 @@
+"""The 'simplify' function reduces a polyline in screen space to the points
+needed to paint it within a tolerance in device pixels. Two methods are
+provided:
+- 'minmax' -> Keeps the first, lowest, highest and last point of each
+  run of points falling in the same pixel column. The output holds at most
+  four points per column, such that painting scales with the width of the
+  widget rather than with the length of the data.
+- 'rdp' -> The Ramer-Douglas-Peucker algorithm keeping the points needed
+  for every removed point to lie within the tolerance of the polyline.
+Both methods keep a subset of the points in their original order. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+from itertools import compress, repeat
+from math import floor, sqrt
+from operator import mul, ne
+
+from worktoy.text import typeMsg
+
+from . import PointArray, AbstractMap
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any
+
+
+def minMaxIndices(data: array, tolerance: float) -> list[int]:
+  """Returns the indices of the points kept by min/max decimation of the
+  flat buffer in columns 'tolerance' pixels wide. The columns are found
+  through 'map' and 'compress', such that only the loop over the runs of
+  points sharing a column runs at the Python level."""
+  xs, ys = data[0::2], data[1::2]
+  n = len(xs)
+  if n < 5:
+    return [*range(n)]
+  columns = [*map(floor, map(mul, xs, repeat(1. / tolerance)))]
+  changes = compress(range(1, n), map(ne, columns[1:], columns[:-1]))
+  bounds = [0, *changes, n]
+  out = []
+  for start, stop in zip(bounds, bounds[1:]):
+    run = ys[start:stop]
+    low = start + run.index(min(run))
+    high = start + run.index(max(run))
+    out.extend(sorted({start, low, high, stop - 1}))
+  return out
+
+
+def _farthest(xs: array, ys: array, first: int, last: int) -> tuple:
+  """Returns the greatest distance from the points strictly between
+  'first' and 'last' to the segment joining them, and the index of the
+  point at that distance. Distances are compared squared, and the segment
+  arithmetic is inlined, as this loop dominates the algorithm."""
+  x0, y0 = xs[first], ys[first]
+  dx, dy = xs[last] - x0, ys[last] - y0
+  length2 = dx * dx + dy * dy
+  worst2, worstIndex = -1., first
+  for i in range(first + 1, last):
+    px, py = xs[i] - x0, ys[i] - y0
+    if length2:
+      t = (px * dx + py * dy) / length2
+      if t > 1.:
+        px, py = px - dx, py - dy
+      elif t > 0.:
+        px, py = px - t * dx, py - t * dy
+    distance2 = px * px + py * py
+    if distance2 > worst2:
+      worst2, worstIndex = distance2, i
+  return sqrt(worst2), worstIndex
+
+
+def rdpIndices(data: array, tolerance: float) -> list[int]:
+  """Returns the indices of the points kept by the Ramer-Douglas-Peucker
+  algorithm applied to the flat buffer. The recursion is replaced by an
+  explicit stack, such that long polylines do not exhaust the recursion
+  limit."""
+  xs, ys = data[0::2], data[1::2]
+  n = len(xs)
+  if n < 3:
+    return [*range(n)]
+  keep = bytearray(n)
+  keep[0] = keep[n - 1] = 1
+  stack = [(0, n - 1)]
+  while stack:
+    first, last = stack.pop()
+    worst, worstIndex = _farthest(xs, ys, first, last)
+    if worst <= tolerance:
+      continue
+    keep[worstIndex] = 1
+    if worstIndex - first > 1:
+      stack.append((first, worstIndex))
+    if last - worstIndex > 1:
+      stack.append((worstIndex, last))
+  return [i for i in range(n) if keep[i]]
+
+
+def _takeIndices(data: array, indices: list[int]) -> array:
+  """Returns a new flat buffer holding the indexed points."""
+  out = array('d', bytes(16 * len(indices)))
+  out[0::2] = array('d', [data[2 * i] for i in indices])
+  out[1::2] = array('d', [data[2 * i + 1] for i in indices])
+  return out
+
+
+_simplifyMethods = {
+    'minmax': minMaxIndices,
+    'rdp'   : rdpIndices,
+}
+
+
+def simplify(points: Any, tolerance: float = 1.,
+             method: str = 'minmax') -> PointArray:
+  """Returns the points needed to paint the polyline within 'tolerance'
+  device pixels. The points should already be mapped to screen space,
+  for example by 'RegionMap.mapMany'. Accepts the point batches accepted
+  by 'AbstractMap.mapMany' and preserves PointArray subclasses. As 'rdp'
+  is far slower per point than 'minmax', long traces should be reduced by
+  'minmax' before applying 'rdp'."""
+  points = AbstractMap._resolvePoints(points)
+  if not isinstance(tolerance, (int, float)):
+    raise TypeError(typeMsg('tolerance', tolerance, float))
+  if tolerance <= 0:
+    raise ValueError("""'tolerance' must be positive!""")
+  if method not in _simplifyMethods:
+    e = """Unknown simplification method: '%s'! Expected one of: %s"""
+    names = ', '.join(_simplifyMethods)
+    raise ValueError(e % (method, names))
+  indices = _simplifyMethods[method](points.data, float(tolerance))
+  return points._fromArray(_takeIndices(points.data, indices))
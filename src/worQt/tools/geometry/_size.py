@@ -3,10 +3,12 @@
 #  Copyright (c) 2025 Asger Jon Vistisen
 from __future__ import annotations
 
+from PySide6.QtCore import QSize, QSizeF
 from worktoy.attr import Field
+from worktoy.text import typeMsg
 
 from moreworktoy.attr import Alias
-from . import Plane
+from . import Plane, cacheDispatch
 
 try:
   from typing import TYPE_CHECKING
@@ -16,9 +18,10 @@ except ImportError:
   except ImportError:
     TYPE_CHECKING = False
 
-from typing import Self
+from typing import Any, Self
 
 
+@cacheDispatch
 class Size(Plane):
   """Size class subclasses Plane and provides a size in 2D space."""
 
@@ -43,21 +46,52 @@ class Size(Plane):
       raise ZeroDivisionError
     return self.width / self.height
 
+  def toQ(self, ) -> QSizeF:
+    """Returns the size as a QSizeF."""
+    return QSizeF(self.r0, self.r1)
+
+  @classmethod
+  def fromQ(cls, qSize: Any) -> Self:
+    """Creates a new size from a QSizeF or QSize."""
+    if not isinstance(qSize, (QSizeF, QSize)):
+      raise TypeError(typeMsg('qSize', qSize, QSizeF))
+    return cls._fromFloats(float(qSize.width()), float(qSize.height()))
+
   def fit(self, other: Self) -> Self:
     """Creates a new size preserving the aspect ratio of 'self', whilst
-    being strictly smaller than 'other'."""
-    if TYPE_CHECKING:
-      assert isinstance(other.width, float)
-      assert isinstance(other.height, float)
-      assert isinstance(self.width, float)
-      assert isinstance(self.height, float)
-
-    hScale, wScale = other.height / self.height, other.width / self.width
-    h0, w0 = self.height * hScale, self.width * hScale
-    h1, w1 = self.height * wScale, self.width * wScale
-    if h0 <= other.height and w0 <= other.width:
-      return Size(self.width * hScale, self.height * hScale)
-    if h1 <= other.height and w1 <= other.width:
-      return Size(self.width * wScale, self.height * wScale)
-    e = """Unable to fit '%s' into '%s'""" % (self, other)
-    raise RuntimeError(e)
+    being no larger than 'other' and touching it along at least one
+    dimension. Raises ZeroDivisionError if 'self' has neither width nor
+    height."""
+    w, h = _fitFloats(self.r0, self.r1, other.width, other.height)
+    return type(self)._fromFloats(w, h)
+
+  @classmethod
+  def fitMany(cls, sizes: Any, container: Any) -> list[Self]:
+    """Fits every size in 'sizes' into 'container' as 'fit' does. The
+    sizes may be Size objects or pairs of floats, and the container any
+    argument accepted by Size."""
+    if not isinstance(container, Size):
+      container = Size(container)
+    ow, oh = container.r0, container.r1
+    out = []
+    for size in sizes:
+      w, h = (size.r0, size.r1) if isinstance(size, Size) else size
+      out.append(cls._fromFloats(*_fitFloats(w, h, ow, oh)))
+    return out
+
+
+def _fitFloats(w: float, h: float, ow: float, oh: float) -> tuple:
+  """Returns the largest (width, height) with the aspect ratio of (w, h)
+  no larger than (ow, oh). Negative dimensions count by their absolute
+  value, as do those of Size. The binding dimension is chosen by
+  comparing cross products, such that no scale factor is computed before
+  it is known to apply. The binding dimension is returned exactly and
+  the other is clamped to the container, such that rounding never
+  overshoots."""
+  w, h, ow, oh = abs(w), abs(h), abs(ow), abs(oh)
+  if not (w or h):
+    e = """Unable to fit a size with neither width nor height!"""
+    raise ZeroDivisionError(e)
+  if w * oh <= h * ow:
+    return min(ow, w * oh / h), float(oh)
+  return float(ow), min(oh, h * ow / w)
@@ -0,0 +1,260 @@
+"""StreamPipeline maps a live feed of points through a chain of maps,
+transforming only the newly appended points and keeping the most recent
+points in a ring buffer. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from PySide6.QtGui import QPolygonF
+from worktoy.attr import Field
+from worktoy.mcls import BaseObject
+from worktoy.static import overload
+from worktoy.text import typeMsg
+
+from . import AbstractMap, PointArray, cacheDispatch
+from . import _buffer_ops as ops
+from . import _qt_ops as qtOps
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any
+
+  from ._abstract_map import Coefficients
+
+
+@cacheDispatch
+class StreamPipeline(BaseObject):
+  """StreamPipeline maps a live feed of points through a chain of maps,
+  transforming only the newly appended points and keeping the most recent
+  'capacity' points in a ring buffer.
+
+  The maps apply in the order given, such that the first map applies to
+  the raw points. The chain is composed into a single set of affine
+  coefficients. Both the raw and the mapped points are kept, and the
+  composed coefficients are compared on every append and every read of
+  the mapped points. Hence, when a map changes, for example when the
+  'source' of a RegionMap is set on pan or zoom, every point held is
+  mapped again once, while appending under an unchanged chain maps only
+  the new points.
+
+  The 'mapped' and 'raw' fields return the held points in the order
+  appended as new PointArray objects, and 'toQPolygonF' returns the
+  mapped points ready for 'QPainter.drawPolyline'. The 'fullRecomputes'
+  and 'mappedPoints' counters report the work done. """
+
+  #  fallback variables
+  __fallback_capacity__ = 4096
+  __identity_coefficients__ = (1., 0., 0., 0., 1., 0.)
+
+  #  private variables
+  __ring_capacity__ = None
+  __map_chain__ = None
+  __raw_ring__ = None
+  __mapped_ring__ = None
+  __ring_head__ = 0
+  __ring_count__ = 0
+  __chain_coefficients__ = None
+  __full_recomputes__ = 0
+  __mapped_points__ = 0
+
+  #  public variables
+  capacity = Field()
+  maps = Field()
+
+  #  virtual variables
+  raw = Field()
+  mapped = Field()
+  coefficients = Field()
+  fullRecomputes = Field()
+  mappedPoints = Field()
+
+  #  getters and setters
+  @capacity.GET
+  def _getCapacity(self) -> int:
+    """Get the maximum number of points held."""
+    if self.__ring_capacity__ is None:
+      return self.__fallback_capacity__
+    return self.__ring_capacity__
+
+  @maps.GET
+  def _getMaps(self) -> tuple[AbstractMap, ...]:
+    """Get the chain of maps in the order they apply."""
+    if self.__map_chain__ is None:
+      return ()
+    return self.__map_chain__
+
+  @maps.SET
+  def _setMaps(self, maps: Any) -> None:
+    """Set the chain of maps in the order they apply."""
+    for map_ in maps:
+      if not isinstance(map_, AbstractMap):
+        raise TypeError(typeMsg('map', map_, AbstractMap))
+    self.__map_chain__ = (*maps,)
+
+  @coefficients.GET
+  def _getCoefficients(self) -> Coefficients:
+    """Get the affine coefficients of the composed chain of maps."""
+    out = self.__identity_coefficients__
+    for map_ in self.maps:
+      out = AbstractMap._composeCoefficients(map_.coefficients, out)
+    return out
+
+  @fullRecomputes.GET
+  def _getFullRecomputes(self) -> int:
+    """Get the number of times every held point was mapped again."""
+    return self.__full_recomputes__
+
+  @mappedPoints.GET
+  def _getMappedPoints(self) -> int:
+    """Get the total number of points mapped."""
+    return self.__mapped_points__
+
+  @raw.GET
+  def _getRaw(self) -> PointArray:
+    """Get the held points as appended."""
+    return PointArray._fromArray(self._unroll(self._getRawRing()))
+
+  @mapped.GET
+  def _getMapped(self) -> PointArray:
+    """Get the held points mapped by the current chain."""
+    self._syncChain()
+    return PointArray._fromArray(self._unroll(self._getMappedRing()))
+
+  def _getRawRing(self) -> array:
+    """Get the ring buffer of raw points."""
+    if self.__raw_ring__ is None:
+      self.__raw_ring__ = ops.zeros(2 * self.capacity)
+    return self.__raw_ring__
+
+  def _getMappedRing(self) -> array:
+    """Get the ring buffer of mapped points."""
+    if self.__mapped_ring__ is None:
+      self.__mapped_ring__ = ops.zeros(2 * self.capacity)
+    return self.__mapped_ring__
+
+  #  constructors
+  @overload(int, tuple)
+  @overload(int, list)
+  def __init__(self, capacity: int, maps: Any) -> None:
+    """Initialize with the given capacity and chain of maps."""
+    if capacity < 1:
+      raise ValueError("""'capacity' must be at least 1!""")
+    self.__ring_capacity__ = capacity
+    self.maps = maps
+
+  @overload(int, AbstractMap)
+  def __init__(self, capacity: int, map_: AbstractMap) -> None:
+    """Initialize with the given capacity and a single map."""
+    if TYPE_CHECKING:
+      assert callable(self.__init__)
+    self.__init__(capacity, [map_, ])
+
+  @overload(int)
+  def __init__(self, capacity: int) -> None:
+    """Initialize with the given capacity and no maps."""
+    if TYPE_CHECKING:
+      assert callable(self.__init__)
+    self.__init__(capacity, [])
+
+  @overload(AbstractMap)
+  def __init__(self, map_: AbstractMap) -> None:
+    """Initialize with the fallback capacity and a single map."""
+    if TYPE_CHECKING:
+      assert callable(self.__init__)
+    self.__init__(self.__fallback_capacity__, [map_, ])
+
+  @overload()
+  def __init__(self, ) -> None:
+    """Initialize with the fallback capacity and no maps."""
+
+  #  functionality
+  def _syncChain(self, ) -> None:
+    """Maps every held point again if the composed coefficients of the
+    chain differ from those the held points were mapped by."""
+    coefficients = self.coefficients
+    if coefficients == self.__chain_coefficients__:
+      return
+    self.__chain_coefficients__ = coefficients
+    if not self.__ring_count__:
+      return
+    self.__mapped_ring__ = ops.affine(self._getRawRing(), *coefficients)
+    self.__full_recomputes__ += 1
+    self.__mapped_points__ += self.__ring_count__
+
+  def _unroll(self, ring: array) -> array:
+    """Returns the held points of the ring in the order appended."""
+    head, count = self.__ring_head__, self.__ring_count__
+    if count < self.capacity:
+      return ring[:2 * count]
+    return ring[2 * head:] + ring[:2 * head]
+
+  def _write(self, ring: array, data: array) -> None:
+    """Writes the flat buffer into the ring starting at the head. The
+    buffer must not exceed the capacity."""
+    head, n, capacity = self.__ring_head__, len(data) // 2, self.capacity
+    first = min(n, capacity - head)
+    ring[2 * head:2 * (head + first)] = data[:2 * first]
+    if first < n:
+      ring[:2 * (n - first)] = data[2 * first:]
+
+  def append(self, points: Any) -> None:
+    """Appends a chunk of points, mapping only the new points. Accepts the
+    point batches accepted by 'AbstractMap.mapMany'. When the ring is
+    full, the oldest points are overwritten."""
+    data = AbstractMap._resolvePoints(points).data
+    capacity = self.capacity
+    if len(data) > 2 * capacity:
+      data = data[-2 * capacity:]
+    n = len(data) // 2
+    if not n:
+      return
+    self._syncChain()
+    mappedData = ops.affine(data, *self.__chain_coefficients__)
+    self._write(self._getRawRing(), data)
+    self._write(self._getMappedRing(), mappedData)
+    self.__ring_head__ = (self.__ring_head__ + n) % capacity
+    self.__ring_count__ = min(self.__ring_count__ + n, capacity)
+    self.__mapped_points__ += n
+
+  def extend(self, points: Any) -> None:
+    """Alias for 'append', as a chunk may hold any number of points."""
+    self.append(points)
+
+  def clear(self, ) -> None:
+    """Removes every held point."""
+    self.__ring_head__ = 0
+    self.__ring_count__ = 0
+
+  def toQPolygonF(self, ) -> QPolygonF:
+    """Returns the mapped points as a QPolygonF."""
+    self._syncChain()
+    return qtOps.toQPolygonF(self._unroll(self._getMappedRing()))
+
+  def __len__(self, ) -> int:
+    """Returns the number of points held."""
+    return self.__ring_count__
+
+  def __bool__(self, ) -> bool:
+    """Returns True if any points are held."""
+    return True if self.__ring_count__ else False
+
+  def __str__(self, ) -> str:
+    """Returns the string representation of the pipeline."""
+    infoSpec = """%s[%d of %d points, %d maps]"""
+    name = type(self).__name__
+    return infoSpec % (name, len(self), self.capacity, len(self.maps))
+
+  def __repr__(self, ) -> str:
+    """Returns the code representation of the pipeline."""
+    infoSpec = """%s(%d, %r)"""
+    name = type(self).__name__
+    return infoSpec % (name, self.capacity, [*self.maps, ])
@@ -3,7 +3,8 @@
 #  Copyright (c) 2025 Asger Jon Vistisen
 from __future__ import annotations
 
-from . import Point
+from . import Point, cacheDispatch
+from . import _buffer_ops as ops
 
 try:
   from typing import TYPE_CHECKING, Any
@@ -16,32 +17,55 @@ except ImportError:
 if TYPE_CHECKING:
   from typing import Self
 
+  from array import array
 
+
+@cacheDispatch
 class Vector(Point):
-  """Vector subclasses Point and provides a vector in 2D space."""
+  """Vector subclasses Point and provides a vector in 2D space. Batches of
+  vectors broadcast as for Point, resolving to VectorArray, and the dot
+  and cross products against a batch return an 'array.array' holding one
+  float per vector."""
+
+  @classmethod
+  def _getBatchType(cls) -> type:
+    """Returns the batch type holding many vectors."""
+    from . import VectorArray
+    return VectorArray
+
+  def _batchProduct(self, other: Any, cross: bool) -> array:
+    """Returns the dot or cross product of self with every vector in the
+    batch resolved from other, or NotImplemented."""
+    batch = self._resolveBatch(other)
+    if batch is None:
+      return NotImplemented
+    this = ops.broadcast(self.x, self.y, len(batch))
+    if cross:
+      return ops.crosses(this, batch.data)
+    return ops.dots(this, batch.data)
 
   def __mul__(self, other: Self) -> Any:
     """The * multiplication with float or int applies component wise,
     otherwise it applies the dot product."""
     if isinstance(other, (int, float)):
-      return Vector(self.x * other, self.y * other)
-    other = self._resolveOther(other)
-    if other is NotImplemented:
-      return NotImplemented
-    return self.x * other.x + self.y * other.y
+      return Vector._fromFloats(self.x * other, self.y * other)
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      return self._batchProduct(other, False)
+    return self.x * resolved.x + self.y * resolved.y
 
   def __matmul__(self, other: Self) -> Any:
     """The @ operator applies the cross product."""
     if isinstance(other, (int, float)):
-      return Vector(self.x * other, self.y * other)
-    other = self._resolveOther(other)
-    if other is NotImplemented:
-      return NotImplemented
-    return self.x * other.y - self.y * other.x
+      return Vector._fromFloats(self.x * other, self.y * other)
+    resolved = self._resolveOther(other)
+    if resolved is NotImplemented:
+      return self._batchProduct(other, True)
+    return self.x * resolved.y - self.y * resolved.x
 
   def __invert__(self) -> Self:
     """Returns the hat-vector. """
-    return Vector(-self.y, self.x)
+    return Vector._fromFloats(-self.y, self.x)
 
   def __rshift__(self, other: Any) -> Self:
     """The >> projects self onto other vector."""
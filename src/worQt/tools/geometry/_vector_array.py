@@ -0,0 +1,89 @@
+"""VectorArray subclasses PointArray and provides a batch of vectors. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from worktoy.text import typeMsg
+
+from . import PointArray, Vector, cacheDispatch
+from . import _buffer_ops as ops
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any, Self
+
+
+@cacheDispatch
+class VectorArray(PointArray):
+  """VectorArray subclasses PointArray and provides a batch of vectors.
+  Following the Vector class, the * operator applies the dot product and
+  the @ operator applies the cross product, when the other operand is a
+  vector or an array of vectors. Both return an 'array.array' holding one
+  float per vector. """
+
+  __item_type__ = Vector
+
+  def _resolveBuffer(self, other: Any) -> Any:
+    """Resolves other to a buffer of the same length as this array."""
+    other = self._resolveOther(other)
+    if isinstance(other, tuple):
+      return ops.broadcast(*other, len(self))
+    return other
+
+  def dot(self, other: Any) -> array:
+    """Returns the dot product of every vector with other."""
+    buffer = self._resolveBuffer(other)
+    if buffer is NotImplemented:
+      raise TypeError(typeMsg('other', other, Vector))
+    return ops.dots(self.data, buffer)
+
+  def cross(self, other: Any) -> array:
+    """Returns the cross product of every vector with other."""
+    buffer = self._resolveBuffer(other)
+    if buffer is NotImplemented:
+      raise TypeError(typeMsg('other', other, Vector))
+    return ops.crosses(self.data, buffer)
+
+  def __mul__(self, other: Any) -> Any:
+    """The * multiplication with float or int applies component wise,
+    otherwise it applies the dot product."""
+    if isinstance(other, (int, float)):
+      return PointArray.__mul__(self, other)
+    buffer = self._resolveBuffer(other)
+    if buffer is NotImplemented:
+      return NotImplemented
+    return ops.dots(self.data, buffer)
+
+  def __rmul__(self, other: Any) -> Any:
+    """The * multiplication with float or int applies component wise,
+    otherwise it applies the dot product."""
+    return self * other
+
+  def __matmul__(self, other: Any) -> array:
+    """The @ operator applies the cross product."""
+    buffer = self._resolveBuffer(other)
+    if buffer is NotImplemented:
+      return NotImplemented
+    return ops.crosses(self.data, buffer)
+
+  def __rmatmul__(self, other: Any) -> array:
+    """The @ operator applies the cross product."""
+    out = self @ other
+    if out is NotImplemented:
+      return NotImplemented
+    return ops.negate(out)
+
+  def __invert__(self) -> Self:
+    """Returns the hat-vectors. """
+    data = self.data
+    return self._fromArray(ops.interleave(ops.negate(data[1::2]),
+                                          data[0::2]))
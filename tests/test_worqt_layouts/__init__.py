@@ -0,0 +1,4 @@
+"""Testing the 'worQt.layouts' module."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
@@ -0,0 +1,137 @@
+"""TestLayoutFit tests the maximal free rectangles placing spanning
+widgets in WLayout."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+from math import inf
+from random import randint, random
+from unittest import TestCase
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+
+from worQt.layouts import LayoutSpan, WLayout
+from worQt.layouts._layout_fit import freeRectsOf, bestFit, fitScores
+from worQt.widgets import BaseWidget
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestLayoutFit(TestCase):
+  """TestLayoutFit tests the maximal free rectangles placing spanning
+  widgets in WLayout."""
+
+  @classmethod
+  def setUpClass(cls) -> None:
+    """Creates the application required by the widgets."""
+    cls.app = QApplication.instance() or QApplication([])
+
+  @staticmethod
+  def randMasks(n: int = 8) -> list[int]:
+    """Returns a random occupancy bitmap of n columns and rows."""
+    return [sum([1 << r for r in range(n) if random() < .4])
+            for _ in range(n)]
+
+  @staticmethod
+  def isFree(masks: list[int], L: int, T: int, R: int, B: int) -> bool:
+    """Returns True if no cell of the finite rectangle is occupied."""
+    rows = ((1 << (B - T + 1)) - 1) << T
+    for col in range(L, min(R, len(masks) - 1) + 1):
+      if masks[col] & rows:
+        return False
+    return True
+
+  def test_free_rects(self) -> None:
+    """Tests that the free rectangles are free, maximal and cover every
+    free cell."""
+    for _ in range(32):
+      masks = self.randMasks()
+      freeRects = freeRectsOf(masks)
+      for L, T, R, B in freeRects:
+        R, B = min(R, 9), min(B, 9)
+        self.assertTrue(self.isFree(masks, L, T, R, B))
+        if R < 9:
+          self.assertFalse(self.isFree(masks, L, T, R + 1, B))
+        if B < 9:
+          self.assertFalse(self.isFree(masks, L, T, R, B + 1))
+        if L:
+          self.assertFalse(self.isFree(masks, L - 1, T, R, B))
+        if T:
+          self.assertFalse(self.isFree(masks, L, T - 1, R, B))
+      for col in range(10):
+        for row in range(10):
+          if self.isFree(masks, col, row, col, row):
+            self.assertTrue(any([
+                L <= col <= R and T <= row <= B
+                for L, T, R, B in freeRects]))
+
+  def test_best_fit(self) -> None:
+    """Tests that the best fit equals the best of every free position."""
+    for _ in range(32):
+      masks = self.randMasks()
+      width, height = randint(1, 4), randint(1, 4)
+      freeRects = freeRectsOf(masks)
+      for score in fitScores.values():
+        L, T = bestFit(freeRects, width, height, 8, 8, score)
+        self.assertTrue(self.isFree(masks, L, T, L + width - 1,
+                                    T + height - 1))
+        expected = min([
+            score(col, row, width, height, 8, 8)
+            for col in range(9) for row in range(9)
+            if self.isFree(masks, col, row, col + width - 1,
+                           row + height - 1)])
+        self.assertEqual(score(L, T, width, height, 8, 8), expected)
+
+  def test_fit_widget(self) -> None:
+    """Tests that spanning widgets never overlap."""
+    for name in [*fitScores, None]:
+      layout = WLayout()
+      widgets = []
+      for _ in range(24):
+        widget = BaseWidget()
+        widgets.append(widget)
+        if random() < .5:
+          layout.addWidget(widget)
+          continue
+        span = LayoutSpan(randint(1, 3), randint(1, 3))
+        rect = layout.fitWidget(widget, span, score=name)
+        self.assertEqual((rect.height, rect.width), (span.row, span.col))
+      cells = 0
+      for widget in widgets:
+        rect = layout.getRect(widget)
+        cells += rect.width * rect.height
+      self.assertEqual(cells, len(layout._getCells()))
+
+  def test_no_fit(self) -> None:
+    """Tests that spanning widgets are placed below the occupied cells
+    when no free rectangle is large enough."""
+    layout = WLayout()
+    layout.addWidget(BaseWidget(), 0, 0, 1, 1)
+    with patch.object(WLayout, '_getFreeRects', return_value=[]):
+      rect = layout.fitWidget(BaseWidget(), LayoutSpan(2, 3))
+    self.assertEqual((rect.left, rect.top), (0, 2))
+    self.assertEqual((rect.right, rect.bottom), (2, 3))
+    self.assertEqual(len(layout._getCells()), 10)
+
+  def test_scores(self) -> None:
+    """Tests that the scores place spanning widgets as named."""
+    for name, expected in [('rowMajor', (2, 0)), ('colMajor', (0, 2)),
+                           ('compact', (1, 1))]:
+      layout = WLayout()
+      layout.addWidget(BaseWidget(), 0, 0, 1, 0)
+      layout.addWidget(BaseWidget(), 0, 1, 0, 1)
+      rect = layout.fitWidget(BaseWidget(), LayoutSpan(1, 2), score=name)
+      self.assertEqual((rect.left, rect.top), expected)
+    with self.assertRaises(ValueError):
+      WLayout().fitWidget(BaseWidget(), LayoutSpan(1, 1), score='bad')
+    self.assertEqual(freeRectsOf([]), [(0, 0, inf, inf)])
@@ -0,0 +1,82 @@
+"""TestLayoutIndex tests the interning of LayoutIndex and LayoutSpan."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from unittest import TestCase
+
+from moreworktoy.waitaminute import WriteOnceError
+from worQt.layouts import LayoutIndex, LayoutSpan
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestLayoutIndex(TestCase):
+  """TestLayoutIndex tests the interning of LayoutIndex and LayoutSpan."""
+
+  def test_interned(self) -> None:
+    """Tests that every overload of small coordinates returns the same
+    instance."""
+    index = LayoutIndex(3, 4)
+    self.assertIs(LayoutIndex(3, 4), index)
+    self.assertIs(LayoutIndex((3, 4)), index)
+    self.assertIs(LayoutIndex([3, 4]), index)
+    self.assertIs(LayoutIndex(index), index)
+    self.assertIs(LayoutIndex(2), LayoutIndex(2, 2))
+    self.assertEqual(index.row, 3)
+    self.assertEqual(index.col, 4)
+
+  def test_not_interned(self) -> None:
+    """Tests that negative and large coordinates create equal but new
+    instances."""
+    for row, col in [(-1, 2), (2, -1), (1000, 3)]:
+      index = LayoutIndex(row, col)
+      self.assertIsNot(LayoutIndex(row, col), index)
+      self.assertEqual(LayoutIndex(row, col), index)
+      self.assertEqual(hash(LayoutIndex(row, col)), hash(index))
+      self.assertEqual(tuple(index), (row, col))
+    self.assertEqual(LayoutIndex(row=1, col=2), LayoutIndex(1, 2))
+    self.assertEqual(LayoutIndex(), LayoutIndex(0, 0))
+
+  def test_span(self) -> None:
+    """Tests that spans are interned apart from indices."""
+    span = LayoutSpan(2, 3)
+    self.assertIs(LayoutSpan(2, 3), span)
+    self.assertIs(LayoutSpan((2, 3)), span)
+    self.assertIsInstance(span, LayoutSpan)
+    self.assertIsInstance(LayoutIndex(2, 3), LayoutIndex)
+    self.assertNotIsInstance(LayoutIndex(2, 3), LayoutSpan)
+    self.assertEqual(span, LayoutIndex(2, 3))
+    self.assertEqual(span.nRows, 2)
+    self.assertEqual(span.nCols, 3)
+    self.assertEqual(len(span), 6)
+
+  def test_immutable(self) -> None:
+    """Tests that interned indices cannot be changed."""
+    index = LayoutIndex(5, 6)
+    with self.assertRaises(WriteOnceError):
+      index.row = 7
+    self.assertIs(LayoutIndex(5, 6), index)
+    self.assertEqual(index.row, 5)
+
+  def test_dict_keys(self) -> None:
+    """Tests that indices are usable as dictionary keys."""
+    cells = {LayoutIndex(r, c): r * 10 + c for r in range(4) for c in
+             range(4)}
+    self.assertEqual(cells[LayoutIndex((2, 3))], 23)
+    self.assertEqual(cells[LayoutSpan(1, 1)], 11)
+    self.assertNotIn(LayoutIndex(-1, 0), cells)
+    self.assertNotEqual(LayoutIndex(1, 2), (1, 2))
+
+  def test_type_errors(self) -> None:
+    """Tests that invalid arguments still raise."""
+    with self.assertRaises(ValueError):
+      LayoutIndex((1, 2, 3))
+    with self.assertRaises(TypeError):
+      LayoutIndex((1., 2))
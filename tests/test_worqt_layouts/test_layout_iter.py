@@ -0,0 +1,58 @@
+"""TestLayoutIter tests iteration over LayoutIndex and LayoutRect."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from random import randint
+from unittest import TestCase
+
+from worQt.layouts import LayoutIndex, LayoutRect
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestLayoutIter(TestCase):
+  """TestLayoutIter tests iteration over LayoutIndex and LayoutRect."""
+
+  @staticmethod
+  def randRect() -> LayoutRect:
+    """Returns a random rectangle."""
+    left, top = randint(0, 8), randint(0, 8)
+    return LayoutRect(left, top, left + randint(0, 8), top + randint(0, 8))
+
+  def test_index_unpack(self) -> None:
+    """Tests unpacking an index to row and column."""
+    row, col = LayoutIndex(randint(0, 8), randint(0, 8))
+    index = LayoutIndex(row, col)
+    self.assertEqual((index.row, index.col), (row, col))
+    self.assertEqual([*index, *index], [row, col, row, col])
+
+  def test_rect_iter(self) -> None:
+    """Tests that a rectangle yields each of its indices once."""
+    for _ in range(16):
+      rect = self.randRect()
+      indices = [*rect]
+      self.assertEqual(len(indices), len(rect))
+      self.assertEqual(len(set(indices)), len(rect))
+      for index in indices:
+        self.assertIn(index, rect)
+      bounds = LayoutRect.fromIndices(*indices)
+      self.assertEqual(bounds.left, rect.left)
+      self.assertEqual(bounds.top, rect.top)
+      self.assertEqual(bounds.right, rect.right)
+      self.assertEqual(bounds.bottom, rect.bottom)
+
+  def test_nested_iter(self) -> None:
+    """Tests that nested iteration over the same rectangle is safe."""
+    rect = self.randRect()
+    pairs = [(a, b) for a in rect for b in rect]
+    self.assertEqual(len(pairs), len(rect) ** 2)
+    first, second = iter(rect), iter(rect)
+    self.assertEqual(next(first), next(second))
+    self.assertEqual([*first], [*rect][1:])
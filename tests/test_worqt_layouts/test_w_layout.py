@@ -0,0 +1,225 @@
+"""TestWLayout tests the occupancy bitmap of WLayout."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication, QGridLayout
+
+from worQt.layouts import LayoutIndex, LayoutRect, WLayout
+from worQt.widgets import BaseWidget
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from typing import Any
+
+
+class CountingWidget(BaseWidget):
+  """CountingWidget counts the calls to 'initUi'."""
+
+  initCount = 0
+
+  def initUi(self, ) -> None:
+    """Counts the call."""
+    self.initCount += 1
+
+
+class TestWLayout(TestCase):
+  """TestWLayout tests the occupancy bitmap of WLayout."""
+
+  @classmethod
+  def setUpClass(cls) -> None:
+    """Creates the application required by the widgets."""
+    cls.app = QApplication.instance() or QApplication([])
+
+  @staticmethod
+  def cells(layout: WLayout) -> list[tuple[int, int]]:
+    """Returns the occupied cells of the layout as sorted pairs."""
+    return sorted([(i.row, i.col) for i in layout._getWidgetDict()])
+
+  def test_auto_placement(self) -> None:
+    """Tests that widgets fill growing squares at the top left, each
+    column from the bottom."""
+    layout = WLayout()
+    placed = []
+    for _ in range(9):
+      index = layout._nextIndex()
+      placed.append((index.row, index.col))
+      layout.addWidget(BaseWidget())
+    expected = [(0, 0), (1, 0), (1, 1), (0, 1), (2, 0), (2, 1), (2, 2),
+                (1, 2), (0, 2)]
+    self.assertEqual(placed, expected)
+    self.assertEqual((layout.nRows, layout.nCols), (3, 3))
+
+  def test_fill_gaps(self) -> None:
+    """Tests that auto-placement fills the gaps left by explicit
+    placement."""
+    layout = WLayout()
+    layout.addWidget(BaseWidget(), 0, 0, 1, 1)
+    layout.addWidget(BaseWidget(), LayoutIndex(1, 3))
+    layout.addWidget(BaseWidget())
+    self.assertIn(LayoutIndex(2, 0), layout)
+    self.assertEqual([(i.row, i.col) for i in layout._getEmptyEdges()],
+                     [(2, 1), (2, 2), (1, 2), (0, 2)])
+
+  def test_normalize(self) -> None:
+    """Tests that indices are shifted such that the top row and left
+    column are 0."""
+    layout = WLayout()
+    layout.addWidget(BaseWidget(), 2, 3, 3, 4)
+    self.assertEqual(self.cells(layout), [(0, 0), (0, 1), (1, 0), (1, 1)])
+    layout.addWidget(BaseWidget(), LayoutIndex(-1, -2))
+    self.assertEqual(self.cells(layout),
+                     [(0, 0), (1, 2), (1, 3), (2, 2), (2, 3)])
+    self.assertEqual((layout.nRows, layout.nCols), (3, 4))
+    self.assertIn(LayoutIndex(1, 2), layout)
+    self.assertNotIn(LayoutIndex(0, 1), layout)
+
+  def test_contains(self) -> None:
+    """Tests membership of indices and rectangles."""
+    layout = WLayout()
+    for _ in range(12):
+      layout.addWidget(BaseWidget())
+    self.assertIn(LayoutIndex(3, 0), layout)
+    self.assertIn(LayoutRect(0, 0, 2, 2), layout)
+    self.assertIn(LayoutRect(0, 3, 2, 3), layout)
+    self.assertNotIn(LayoutRect(0, 0, 3, 3), layout)
+    self.assertNotIn(LayoutIndex(-1, 0), layout)
+    self.assertNotIn(LayoutIndex(0, 5), layout)
+    edges = layout._getOuterEdges()
+    self.assertEqual(len(edges), 9)
+    for index in edges:
+      self.assertNotIn(index, layout)
+
+  def test_empty(self) -> None:
+    """Tests the empty layout."""
+    layout = WLayout()
+    self.assertEqual((layout.nRows, layout.nCols), (0, 0))
+    self.assertNotIn(LayoutIndex(0, 0), layout)
+    index = layout._nextIndex()
+    self.assertEqual((index.row, index.col), (0, 0))
+
+  @staticmethod
+  def edges(rect: LayoutRect) -> tuple[int, int, int, int]:
+    """Returns the edges of the rectangle."""
+    return rect.left, rect.top, rect.right, rect.bottom
+
+  def test_widget_rects(self) -> None:
+    """Tests that the rectangle of every widget is maintained."""
+    layout = WLayout()
+    big, small, auto = BaseWidget(), BaseWidget(), BaseWidget()
+    layout.addWidget(big, 1, 1, 2, 3)
+    layout.addWidget(small, LayoutIndex(0, 3))
+    layout.addWidget(auto)
+    self.assertEqual(self.edges(layout.getRect(big)), (0, 0, 1, 2))
+    self.assertEqual(self.edges(layout.getRect(small)), (3, 0, 3, 0))
+    self.assertEqual(self.edges(layout.getRect(auto)), (2, 2, 2, 2))
+    layout.addWidget(small, LayoutIndex(-1, -1))
+    self.assertEqual(self.edges(layout.getRect(big)), (1, 1, 2, 3))
+    self.assertEqual(self.edges(layout.getRect(auto)), (3, 3, 3, 3))
+    self.assertEqual(self.edges(layout.getRect(small)), (0, 0, 4, 1))
+    rects = layout._getRectWidgets()
+    self.assertEqual(len(rects), 3)
+    for rect, widget in rects.items():
+      self.assertEqual(self.edges(rect), self.edges(layout.getRect(widget)))
+    with self.assertRaises(KeyError):
+      layout.getRect(BaseWidget())
+
+  def test_overwrite(self) -> None:
+    """Tests that a widget losing cells to another widget shrinks, and is
+    removed once it has none."""
+    layout = WLayout()
+    first, second, third = BaseWidget(), BaseWidget(), BaseWidget()
+    layout.addWidget(first, 0, 0, 2, 0)
+    layout.addWidget(second, 2, 0, 2, 0)
+    layout.addWidget(third, 1, 0, 1, 0)
+    self.assertEqual(self.edges(layout.getRect(first)), (0, 0, 0, 0))
+    layout.addWidget(third, 0, 0, 0, 0)
+    self.assertNotIn(first, layout._getWidgets())
+    self.assertEqual(layout._getWidgets(), [second, third])
+    self.assertEqual(layout.build().count(), 2)
+
+  @staticmethod
+  def position(layout: Any, widget: BaseWidget) -> tuple:
+    """Returns the (row, col, rowSpan, colSpan) of the widget in the
+    QGridLayout."""
+    return (*layout.getItemPosition(layout.indexOf(widget)),)
+
+  def test_remove(self) -> None:
+    """Tests that removing a widget frees its cells and normalizes when
+    the layout is built."""
+    layout = WLayout()
+    first, second = BaseWidget(), BaseWidget()
+    layout.addWidget(first, 0, 0, 0, 1)
+    layout.addWidget(second, 1, 2, 2, 3)
+    layout.removeWidget(first)
+    self.assertEqual(self.edges(layout.getRect(second)), (1, 2, 2, 3))
+    layout.build()
+    self.assertEqual(self.cells(layout), [(0, 0), (0, 1), (1, 0), (1, 1)])
+    self.assertEqual(self.edges(layout.getRect(second)), (0, 0, 1, 1))
+    self.assertEqual((layout.nRows, layout.nCols), (2, 2))
+    index = layout._nextIndex()
+    self.assertEqual((index.row, index.col), (2, 0))
+    layout.removeWidget(second)
+    self.assertEqual((layout.nRows, layout.nCols), (0, 0))
+    with self.assertRaises(KeyError):
+      layout.removeWidget(second)
+
+  def test_move(self) -> None:
+    """Tests that moving a widget out of the top left cell leaves the
+    other widgets in place, such that rebuilding replaces only the moved
+    widget."""
+    layout = WLayout()
+    a, b, c = BaseWidget(), BaseWidget(), BaseWidget()
+    layout.addWidget(a, 0, 0, 0, 0)
+    layout.addWidget(b, 1, 0, 1, 0)
+    layout.addWidget(c, 1, 1, 1, 1)
+    layout.build()
+    layout.moveWidget(a, 0, 1, 0, 1)
+    self.assertEqual(self.edges(layout.getRect(a)), (0, 1, 0, 1))
+    self.assertEqual(self.edges(layout.getRect(b)), (1, 0, 1, 0))
+    self.assertEqual(self.edges(layout.getRect(c)), (1, 1, 1, 1))
+    self.assertEqual(self.cells(layout), [(0, 1), (1, 0), (1, 1)])
+    with patch.object(QGridLayout, 'removeWidget', autospec=True) as rm:
+      layout.rebuild()
+    self.assertEqual([call.args[1] for call in rm.call_args_list], [a, ])
+
+  def test_rebuild(self) -> None:
+    """Tests that rebuilding patches the built layout and initializes
+    each widget once."""
+    layout = WLayout()
+    widgets = [CountingWidget() for _ in range(9)]
+    for widget in widgets:
+      layout.addWidget(widget)
+    grid = layout.build()
+    self.assertIs(layout.rebuild(), grid)
+    layout.moveWidget(widgets[4], 3, 0, 3, 1)
+    layout.removeWidget(widgets[8])
+    extra = CountingWidget()
+    layout.addWidget(extra, LayoutIndex(0, 2))
+    self.assertIs(layout.rebuild(), grid)
+    self.assertEqual(grid.count(), 9)
+    self.assertEqual(grid.indexOf(widgets[8]), -1)
+    self.assertEqual(self.position(grid, widgets[4]), (0, 3, 2, 1))
+    self.assertEqual(self.position(grid, extra), (0, 2, 1, 1))
+    for widget in [*widgets, extra]:
+      self.assertEqual(widget.initCount, 1)
+      if widget is widgets[8]:
+        continue
+      L, T, R, B = self.edges(layout.getRect(widget))
+      self.assertEqual(self.position(grid, widget),
+                       (T, L, B - T + 1, R - L + 1))
+    layout.build()
+    self.assertEqual(extra.initCount, 1)
@@ -9,6 +9,7 @@ from unittest import TestCase
 from math import pi
 
 from worQt.tools.geometry import Point, Region, Size, Vector
+from worQt.tools.geometry import PointArray, VectorArray
 
 try:
   from typing import TYPE_CHECKING
@@ -112,3 +113,13 @@ class AbstractTest(TestCase):
   def randPointVector(cls, ) -> tuple[Point, Vector]:
     """Creates a random point and random vector"""
     return cls.randPoint(), cls.randVector()
+
+  @classmethod
+  def randPointArray(cls, n: int = 64) -> PointArray:
+    """Creates a random point array"""
+    return PointArray([cls.randFloats() for _ in range(n)])
+
+  @classmethod
+  def randVectorArray(cls, n: int = 64) -> VectorArray:
+    """Creates a random vector array"""
+    return VectorArray([cls.randFloats() for _ in range(n)])
@@ -0,0 +1,5 @@
+"""The 'test_arrays' test module tests the batch geometry types in the
+worQt.tools.geometry module. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
@@ -0,0 +1,140 @@
+"""TestPointArray tests the PointArray class."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from worQt.tools.geometry import PointArray, PointView, Point
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestPointArray(AbstractTest):
+  """TestPointArray tests the PointArray class."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.points = [self.randPoint() for _ in range(64)]
+    self.array = PointArray(self.points)
+
+  def test_init(self) -> None:
+    """Tests that PointArray accepts points, pairs, complex numbers and
+    flat buffers."""
+    pairs = PointArray([(p.x, p.y) for p in self.points])
+    numbers = PointArray([complex(p) for p in self.points])
+    flat = PointArray(array('d', self.array.data))
+    buffer = PointArray.fromBuffer(memoryview(self.array.data))
+    for other in [pairs, numbers, flat, buffer, PointArray(self.array)]:
+      self.assertEqual(other, self.array)
+    self.assertEqual(len(PointArray(7)), 7)
+    self.assertFalse(PointArray())
+    with self.assertRaises(ValueError):
+      PointArray.fromBuffer(array('d', [1.0, 2.0, 3.0]))
+
+  def test_view(self) -> None:
+    """Tests that indexing returns a view writing through to the buffer."""
+    view = self.array[3]
+    self.assertIsInstance(view, PointView)
+    self.assertAlmostEqual(view.x, self.points[3].x)
+    self.assertAlmostEqual(view.y, self.points[3].y)
+    self.assertAlmostEqual(self.array[-1].x, self.points[-1].x)
+    view.x, view.y = 69., 420.
+    self.assertEqual(self.array.data[6], 69.)
+    self.assertEqual(self.array.data[7], 420.)
+    x, y = view
+    self.assertEqual(complex(view), x + y * 1j)
+    self.assertIsInstance(view.toPoint(), Point)
+    with self.assertRaises(IndexError):
+      _ = self.array[len(self.array)]
+
+  def test_slice(self) -> None:
+    """Tests that slicing returns a new array."""
+    sliced = self.array[1:9:2]
+    self.assertIsInstance(sliced, PointArray)
+    self.assertEqual(len(sliced), 4)
+    for view, point in zip(sliced, self.points[1:9:2]):
+      self.assertAlmostEqual(view.x, point.x)
+      self.assertAlmostEqual(view.y, point.y)
+
+  def test_add(self) -> None:
+    """Tests addition of arrays, points, tuples, complex and scalars."""
+    other = self.randPointArray(len(self.points))
+    point = self.randPoint()
+    scalar = self.randFloat()
+    z = self.randComplex()
+    sums = [
+        (self.array + other, [p + q for p, q in zip(self.points, other)]),
+        (self.array + point, [p + point for p in self.points]),
+        (point + self.array, [p + point for p in self.points]),
+        (self.array + scalar, [p + scalar for p in self.points]),
+        (self.array + z, [p + z for p in self.points]),
+        (self.array + (1, 2), [p + (1, 2) for p in self.points]),
+    ]
+    for actual, expected in sums:
+      for view, point in zip(actual, expected):
+        self.assertAlmostEqual(view.x, point.x)
+        self.assertAlmostEqual(view.y, point.y)
+
+  def test_sub(self) -> None:
+    """Tests subtraction of arrays, points and scalars."""
+    other = self.randPointArray(len(self.points))
+    point = self.randPoint()
+    diffs = [
+        (self.array - other, [p - q for p, q in zip(self.points, other)]),
+        (self.array - point, [p - point for p in self.points]),
+        (point - self.array, [point - p for p in self.points]),
+        (-self.array, [-p for p in self.points]),
+    ]
+    for actual, expected in diffs:
+      for view, point in zip(actual, expected):
+        self.assertAlmostEqual(view.x, point.x)
+        self.assertAlmostEqual(view.y, point.y)
+    with self.assertRaises(ValueError):
+      _ = self.array - self.randPointArray(len(self.points) + 1)
+
+  def test_mul_div(self) -> None:
+    """Tests scalar multiplication and division."""
+    scalar = self.randFloat()
+    for actual, expected in [
+        (self.array * scalar, [p * scalar for p in self.points]),
+        (scalar * self.array, [p * scalar for p in self.points]),
+        (self.array / scalar, [p / scalar for p in self.points]),
+    ]:
+      for view, point in zip(actual, expected):
+        self.assertAlmostEqual(view.x, point.x)
+        self.assertAlmostEqual(view.y, point.y)
+    with self.assertRaises(ZeroDivisionError):
+      _ = self.array / 0
+    with self.assertRaises(TypeError):
+      _ = self.array * self.array
+
+  def test_abs(self) -> None:
+    """Tests that abs returns the length of every point."""
+    for actual, point in zip(abs(self.array), self.points):
+      self.assertAlmostEqual(actual, abs(point))
+
+  def test_in_place(self) -> None:
+    """Tests that the in place operators update the buffer in place, such
+    that views taken before see the result."""
+    point = self.randPoint()
+    arr = PointArray(self.array)
+    data, fifth = arr.data, arr[5]
+    arr += point
+    arr *= 2
+    arr -= point
+    arr /= 2
+    for view, p in zip(arr, self.points):
+      self.assertAlmostEqual(view.x, (2 * (p.x + point.x) - point.x) / 2)
+      self.assertAlmostEqual(view.y, (2 * (p.y + point.y) - point.y) / 2)
+    self.assertIs(arr.data, data)
+    self.assertEqual((fifth.x, fifth.y), (arr.data[10], arr.data[11]))
+    fifth.x = 69.
+    self.assertEqual(arr[5].x, 69.)
@@ -0,0 +1,101 @@
+"""TestSimplify tests the simplification of polylines in screen space."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from math import floor, hypot, sin
+from random import random
+
+from worQt.tools.geometry import PointArray, VectorArray, simplify
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestSimplify(AbstractTest):
+  """TestSimplify tests the simplification of polylines in screen
+  space."""
+
+  def setUp(self) -> None:
+    """Set up a noisy trace of 5000 points 250 pixels wide."""
+    xs = [0.05 * i for i in range(5000)]
+    ys = [50. * sin(0.02 * x) + 5. * random() for x in xs]
+    self.trace = PointArray.fromColumns(xs, ys)
+
+  @staticmethod
+  def segmentDistance(point: tuple, start: tuple, end: tuple) -> float:
+    """Returns the distance from the point to the segment."""
+    (x, y), (x0, y0), (x1, y1) = point, start, end
+    dx, dy = x1 - x0, y1 - y0
+    if not dx and not dy:
+      return hypot(x - x0, y - y0)
+    t = ((x - x0) * dx + (y - y0) * dy) / (dx * dx + dy * dy)
+    t = min(1., max(0., t))
+    return hypot(x - x0 - t * dx, y - y0 - t * dy)
+
+  def assertSubsequence(self, simple: PointArray) -> list[int]:
+    """Asserts that the simplified points are a subsequence of the trace
+    keeping both ends and returns their indices."""
+    pairs = [*zip(self.trace.x, self.trace.y)]
+    indices, start = [], 0
+    for pair in zip(simple.x, simple.y):
+      start = pairs.index(pair, start)
+      indices.append(start)
+    self.assertEqual(indices[0], 0)
+    self.assertEqual(indices[-1], len(pairs) - 1)
+    return indices
+
+  def test_minmax(self) -> None:
+    """Tests that min/max decimation keeps at most four points and the
+    extremes of every pixel column."""
+    simple = simplify(self.trace, 1.)
+    self.assertSubsequence(simple)
+    columns = {}
+    for x, y in zip(self.trace.x, self.trace.y):
+      columns.setdefault(floor(x), []).append(y)
+    self.assertLessEqual(len(simple), 4 * len(columns))
+    simpleColumns = {}
+    for x, y in zip(simple.x, simple.y):
+      simpleColumns.setdefault(floor(x), []).append(y)
+    for column, ys in columns.items():
+      self.assertEqual(min(ys), min(simpleColumns[column]))
+      self.assertEqual(max(ys), max(simpleColumns[column]))
+
+  def test_rdp(self) -> None:
+    """Tests that every removed point lies within the tolerance of the
+    simplified polyline."""
+    tolerance = 2.
+    simple = self.trace.simplify(tolerance, 'rdp')
+    self.assertLess(len(simple), len(self.trace))
+    indices = self.assertSubsequence(simple)
+    pairs = [*zip(self.trace.x, self.trace.y)]
+    for first, last in zip(indices, indices[1:]):
+      for i in range(first + 1, last):
+        distance = self.segmentDistance(pairs[i], pairs[first],
+                                        pairs[last])
+        self.assertLessEqual(distance, tolerance + 1e-9)
+
+  def test_short(self) -> None:
+    """Tests that short and straight polylines are handled."""
+    self.assertEqual(len(simplify([], 1.)), 0)
+    self.assertEqual(len(simplify([(0., 0.)], 1., 'rdp')), 1)
+    line = [(float(i), 2. * i) for i in range(100)]
+    self.assertEqual(len(simplify(line, 0.1, 'rdp')), 2)
+
+  def test_types(self) -> None:
+    """Tests the preservation of subclasses and the validation of the
+    arguments."""
+    vectors = VectorArray(self.trace.toList())
+    self.assertIsInstance(simplify(vectors, 1.), VectorArray)
+    with self.assertRaises(ValueError):
+      simplify(self.trace, 0.)
+    with self.assertRaises(ValueError):
+      simplify(self.trace, 1., 'magic')
+    with self.assertRaises(TypeError):
+      simplify(self.trace, '1')
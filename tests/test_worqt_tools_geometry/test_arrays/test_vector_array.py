@@ -0,0 +1,67 @@
+"""TestVectorArray tests the VectorArray class."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worQt.tools.geometry import VectorArray, Vector
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestVectorArray(AbstractTest):
+  """TestVectorArray tests the VectorArray class."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.vectors = [self.randVector() for _ in range(64)]
+    self.array = VectorArray(self.vectors)
+
+  def test_items(self) -> None:
+    """Tests that the items materialize as vectors."""
+    for vector in self.array.toList():
+      self.assertIsInstance(vector, Vector)
+    self.assertIsInstance(self.array[0].toPoint(), Vector)
+    self.assertIsInstance(self.array * 2, VectorArray)
+
+  def test_dot(self) -> None:
+    """Tests the dot product against arrays and single vectors."""
+    other = self.randVectorArray(len(self.vectors))
+    vector = self.randVector()
+    for actual, v, w in zip(self.array * other, self.vectors, other):
+      self.assertAlmostEqual(actual, v * w.toPoint())
+    for actual, v in zip(self.array.dot(vector), self.vectors):
+      self.assertAlmostEqual(actual, v * vector)
+
+  def test_cross(self) -> None:
+    """Tests the cross product against arrays and single vectors."""
+    other = self.randVectorArray(len(self.vectors))
+    vector = self.randVector()
+    for actual, v, w in zip(self.array @ other, self.vectors, other):
+      self.assertAlmostEqual(actual, v @ w.toPoint())
+    for actual, v in zip(self.array.cross(vector), self.vectors):
+      self.assertAlmostEqual(actual, v @ vector)
+
+  def test_unsupported(self) -> None:
+    """Tests that the named products raise on unsupported operands, while
+    the operators return NotImplemented."""
+    for other in ([1, 2, 3], None, 'ab'):
+      with self.assertRaises(TypeError):
+        self.array.dot(other)
+      with self.assertRaises(TypeError):
+        self.array.cross(other)
+    self.assertIs(self.array.__mul__(None), NotImplemented)
+    self.assertIs(self.array.__matmul__(None), NotImplemented)
+    with self.assertRaises(TypeError):
+      _ = self.array @ None
+
+  def test_invert(self) -> None:
+    """Tests that the hat-vectors are orthogonal to the vectors."""
+    for actual in self.array * ~self.array:
+      self.assertAlmostEqual(actual, 0)
@@ -0,0 +1,105 @@
+"""TestDispatchCache tests the DispatchCache class."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worktoy.mcls import BaseObject
+from worktoy.static import Dispatch, overload
+from worktoy.waitaminute import DispatchException
+
+from worQt.tools.geometry import Point, Vector, RotateMap, DispatchCache
+from worQt.tools.geometry import cacheDispatch, dispatchCacheInfo
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestDispatchCache(AbstractTest):
+  """TestDispatchCache tests the DispatchCache class."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.dispatch = DispatchCache(Point.__dict__['__init__'], 2)
+
+  def call(self, *args) -> Point:
+    """Calls the cached constructor on a new Point."""
+    point = object.__new__(Point)
+    self.dispatch.__get__(point, Point)(*args)
+    return point
+
+  def test_installed(self) -> None:
+    """Tests that the decorated classes use DispatchCache."""
+    for cls in [Point, Vector, RotateMap]:
+      self.assertIsInstance(cls.__dict__['__init__'], DispatchCache)
+    self.assertIn('__call__', dispatchCacheInfo(RotateMap))
+
+  def test_counters(self) -> None:
+    """Tests the hit and miss counters."""
+    for _ in range(8):
+      point = self.call(*self.randFloats())
+      self.assertIsInstance(point.x, float)
+    self.assertEqual(self.dispatch.misses, 1)
+    self.assertEqual(self.dispatch.hits, 7)
+    self.dispatch.cacheClear()
+    self.assertEqual(self.dispatch.cacheInfo(), dict(
+        hits=0, misses=0, size=0, maxSize=2))
+
+  def test_bounded(self) -> None:
+    """Tests that the cache never exceeds its maximum size."""
+    for args in [(1., 2.), (1, 2), (1., 2), (1, 2.), 1j, Point(1, 2)]:
+      point = self.call(*(args if isinstance(args, tuple) else (args,)))
+      self.assertLessEqual(self.dispatch.size, 2)
+      self.assertIsInstance(point, Point)
+
+  def test_flex(self) -> None:
+    """Tests that inexact types still reach the flexible path."""
+    for _ in range(2):
+      point = self.call(True, False)
+      self.assertEqual((point.x, point.y), (1., 0.))
+      point = self.call((1, 2))
+      self.assertEqual((point.x, point.y), (1., 2.))
+    with self.assertRaises(DispatchException):
+      self.call(object())
+
+  def test_rejected(self) -> None:
+    """Tests that a DispatchException raised by the exact match falls
+    through to the flexible path, as in Dispatch."""
+
+    class Probe(BaseObject):
+      """Rejects negative integers in the exact match."""
+
+      @overload(float)
+      def probe(self, value: float) -> str:
+        """Accepts floats."""
+        return 'float'
+
+      @overload(int)
+      def probe(self, value: int) -> str:
+        """Accepts non-negative integers."""
+        if value < 0:
+          raise DispatchException(type(self).__dict__['probe'], value)
+        return 'int'
+
+    expected = [Probe().probe(value) for value in (1, -1, -1)]
+    self.assertEqual(expected, ['int', 'float', 'float'])
+    Cached = cacheDispatch(Probe)
+    self.assertIsInstance(Cached.__dict__['probe'], DispatchCache)
+    actual = [Cached().probe(value) for value in (1, -1, -1)]
+    self.assertEqual(actual, expected)
+
+  def test_subclass(self) -> None:
+    """Tests decorating a subclass of a decorated class."""
+
+    class Undecorated(Point):
+      """Subclass without the decorator."""
+
+    self.assertIs(type(Undecorated.__dict__['__init__']), Dispatch)
+    Decorated = cacheDispatch(Undecorated)
+    self.assertIsInstance(Decorated.__dict__['__init__'], DispatchCache)
+    self.assertEqual(Decorated(1, 2).x, 1.)
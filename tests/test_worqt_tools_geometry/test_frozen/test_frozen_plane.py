@@ -0,0 +1,138 @@
+"""TestFrozenPlane tests the immutable counterparts to the Plane
+classes."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+import pickle
+import sys
+
+from worQt.tools.geometry import Plane, Point, Vector, Size, FrozenPlane
+from worQt.tools.geometry import FrozenPoint, FrozenVector, FrozenSize
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestFrozenPlane(AbstractTest):
+  """TestFrozenPlane tests the immutable counterparts to the Plane
+  classes."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.types = {
+        Plane : FrozenPlane,
+        Point : FrozenPoint,
+        Vector: FrozenVector,
+        Size  : FrozenSize,
+    }
+
+  def test_init(self) -> None:
+    """Tests the accepted constructor arguments."""
+    x, y = self.randFloats()
+    for frozenType in self.types.values():
+      expected = (x, y)
+      for frozen in [
+          frozenType(x, y),
+          frozenType((x, y)),
+          frozenType([x, y]),
+          frozenType(x + y * 1j),
+          frozenType(Point(x, y)),
+          frozenType(frozenType(x, y)),
+      ]:
+        self.assertIs(type(frozen), frozenType)
+        self.assertEqual(frozen, expected)
+      self.assertEqual(frozenType(), (0., 0.))
+      with self.assertRaises(TypeError):
+        frozenType('x', 'y')
+
+  def test_immutable(self) -> None:
+    """Tests that frozen objects are immutable and carry no '__dict__'."""
+    point = FrozenPoint(*self.randFloats())
+    self.assertFalse(hasattr(point, '__dict__'))
+    self.assertEqual(sys.getsizeof(point), sys.getsizeof((1., 2.)))
+    with self.assertRaises(AttributeError):
+      point.x = 1.
+    with self.assertRaises(TypeError):
+      point[0] = 1.
+
+  def test_hash(self) -> None:
+    """Tests that equal frozen objects hash equally."""
+    x, y = self.randFloats()
+    points = {FrozenPoint(x, y): 1}
+    self.assertEqual(points[FrozenPoint(x, y)], 1)
+    self.assertEqual(len({FrozenPoint(x, y), FrozenPoint(x, y)}), 1)
+    self.assertEqual(FrozenPoint(x, y), Point(x, y))
+    self.assertEqual(Point(x, y), FrozenPoint(x, y))
+    self.assertNotEqual(FrozenPoint(x, y), FrozenPoint(x + 1, y))
+
+  def test_freeze_thaw(self) -> None:
+    """Tests the round trip between mutable and frozen objects."""
+    for mutableType, frozenType in self.types.items():
+      mutable = mutableType(*self.randFloats())
+      frozen = mutable.freeze()
+      self.assertIs(type(frozen), frozenType)
+      thawed = frozen.thaw()
+      self.assertIs(type(thawed), mutableType)
+      self.assertEqual(thawed.r0, mutable.r0)
+      self.assertEqual(thawed.r1, mutable.r1)
+      self.assertIsNot(thawed, mutable)
+
+  def test_arithmetic(self) -> None:
+    """Tests that the arithmetic agrees with the mutable classes."""
+    for mutableType, frozenType in self.types.items():
+      x, y = self.randFloats()
+      f, m = frozenType(x, y), mutableType(x, y)
+      other, scalar = self.randFloats(), self.randFloat()
+      for actual, expected in [
+          (-f, -m),
+          (f + other, m + other),
+          (other + f, other + m),
+          (f - other, m - other),
+          (other - f, other - m),
+          (f * scalar, m * scalar),
+          (scalar * f, scalar * m),
+          (f / scalar, m / scalar),
+      ]:
+        self.assertIs(type(actual), frozenType)
+        self.assertAlmostEqual(actual.r0, expected.r0)
+        self.assertAlmostEqual(actual.r1, expected.r1)
+      self.assertEqual(complex(f), complex(m))
+      self.assertAlmostEqual(abs(f), abs(m))
+
+  def test_vector(self) -> None:
+    """Tests the vector products and projections."""
+    a, b = self.randFloats(), self.randFloats()
+    fa, fb = FrozenVector(*a), FrozenVector(*b)
+    ma, mb = Vector(*a), Vector(*b)
+    self.assertAlmostEqual(fa * fb, ma * mb)
+    self.assertAlmostEqual(fa @ fb, ma @ mb)
+    self.assertEqual(~fa, ~ma)
+    for actual, expected in [(fa >> fb, ma >> mb), (fa << fb, ma << mb)]:
+      self.assertAlmostEqual(actual.x, expected.x)
+      self.assertAlmostEqual(actual.y, expected.y)
+
+  def test_size(self) -> None:
+    """Tests the size specific properties."""
+    w, h = [abs(f) + 1 for f in self.randFloats()]
+    frozen, mutable = FrozenSize(w, h), Size(w, h)
+    self.assertEqual(frozen.width, mutable.width)
+    self.assertEqual(frozen.height, mutable.height)
+    self.assertAlmostEqual(frozen.aspectRatio, mutable.aspectRatio)
+    fitted = frozen.fit(FrozenSize(1., 1.))
+    self.assertIsInstance(fitted, FrozenSize)
+    self.assertEqual(fitted, mutable.fit(Size(1., 1.)))
+
+  def test_pickle(self) -> None:
+    """Tests that frozen objects survive pickling."""
+    for frozenType in self.types.values():
+      frozen = frozenType(*self.randFloats())
+      loaded = pickle.loads(pickle.dumps(frozen))
+      self.assertIs(type(loaded), frozenType)
+      self.assertEqual(loaded, frozen)
@@ -0,0 +1,93 @@
+"""TestAffineMap tests the affine representation of the map classes and
+their composition into AffineMap."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worQt.tools.geometry import MoveMap, ScaleMap, RotateMap, RegionMap
+from worQt.tools.geometry import RotatePointMap, AffineMap, PointArray
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestAffineMap(AbstractTest):
+  """TestAffineMap tests the affine representation of the map classes and
+  their composition into AffineMap."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.maps = [
+        *[MoveMap(*self.randFloats()) for _ in range(10)],
+        *[ScaleMap(*[abs(f) for f in self.randFloats()]) for _ in range(10)],
+        *[RotateMap(self.randFloat()) for _ in range(10)],
+        *[RotatePointMap(*self.randPointFloat()) for _ in range(10)],
+        *[RegionMap(*self.randRegions()) for _ in range(10)],
+    ]
+
+  def test_matrix(self) -> None:
+    """Tests that the matrix reproduces the map on points."""
+    for map_ in self.maps:
+      point = self.randPoint()
+      expected = map_(point)
+      (a, b, c), (d, e, f), lastRow = map_.matrix
+      self.assertEqual(lastRow, (0., 0., 1.))
+      self.assertAlmostEqual(a * point.x + b * point.y + c, expected.x)
+      self.assertAlmostEqual(d * point.x + e * point.y + f, expected.y)
+
+  def test_compose(self) -> None:
+    """Tests that composition applies the right operand first."""
+    for outer, inner in zip(self.maps, reversed(self.maps)):
+      composed = outer @ inner
+      self.assertIsInstance(composed, AffineMap)
+      point = self.randPoint()
+      expected = outer(inner(point))
+      actual = composed(point)
+      self.assertAlmostEqual(actual.x, expected.x)
+      self.assertAlmostEqual(actual.y, expected.y)
+
+  def test_compose_chain(self) -> None:
+    """Tests folding a chain of maps and applying it to a batch."""
+    pipeline = AffineMap()
+    for map_ in self.maps[::7]:
+      pipeline = map_ @ pipeline
+    points = [self.randPoint() for _ in range(16)]
+    for view, point in zip(pipeline(PointArray(points)), points):
+      for map_ in self.maps[::7]:
+        point = map_(point)
+      self.assertAlmostEqual(view.x, point.x)
+      self.assertAlmostEqual(view.y, point.y)
+
+  def test_init(self) -> None:
+    """Tests the AffineMap constructors."""
+    coefficients = (1., 2., 3., 4., 5., 6.)
+    rows = ((1, 2, 3), (4, 5, 6), (0, 0, 1))
+    for map_ in [
+        AffineMap(*coefficients),
+        AffineMap(coefficients),
+        AffineMap(rows),
+        AffineMap(AffineMap(rows)),
+    ]:
+      self.assertEqual(map_.coefficients, coefficients)
+    self.assertEqual(AffineMap().coefficients, (1., 0., 0., 0., 1., 0.))
+    move = MoveMap(*self.randFloats())
+    self.assertEqual(AffineMap(move).coefficients, move.coefficients)
+    with self.assertRaises(ValueError):
+      AffineMap((1., 2., 3.))
+
+  def test_complex(self) -> None:
+    """Tests that RotatePointMap maps complex numbers."""
+    for map_ in self.maps:
+      if not isinstance(map_, RotatePointMap):
+        continue
+      z = self.randComplex()
+      expected = map_(z.real, z.imag)
+      actual = map_(z)
+      self.assertAlmostEqual(actual.real, expected[0])
+      self.assertAlmostEqual(actual.imag, expected[1])
@@ -0,0 +1,66 @@
+"""TestMapMany tests that the batch mapping of every AbstractMap subclass
+agrees with the single point mapping."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from worQt.tools.geometry import MoveMap, ScaleMap, RotateMap, RegionMap
+from worQt.tools.geometry import RotatePointMap, PointArray, VectorArray
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestMapMany(AbstractTest):
+  """TestMapMany tests that the batch mapping of every AbstractMap
+  subclass agrees with the single point mapping."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.maps = [
+        *[MoveMap(*self.randFloats()) for _ in range(10)],
+        *[ScaleMap(*[abs(f) for f in self.randFloats()]) for _ in range(10)],
+        *[RotateMap(self.randFloat()) for _ in range(10)],
+        *[RotatePointMap(*self.randPointFloat()) for _ in range(10)],
+        *[RegionMap(*self.randRegions()) for _ in range(10)],
+    ]
+    self.points = [self.randPoint() for _ in range(32)]
+
+  def test_point_array(self) -> None:
+    """Tests mapping a PointArray."""
+    for map_ in self.maps:
+      actual = map_(PointArray(self.points))
+      self.assertIsInstance(actual, PointArray)
+      for view, point in zip(actual, self.points):
+        expected = map_(point)
+        self.assertAlmostEqual(view.x, expected.x)
+        self.assertAlmostEqual(view.y, expected.y)
+
+  def test_vector_array(self) -> None:
+    """Tests that mapping a VectorArray returns a VectorArray."""
+    for map_ in self.maps:
+      actual = map_(VectorArray(self.points))
+      self.assertIsInstance(actual, VectorArray)
+
+  def test_flat_sequence(self) -> None:
+    """Tests mapping flat sequences and buffers of floats."""
+    flat = [c for point in self.points for c in (point.x, point.y)]
+    for map_ in self.maps:
+      expected = map_.mapMany(PointArray(self.points))
+      self.assertEqual(map_.mapMany(flat), expected)
+      self.assertEqual(map_.mapMany(array('d', flat)), expected)
+      self.assertEqual(map_.mapMany(memoryview(array('d', flat))), expected)
+
+  def test_bad_input(self) -> None:
+    """Tests that unsupported input raises TypeError."""
+    for map_ in self.maps:
+      with self.assertRaises(TypeError):
+        map_.mapMany(object())
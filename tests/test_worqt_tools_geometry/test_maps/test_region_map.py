@@ -6,7 +6,7 @@ from __future__ import annotations
 from math import cos, sin, pi
 
 from .. import AbstractTest
-from worQt.tools.geometry import RegionMap
+from worQt.tools.geometry import RegionMap, Region, PointArray
 
 try:
   from typing import TYPE_CHECKING
@@ -193,3 +193,54 @@ class TestRegion(AbstractTest):
 
         self.assertAlmostEqual(actual[0], expectedX)
         self.assertAlmostEqual(actual[1], expectedY)
+
+  def test_complex(self, ) -> None:
+    """Test that RegionMap maps complex numbers as points. """
+    for regionMap in self.maps:
+      x, y = self.randFloats()
+      actual = regionMap(x + y * 1j)
+      expected = regionMap(x, y)
+      self.assertAlmostEqual(actual.real, expected[0])
+      self.assertAlmostEqual(actual.imag, expected[1])
+
+  def test_inverse(self, ) -> None:
+    """Test that the inverse map undoes the map. """
+    for regionMap in self.maps:
+      inverse = regionMap.inverse()
+      point = self.randPoint()
+      actual = inverse(regionMap(point))
+      self.assertAlmostEqual(actual.x, point.x)
+      self.assertAlmostEqual(actual.y, point.y)
+      source = inverse(regionMap.target)
+      self.assertAlmostEqual(source.left, regionMap.source.left)
+      self.assertAlmostEqual(source.bottom, regionMap.source.bottom)
+
+  def test_many(self, ) -> None:
+    """Test that batches map as the individual points. """
+    for regionMap in self.maps[::10]:
+      points = [self.randFloats() for _ in range(10)]
+      actual = regionMap(PointArray(points))
+      for point, mapped in zip(points, actual):
+        expected = regionMap(point)
+        self.assertAlmostEqual(mapped.x, expected[0])
+        self.assertAlmostEqual(mapped.y, expected[1])
+
+  def test_zero_source(self, ) -> None:
+    """Test that a degenerate source region raises ZeroDivisionError. """
+    with self.assertRaises(ZeroDivisionError):
+      RegionMap(Region(0, 0, 0, 1), Region(0, 0, 1, 1))
+    with self.assertRaises(ZeroDivisionError):
+      RegionMap(Region(0, 0, 1, 1), Region(0, 0, 1, 0)).inverse()
+
+  def test_set_regions(self, ) -> None:
+    """Test that setting the regions pans and zooms the map. """
+    regionMap = RegionMap(Region(0, 0, 10, 10), Region(0, 0, 100, 50))
+    regionMap.source = Region(5, 0, 15, 20)
+    self.assertEqual(regionMap(5., 20.), (0., 50.))
+    regionMap.target = Region(10, 10, 20, 20)
+    self.assertEqual(regionMap(5., 0.), (10., 10.))
+    self.assertEqual((*regionMap.target.bottomRight,), (20., 20.))
+    with self.assertRaises(TypeError):
+      regionMap.source = (0, 0, 1, 1)
+    with self.assertRaises(ZeroDivisionError):
+      regionMap.source = Region(0, 0, 0, 1)
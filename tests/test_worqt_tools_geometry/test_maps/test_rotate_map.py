@@ -129,3 +129,16 @@ class TestMove(AbstractTest):
       movedMap = moveMap(floatVal, intVal)
       self.assertAlmostEqual(movedMap[0], x)
       self.assertAlmostEqual(movedMap[1], y)
+
+  def test_move_origin(self) -> None:
+    """Tests that RotateMap maps the origin to itself."""
+    for moveMap in self.maps:
+      self.assertEqual(moveMap(0., 0.), (0., 0.))
+      self.assertEqual(moveMap(0j), 0j)
+
+  def test_coefficients(self) -> None:
+    """Tests that the cached coefficients match the angle."""
+    for moveMap in self.maps:
+      angle = moveMap.angle
+      c, s = cos(angle), sin(angle)
+      self.assertEqual(moveMap.coefficients, (c, -s, 0., s, c, 0.))
@@ -0,0 +1,117 @@
+"""TestStreamPipeline tests the StreamPipeline class."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from .. import AbstractTest
+from worQt.tools.geometry import StreamPipeline, RegionMap, Region
+from worQt.tools.geometry import ScaleMap, MoveMap, Vector, PointArray
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  pass
+
+
+class TestStreamPipeline(AbstractTest):
+  """TestStreamPipeline tests the StreamPipeline class."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.scale = ScaleMap(2., 3.)
+    self.move = MoveMap(Vector(1., -1.))
+    self.samples = [(float(i), float(i * i % 7)) for i in range(20)]
+
+  def expected(self, points: list) -> list:
+    """Returns the points mapped by scale followed by move."""
+    return [(2. * x + 1., 3. * y - 1.) for x, y in points]
+
+  def assertPoints(self, points: PointArray, expected: list) -> None:
+    """Asserts that the PointArray holds the expected points."""
+    self.assertEqual(len(points), len(expected))
+    for (x, y), (ex, ey) in zip(points.toList(), expected):
+      self.assertAlmostEqual(x, ex)
+      self.assertAlmostEqual(y, ey)
+
+  def test_chain(self) -> None:
+    """Test that the maps apply in the order given."""
+    pipeline = StreamPipeline(64, [self.scale, self.move])
+    pipeline.append(self.samples)
+    self.assertPoints(pipeline.mapped, self.expected(self.samples))
+    self.assertPoints(pipeline.raw, self.samples)
+    self.assertEqual(pipeline.fullRecomputes, 0)
+
+  def test_incremental(self) -> None:
+    """Test that appending chunks maps only the new points."""
+    pipeline = StreamPipeline(64, [self.scale, self.move])
+    for i in range(0, 20, 5):
+      pipeline.append(self.samples[i:i + 5])
+      self.assertEqual(pipeline.mappedPoints, i + 5)
+      self.assertPoints(pipeline.mapped, self.expected(self.samples[:i + 5]))
+    self.assertEqual(pipeline.fullRecomputes, 0)
+
+  def test_ring(self) -> None:
+    """Test that only the most recent points are kept."""
+    pipeline = StreamPipeline(8, self.scale)
+    for i in range(0, 20, 3):
+      pipeline.extend(self.samples[i:i + 3])
+      self.assertLessEqual(len(pipeline), 8)
+    self.assertEqual(len(pipeline), 8)
+    self.assertPoints(pipeline.raw, self.samples[-8:])
+    pipeline.clear()
+    self.assertFalse(pipeline)
+    pipeline.append(self.samples)
+    self.assertPoints(pipeline.raw, self.samples[-8:])
+
+  def test_map_change(self) -> None:
+    """Test that a changed map recomputes every held point once."""
+    source = Region(0., 0., 10., 10.)
+    regionMap = RegionMap(source, Region(0., 0., 100., 50.))
+    pipeline = StreamPipeline(16, regionMap)
+    pipeline.append(self.samples)
+    regionMap.source = Region(5., 0., 15., 10.)
+    mapped = pipeline.mapped
+    self.assertEqual(pipeline.fullRecomputes, 1)
+    self.assertPoints(mapped, regionMap.mapMany(pipeline.raw).toList())
+    pipeline.append(self.samples[:2])
+    pipeline.toQPolygonF()
+    self.assertEqual(pipeline.fullRecomputes, 1)
+    pipeline.maps = [self.scale, self.move]
+    self.assertPoints(pipeline.mapped, self.expected(pipeline.raw.toList()))
+    self.assertEqual(pipeline.fullRecomputes, 2)
+
+  def test_target_change(self) -> None:
+    """Test that setting the target of a RegionMap recomputes every held
+    point once."""
+    regionMap = RegionMap(Region(0., 0., 10., 10.), Region(0., 0., 1., 1.))
+    pipeline = StreamPipeline(16, regionMap)
+    pipeline.append(self.samples)
+    pipeline.toQPolygonF()
+    regionMap.target = Region(0., 0., 100., 50.)
+    self.assertPoints(pipeline.mapped,
+                      regionMap.mapMany(pipeline.raw).toList())
+    self.assertEqual(pipeline.fullRecomputes, 1)
+
+  def test_qpolygon(self) -> None:
+    """Test that the mapped points convert to QPolygonF in order."""
+    pipeline = StreamPipeline(8, [self.scale, self.move])
+    pipeline.append(self.samples)
+    polygon = pipeline.toQPolygonF()
+    expected = self.expected(self.samples[-8:])
+    self.assertEqual(polygon.size(), 8)
+    for i, (x, y) in enumerate(expected):
+      self.assertAlmostEqual(polygon.at(i).x(), x)
+      self.assertAlmostEqual(polygon.at(i).y(), y)
+
+  def test_invalid(self) -> None:
+    """Test that invalid arguments raise."""
+    with self.assertRaises(ValueError):
+      StreamPipeline(0)
+    with self.assertRaises(TypeError):
+      StreamPipeline(8, [self.scale, 'map'])
@@ -0,0 +1,97 @@
+"""TestPlaneBroadcast tests the broadcasting of Plane arithmetic across
+batches of points."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+
+from worQt.tools.geometry import Point, Vector, PointArray, VectorArray
+from worQt.tools.geometry import FrozenPoint, FrozenVector
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  pass
+
+
+class TestPlaneBroadcast(AbstractTest):
+  """TestPlaneBroadcast tests the broadcasting of Plane arithmetic across
+  batches of points."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.pairs = [self.randFloats() for _ in range(16)]
+    self.flat = array('d', [c for pair in self.pairs for c in pair])
+    self.point = self.randPoint()
+
+  def assertPairs(self, batch: PointArray, expected: list) -> None:
+    """Asserts that the batch holds the expected pairs."""
+    self.assertEqual(len(batch), len(expected))
+    for (x, y), (ex, ey) in zip(zip(batch.x, batch.y), expected):
+      self.assertAlmostEqual(x, ex)
+      self.assertAlmostEqual(y, ey)
+
+  def test_add(self) -> None:
+    """Test that addition broadcasts across every batch form."""
+    px, py = self.point.x, self.point.y
+    expected = [(px + x, py + y) for x, y in self.pairs]
+    for other in (self.pairs, (*self.pairs,), self.flat,
+                  memoryview(self.flat), PointArray(self.pairs)):
+      self.assertIsInstance(self.point + other, PointArray)
+      self.assertPairs(self.point + other, expected)
+      self.assertPairs(other + self.point, expected)
+
+  def test_sub(self) -> None:
+    """Test that subtraction broadcasts in both directions."""
+    px, py = self.point.x, self.point.y
+    for other in (self.pairs, self.flat, PointArray(self.pairs)):
+      self.assertPairs(self.point - other,
+                       [(px - x, py - y) for x, y in self.pairs])
+      self.assertPairs(other - self.point,
+                       [(x - px, y - py) for x, y in self.pairs])
+
+  def test_batch_type(self) -> None:
+    """Test that vectors broadcast to VectorArray and that PointArray
+    operands keep their type."""
+    vector = Vector(1., 2.)
+    self.assertIsInstance(vector + self.pairs, VectorArray)
+    self.assertIsInstance(self.point + VectorArray(self.pairs), VectorArray)
+    self.assertIsInstance(FrozenVector(1., 2.) - self.flat, VectorArray)
+    self.assertIsInstance(FrozenPoint(1., 2.) + self.pairs, PointArray)
+
+  def test_products(self) -> None:
+    """Test the dot and cross products against batches."""
+    for vector in (Vector(1., 2.), FrozenVector(1., 2.)):
+      dots = vector * self.pairs
+      crosses = vector @ self.flat
+      for (x, y), dot, cross in zip(self.pairs, dots, crosses):
+        self.assertAlmostEqual(dot, x + 2. * y)
+        self.assertAlmostEqual(cross, y - 2. * x)
+
+  def test_single_points(self) -> None:
+    """Test that pairs still resolve to single points."""
+    self.assertIsInstance(self.point + (1., 2.), Point)
+    self.assertIsInstance(self.point + [1, 2], Point)
+    self.assertIsInstance(FrozenPoint(1., 2.) + (1., 2.), FrozenPoint)
+    with self.assertRaises(TypeError):
+      _ = self.point + [(1., 2.), None]
+
+  def test_flat_sequence(self) -> None:
+    """Test that sequences of more than two floats are batches of
+    interleaved coordinates rather than single points."""
+    for point in (Point(0., 0.), FrozenPoint(0., 0.)):
+      out = point + [1., 2., 3., 4.]
+      self.assertIsInstance(out, PointArray)
+      self.assertPairs(out, [(1., 2.), (3., 4.)])
+      self.assertPairs(point - (1., 2., 3., 4.), [(-1., -2.), (-3., -4.)])
+      with self.assertRaises(TypeError):
+        _ = point + [1., 2., 3.]
+    self.assertIsInstance(Point(0., 0.) + [(1., 2.), (3., 4.)], PointArray)
@@ -6,7 +6,7 @@ from __future__ import annotations
 from math import cos, sin, pi
 
 from test_worqt_tools_geometry import AbstractTest
-from worQt.tools.geometry import RotateMap, Plane
+from worQt.tools.geometry import RotateMap, Plane, Point, Vector, Size
 
 try:
   from typing import TYPE_CHECKING
@@ -105,3 +105,23 @@ class TestPlaneInit(AbstractTest):
     self.assertAlmostEqual(tuplePlane.r1, plane2.r1 - plane.r1)
     self.assertAlmostEqual(listPlane.r0, plane2.r0 - plane.r0)
     self.assertAlmostEqual(listPlane.r1, plane2.r1 - plane.r1)
+
+  def test_from_floats(self, ) -> None:
+    """Tests that the fast constructor agrees with the dispatched one."""
+    for cls in [Plane, Point, Vector, Size]:
+      r0, r1 = self.randFloats()
+      fast, slow = cls._fromFloats(r0, r1), cls(r0, r1)
+      self.assertIs(type(fast), cls)
+      self.assertEqual(fast.r0, slow.r0)
+      self.assertEqual(fast.r1, slow.r1)
+      fast.r0 += 1.
+      self.assertEqual(fast.r0, slow.r0 + 1.)
+
+  def test_operator_types(self, ) -> None:
+    """Tests that the operators return objects of the operand type."""
+    for cls in [Plane, Point, Vector, Size]:
+      plane = cls(*self.randFloats())
+      for result in [-plane, plane + 1, 1 - plane, plane * 2, plane / 2]:
+        self.assertIs(type(result), cls)
+        self.assertIsInstance(result.r0, float)
+        self.assertIsInstance(result.r1, float)
@@ -30,6 +30,14 @@ class TestPlaneMisc(AbstractTest):
     self.assertAlmostEqual(r0, plane.r0)
     self.assertAlmostEqual(r1, plane.r1)
 
+  def test_nested_iter(self) -> None:
+    """Tests that nested iteration over the same plane is safe."""
+    plane = Plane(*self.randFloats())
+    values = (plane.r0, plane.r1)
+    pairs = [(a, b) for a in plane for b in plane]
+    self.assertEqual(pairs, [(a, b) for a in values for b in values])
+    self.assertFalse(hasattr(plane, '__next__'))
+
   def test_len(self) -> None:
     """Test the Plane class."""
     plane = Plane(*self.randFloats())
@@ -0,0 +1,94 @@
+"""TestSizeFit tests the 'fit' and 'fitMany' methods of Size."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from random import random
+
+from worQt.tools.geometry import Size
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  pass
+
+
+class TestSizeFit(AbstractTest):
+  """TestSizeFit tests the 'fit' and 'fitMany' methods of Size."""
+
+  def assertFits(self, size: Size, other: Size, fitted: Size) -> None:
+    """Asserts that 'fitted' is 'size' scaled to touch 'other'."""
+    self.assertLessEqual(fitted.width, other.width)
+    self.assertLessEqual(fitted.height, other.height)
+    touching = (fitted.width == other.width, fitted.height == other.height)
+    self.assertTrue(any(touching))
+    self.assertAlmostEqual(fitted.r0 * size.r1, fitted.r1 * size.r0)
+
+  def test_fit(self) -> None:
+    """Test that fitting preserves the aspect ratio and touches the
+    container."""
+    for _ in range(1000):
+      size, other = self.randSize(), self.randSize()
+      self.assertFits(size, other, size.fit(other))
+
+  def test_edge_cases(self) -> None:
+    """Test fitting at extreme aspect ratios and magnitudes, where the
+    previous implementation could miss both candidates."""
+    for _ in range(1000):
+      size = Size(random() * 1e-9 + 1e-12, random() * 1e9 + 1.)
+      other = Size(0.1 + 0.2, 1. / 3.)
+      self.assertFits(size, other, size.fit(other))
+      self.assertFits(other, size, other.fit(size))
+    self.assertFits(Size(3., 3.), Size(7., 7.), Size(3., 3.).fit(Size(7., 7.)))
+
+  def test_degenerate(self) -> None:
+    """Test fitting sizes with zero width or height."""
+    fitted = Size(0., 2.).fit(Size(5., 3.))
+    self.assertEqual((fitted.r0, fitted.r1), (0., 3.))
+    fitted = Size(2., 0.).fit(Size(5., 3.))
+    self.assertEqual((fitted.r0, fitted.r1), (5., 0.))
+    with self.assertRaises(ZeroDivisionError):
+      Size(0., 0.).fit(Size(5., 3.))
+
+  def test_fit_many(self) -> None:
+    """Test that 'fitMany' agrees with 'fit'."""
+    container = self.randSize()
+    sizes = [self.randSize() for _ in range(100)]
+    pairs = [(size.r0, size.r1) for size in sizes]
+    for fitted in (Size.fitMany(sizes, container),
+                   Size.fitMany(pairs, container)):
+      self.assertEqual(len(fitted), len(sizes))
+      for size, result in zip(sizes, fitted):
+        self.assertIsInstance(result, Size)
+        expected = size.fit(container)
+        self.assertEqual((result.r0, result.r1), (expected.r0, expected.r1))
+    fitted = Size.fitMany([(4., 2.)], (2., 2.))
+    self.assertEqual((fitted[0].r0, fitted[0].r1), (2., 1.))
+
+  def test_negative(self) -> None:
+    """Tests that negative sizes fit alike through 'fit' and 'fitMany'."""
+    container = Size(4., 4.)
+    for w, h in [(-2., 1.), (2., -1.), (-1., -2.)]:
+      single = Size(w, h).fit(container)
+      many, = Size.fitMany([(w, h), ], container)
+      self.assertEqual((*single,), (*many,))
+      self.assertGreater(single.r0, 0.)
+      self.assertGreater(single.r1, 0.)
+    many = Size.fitMany([Size(-2., 1.), ], Size(-4., 4.))
+    self.assertEqual((*many[0],), (4., 2.))
+
+  def test_subclass(self) -> None:
+    """Tests that fitting keeps subclasses of Size."""
+
+    class Thumb(Size):
+      """Subclass of Size."""
+
+    self.assertIs(type(Thumb(1., 2.).fit(Size(4., 4.))), Thumb)
+    self.assertIs(type(Thumb.fitMany([(1., 2.), ], Size(4., 4.))[0]), Thumb)
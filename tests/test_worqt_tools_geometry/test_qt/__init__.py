@@ -0,0 +1,5 @@
+"""The 'test_qt' test module tests the conversions between the geometry
+classes in the worQt.tools.geometry module and the Qt types. """
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
@@ -0,0 +1,107 @@
+"""TestQtConversion tests the conversions to and from the Qt types."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from PySide6.QtCore import QPoint, QPointF, QRect, QRectF, QSize, QSizeF
+from PySide6.QtGui import QPolygonF, QTransform
+
+from worQt.tools.geometry import Point, Vector, Size, Region, PointArray
+from worQt.tools.geometry import AffineMap, RegionMap, RotateMap
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestQtConversion(AbstractTest):
+  """TestQtConversion tests the conversions to and from the Qt types."""
+
+  def test_point(self) -> None:
+    """Tests conversion of points and vectors."""
+    point = self.randPoint()
+    qPoint = point.toQ()
+    self.assertIsInstance(qPoint, QPointF)
+    self.assertEqual((qPoint.x(), qPoint.y()), (point.x, point.y))
+    other = Point.fromQ(qPoint)
+    self.assertIs(type(other), Point)
+    self.assertEqual((other.x, other.y), (point.x, point.y))
+    vector = Vector.fromQ(QPoint(3, 4))
+    self.assertIs(type(vector), Vector)
+    self.assertEqual(abs(vector), 5.)
+    with self.assertRaises(TypeError):
+      Point.fromQ((1, 2))
+
+  def test_size(self) -> None:
+    """Tests conversion of sizes."""
+    size = self.randSize()
+    qSize = size.toQ()
+    self.assertIsInstance(qSize, QSizeF)
+    self.assertEqual((qSize.width(), qSize.height()), (size.r0, size.r1))
+    other = Size.fromQ(QSize(7, 9))
+    self.assertEqual((other.width, other.height), (7., 9.))
+    with self.assertRaises(TypeError):
+      Size.fromQ(QPointF(1, 2))
+
+  def test_region(self) -> None:
+    """Tests conversion of regions."""
+    region = self.randRegion()
+    qRect = region.toQ()
+    self.assertIsInstance(qRect, QRectF)
+    self.assertAlmostEqual(qRect.left(), region.left)
+    self.assertAlmostEqual(qRect.bottom(), region.bottom)
+    other = Region.fromQ(qRect)
+    self.assertAlmostEqual(other.right, region.right)
+    self.assertAlmostEqual(other.top, region.top)
+    flipped = Region.fromQ(QRect(10, 10, -4, -6))
+    self.assertEqual(flipped._getEdges(), (6., 4., 10., 10.))
+
+  def test_polygon(self) -> None:
+    """Tests conversion of point arrays to and from QPolygonF."""
+    points = [self.randPoint() for _ in range(100)]
+    pointArray = PointArray(points)
+    polygon = pointArray.toQPolygonF()
+    self.assertIsInstance(polygon, QPolygonF)
+    self.assertEqual(polygon.size(), 100)
+    for i, point in enumerate(points):
+      self.assertEqual(polygon[i], QPointF(point.x, point.y))
+    self.assertEqual(PointArray.fromQPolygonF(polygon), pointArray)
+    self.assertEqual(PointArray.fromQ(pointArray.toQ()), pointArray)
+    self.assertEqual(PointArray().toQPolygonF().size(), 0)
+    self.assertFalse(PointArray.fromQPolygonF(QPolygonF()))
+
+  def test_maps(self) -> None:
+    """Tests conversion of maps to and from QTransform."""
+    maps = [
+        RegionMap(*self.randRegions()),
+        RotateMap(*self.randFloats()[:1]),
+        AffineMap(*self.randFloats(), *self.randFloats(),
+                  *self.randFloats()),
+    ]
+    for map_ in maps:
+      transform = map_.toQ()
+      self.assertIsInstance(transform, QTransform)
+      point = self.randPoint()
+      expected = map_(point)
+      actual = transform.map(point.toQ())
+      self.assertAlmostEqual(actual.x(), expected.x)
+      self.assertAlmostEqual(actual.y(), expected.y)
+      other = AffineMap.fromQ(transform)
+      for a, b in zip(other.coefficients, map_.coefficients):
+        self.assertAlmostEqual(a, b)
+    with self.assertRaises(ValueError):
+      AffineMap(QTransform(1, 0, 1, 0, 1, 0, 0, 0, 1))
+
+  def test_map_to_polygon(self) -> None:
+    """Tests mapping points directly to a QPolygonF."""
+    regionMap = RegionMap(*self.randRegions())
+    points = PointArray([self.randPoint() for _ in range(10)])
+    polygon = regionMap.mapToQPolygonF(points)
+    for i, mapped in enumerate(regionMap(points)):
+      self.assertAlmostEqual(polygon[i].x(), mapped.x)
+      self.assertAlmostEqual(polygon[i].y(), mapped.y)
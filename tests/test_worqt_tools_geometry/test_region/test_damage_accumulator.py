@@ -0,0 +1,103 @@
+"""TestDamageAccumulator tests the coalescing of dirty regions."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from PySide6.QtCore import QRect
+
+from worQt.tools.geometry import Region, DamageAccumulator, Point
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestDamageAccumulator(AbstractTest):
+  """TestDamageAccumulator tests the coalescing of dirty regions."""
+
+  @staticmethod
+  def covered(accumulator: DamageAccumulator, point: Point) -> bool:
+    """Returns True if any rectangle of the accumulator contains the
+    point."""
+    return any([point in rect for rect in accumulator.rects()])
+
+  def test_adjacent(self) -> None:
+    """Tests that adjacent and overlapping regions merge."""
+    accumulator = DamageAccumulator()
+    accumulator.add(Region(0, 0, 10, 10))
+    accumulator.add(Region(10, 0, 20, 10))
+    accumulator.add(Region(5, 5, 25, 8))
+    self.assertEqual(len(accumulator), 1)
+    rect = accumulator.rects()[0]
+    self.assertEqual((rect.left, rect.top), (0., 0.))
+    self.assertEqual((rect.right, rect.bottom), (25., 10.))
+
+  def test_distant(self) -> None:
+    """Tests that distant regions remain separate and report the area
+    saved compared to the bounding region."""
+    accumulator = DamageAccumulator()
+    accumulator.add(Region(0, 0, 10, 10))
+    accumulator.add(Region(500, 500, 510, 510))
+    self.assertEqual(len(accumulator), 2)
+    self.assertEqual(accumulator.area, 200.)
+    self.assertEqual(accumulator.boundingArea, 510. * 510.)
+    self.assertEqual(accumulator.savedArea, 510. * 510. - 200.)
+
+  def test_contained(self) -> None:
+    """Tests that contained regions add no rectangles."""
+    accumulator = DamageAccumulator(0.)
+    accumulator += Region(0, 0, 100, 100)
+    accumulator += Region(10, 10, 20, 20)
+    accumulator += Region(5, 5, 5, 50)
+    self.assertEqual(len(accumulator), 1)
+    self.assertEqual(accumulator.dirtyArea, 100. * 100. + 100.)
+
+  def test_covers(self) -> None:
+    """Tests that the rectangles cover every dirty region within the
+    maximum number of rectangles."""
+    accumulator = DamageAccumulator(256, 8)
+    regions = [self.randRegion() for _ in range(100)]
+    accumulator.addMany(regions)
+    self.assertLessEqual(len(accumulator), 8)
+    for region in regions:
+      self.assertTrue(self.covered(accumulator, region.topLeft))
+      self.assertTrue(self.covered(accumulator, region.bottomRight))
+      self.assertTrue(self.covered(accumulator, region.center))
+    self.assertGreaterEqual(accumulator.savedArea, 0.)
+
+  def test_qt(self) -> None:
+    """Tests conversion to and from Qt types."""
+    accumulator = DamageAccumulator()
+    accumulator.add(QRect(0, 0, 10, 10))
+    accumulator.add(Region(100.5, 100.5, 110.25, 110.25))
+    rects = accumulator.toQRects()
+    self.assertEqual(rects[0], QRect(0, 0, 10, 10))
+    self.assertEqual(rects[1], QRect(100, 100, 11, 11))
+    qRegion = accumulator.toQRegion()
+    self.assertEqual(qRegion.rectCount(), 2)
+    self.assertTrue(qRegion.contains(QRect(102, 102, 2, 2)))
+
+  def test_flush(self) -> None:
+    """Tests that flushing returns the rectangles and clears."""
+    accumulator = DamageAccumulator()
+    accumulator.add(Region(0, 0, 10, 10))
+    self.assertTrue(accumulator)
+    self.assertEqual(len(accumulator.flush()), 1)
+    self.assertFalse(accumulator)
+    self.assertEqual(accumulator.boundingArea, 0.)
+    self.assertEqual(accumulator.dirtyArea, 0.)
+
+  def test_bad_arguments(self) -> None:
+    """Tests the validation of the arguments."""
+    with self.assertRaises(ValueError):
+      DamageAccumulator(-1.)
+    accumulator = DamageAccumulator()
+    with self.assertRaises(ValueError):
+      accumulator.maxRects = 0
+    with self.assertRaises(TypeError):
+      accumulator.add('region')
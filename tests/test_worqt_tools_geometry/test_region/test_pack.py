@@ -0,0 +1,78 @@
+"""TestPack tests the 'packShelves' function."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worQt.tools.geometry import Size, Region, packShelves
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  pass
+
+
+class TestPack(AbstractTest):
+  """TestPack tests the 'packShelves' function."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.container = Region(10., 20., 110., 220.)
+
+  def assertDisjoint(self, regions: list) -> None:
+    """Asserts that no two regions overlap and all lie in the
+    container."""
+    edges = [r._getEdges() for r in regions if r is not None]
+    l0, t0, r0, b0 = self.container._getEdges()
+    for i, (l1, t1, r1, b1) in enumerate(edges):
+      self.assertTrue(l0 <= l1 and t0 <= t1 and r1 <= r0 and b1 <= b0)
+      for l2, t2, r2, b2 in edges[i + 1:]:
+        self.assertFalse(l1 < r2 and l2 < r1 and t1 < b2 and t2 < b1)
+
+  def test_shelves(self) -> None:
+    """Test that items fill shelves left to right and wrap in order."""
+    sizes = [Size(40., 30.), Size(40., 50.), Size(40., 10.), (30., 20.)]
+    placed = packShelves(sizes, self.container, spacing=5.)
+    edges = [region._getEdges() for region in placed]
+    self.assertEqual(edges[0], (10., 20., 50., 50.))
+    self.assertEqual(edges[1], (55., 20., 95., 70.))
+    self.assertEqual(edges[2], (10., 75., 50., 85.))
+    self.assertEqual(edges[3], (55., 75., 85., 95.))
+    self.assertDisjoint(placed)
+
+  def test_row_height(self) -> None:
+    """Test that items are scaled to the row height with their aspect
+    ratio preserved."""
+    sizes = [self.randSize() for _ in range(200)]
+    placed = packShelves(sizes, self.container, rowHeight=25.)
+    self.assertEqual(len(placed), len(sizes))
+    self.assertDisjoint(placed)
+    for size, region in zip(sizes, placed):
+      if region is None:
+        continue
+      self.assertAlmostEqual(min(region.height, 25.), region.height)
+      self.assertAlmostEqual(region.width * size.height,
+                             region.height * size.width)
+
+  def test_overflow(self) -> None:
+    """Test that items that do not fit are None."""
+    sizes = [Size(200., 10.), Size(50., 150.), Size(60., 100.)]
+    placed = packShelves(sizes, self.container)
+    self.assertIsNone(placed[0])
+    self.assertIsNotNone(placed[1])
+    self.assertIsNone(placed[2])
+
+  def test_invalid(self) -> None:
+    """Test that invalid arguments raise."""
+    with self.assertRaises(TypeError):
+      packShelves([Size(1., 1.)], Size(1., 1.))
+    with self.assertRaises(ValueError):
+      packShelves([Size(1., 1.)], self.container, rowHeight=0.)
+    with self.assertRaises(ValueError):
+      packShelves([Size(1., 1.)], self.container, spacing=-1.)
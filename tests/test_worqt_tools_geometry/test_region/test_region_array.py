@@ -0,0 +1,138 @@
+"""TestRegionArray tests the RegionArray class against the Region class."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+from math import isnan
+
+from worQt.tools.geometry import Region, RegionArray, PointArray
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestRegionArray(AbstractTest):
+  """TestRegionArray tests the RegionArray class against the Region
+  class."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.regions = [self.randRegion() for _ in range(50)]
+    self.others = [self.randRegion() for _ in range(50)]
+    self.array = RegionArray(self.regions)
+
+  @staticmethod
+  def edges(region: Region) -> tuple[float, ...]:
+    """Returns the edges of the region."""
+    return region.left, region.top, region.right, region.bottom
+
+  def test_round_trip(self) -> None:
+    """Tests conversion to and from lists of regions."""
+    self.assertEqual(len(self.array), len(self.regions))
+    for region, other in zip(self.regions, self.array.toList()):
+      self.assertIs(type(other), Region)
+      self.assertEqual(self.edges(region), self.edges(other))
+    self.assertEqual(RegionArray(self.array), self.array)
+    last = self.array[-1]
+    self.assertEqual(self.edges(last), self.edges(self.regions[-1]))
+    sliced = self.array[10:20]
+    self.assertEqual(len(sliced), 10)
+    self.assertEqual(sliced[0].left, self.regions[10].left)
+
+  def test_normalized(self) -> None:
+    """Tests that reversed edges are normalized."""
+    regionArray = RegionArray([(4, 3, 2, 1)])
+    self.assertEqual(self.edges(regionArray[0]), (2., 1., 4., 3.))
+    columns = RegionArray.fromColumns([4], [3], [2], [1])
+    self.assertEqual(columns, regionArray)
+    with self.assertRaises(ValueError):
+      RegionArray.fromColumns([1, 2], [1], [1], [1])
+
+  def test_dimensions(self) -> None:
+    """Tests the dimensions against those of each region."""
+    for i, region in enumerate(self.regions):
+      self.assertAlmostEqual(self.array.width[i], region.width)
+      self.assertAlmostEqual(self.array.height[i], region.height)
+      self.assertAlmostEqual(self.array.area[i], region.area)
+      self.assertAlmostEqual(self.array.aspect[i], region.aspect)
+    self.assertTrue(isnan(RegionArray([(0, 0, 1, 0)]).aspect[0]))
+
+  def test_bounds(self) -> None:
+    """Tests the bounds against the sum of the regions."""
+    bounds = self.regions[0]
+    for region in self.regions[1:]:
+      bounds = bounds + region
+    self.assertEqual(self.edges(self.array.bounds), self.edges(bounds))
+    self.assertFalse(RegionArray().bounds)
+
+  def test_intersection(self) -> None:
+    """Tests pairwise and broadcast intersection against Region."""
+    others = RegionArray(self.others)
+    pairwise = self.array * others
+    broadcast = self.array * self.others[0]
+    flags = self.array.intersects(others)
+    for i, (region, other) in enumerate(zip(self.regions, self.others)):
+      self.assertEqual(self.edges(pairwise[i]), self.edges(region * other))
+      expected = region * self.others[0]
+      self.assertEqual(self.edges(broadcast[i]), self.edges(expected))
+      self.assertEqual(flags[i], bool(region * other))
+
+  def test_union(self) -> None:
+    """Tests pairwise union against Region."""
+    union = self.array + RegionArray(self.others)
+    for i, (region, other) in enumerate(zip(self.regions, self.others)):
+      self.assertEqual(self.edges(union[i]), self.edges(region + other))
+    with self.assertRaises(ValueError):
+      _ = self.array + RegionArray(self.others[:3])
+
+  def test_intersect_all(self) -> None:
+    """Tests all-vs-all intersection against a double loop."""
+    others = RegionArray(self.others)
+    expected = [
+        (i, j) for i, region in enumerate(self.regions)
+        for j, other in enumerate(self.others) if region * other
+    ]
+    self.assertEqual(sorted(self.array.intersectAll(others)), expected)
+    selfPairs = [
+        (i, j) for i, region in enumerate(self.regions)
+        for j, other in enumerate(self.regions) if i < j and region * other
+    ]
+    self.assertEqual(sorted(self.array.intersectAll()), selfPairs)
+
+  def test_intersect_all_degenerate(self) -> None:
+    """Tests that regions of zero width or height intersect nothing."""
+    regions = [Region(29, 37, 36, 42), Region(30, 40, 36, 40),
+               Region(31, 36, 31, 44), Region(30, 38, 35, 41)]
+    array = RegionArray(regions)
+    self.assertEqual(array.intersectAll(), [(0, 3)])
+    self.assertEqual(array.intersectAll(RegionArray(regions[1:3])), [])
+    for i, region in enumerate(regions):
+      for j, other in enumerate(regions):
+        if (i, j) not in [(0, 3), (3, 0)] and i != j:
+          self.assertFalse(region * other)
+
+  def test_contains(self) -> None:
+    """Tests containment of points against Region."""
+    points = [self.randPoint() for _ in self.regions]
+    pairwise = self.array.contains(PointArray(points))
+    broadcast = self.array.contains(points[0])
+    for i, region in enumerate(self.regions):
+      self.assertEqual(pairwise[i], points[i] in region)
+      self.assertEqual(broadcast[i], points[0] in region)
+      self.assertTrue(self.array.contains(region)[i])
+
+  def test_mutation(self) -> None:
+    """Tests setting, appending and extending."""
+    regionArray = RegionArray(2)
+    regionArray[1] = Region(1, 2, 3, 4)
+    regionArray.append((5, 6, 7, 8))
+    regionArray.extend(RegionArray([(0, 0, 1, 1)]))
+    self.assertEqual(len(regionArray), 4)
+    self.assertEqual(regionArray.left, array('d', [0., 1., 5., 0.]))
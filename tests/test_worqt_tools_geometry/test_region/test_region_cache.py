@@ -0,0 +1,86 @@
+"""TestRegionCache tests the normalized edges and the derived values of
+the Region class."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from worQt.tools.geometry import Region, Point, Size
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestRegionCache(AbstractTest):
+  """TestRegionCache tests the normalized edges and the derived values of
+  the Region class."""
+
+  def test_normalized(self) -> None:
+    """Tests that reversed edges are normalized at construction."""
+    region = Region(7, 9, 1, 2)
+    self.assertEqual(region.left, 1.)
+    self.assertEqual(region.top, 2.)
+    self.assertEqual(region.right, 7.)
+    self.assertEqual(region.bottom, 9.)
+    self.assertIsInstance(region.left, float)
+    self.assertEqual(region.width, 6.)
+    self.assertEqual(region.height, 7.)
+    self.assertEqual(region.area, 42.)
+
+  def test_derived(self) -> None:
+    """Tests the derived points and size against the edges."""
+    region = self.randRegion()
+    left, top = region.left, region.top
+    right, bottom = region.right, region.bottom
+    self.assertIs(type(region.topLeft), Point)
+    self.assertIs(type(region.size), Size)
+    self.assertAlmostEqual(region.topLeft.x, left)
+    self.assertAlmostEqual(region.topRight.x, right)
+    self.assertAlmostEqual(region.bottomRight.y, bottom)
+    self.assertAlmostEqual(region.bottomLeft.y, bottom)
+    self.assertAlmostEqual(region.center.x, (left + right) / 2)
+    self.assertAlmostEqual(region.center.y, (top + bottom) / 2)
+    self.assertAlmostEqual(region.size.width, right - left)
+    self.assertAlmostEqual(region.size.height, bottom - top)
+
+  def test_fresh(self) -> None:
+    """Tests that modifying a returned point or size in place leaves the
+    region unchanged."""
+    region = Region(0, 0, 1, 2)
+    point = region.topLeft
+    point += (5, 5)
+    self.assertEqual((*point,), (5., 5.))
+    self.assertEqual((*region.topLeft,), (0., 0.))
+    center = region.center
+    center -= (1, 1)
+    self.assertEqual((*region.center,), (.5, 1.))
+    size = region.size
+    size *= 2
+    self.assertEqual((*region.size,), (1., 2.))
+    self.assertEqual(region.left, 0.)
+    self.assertIsNot(region.topLeft, region.topLeft)
+
+  def test_invalidated(self) -> None:
+    """Tests that the derived values are cached and follow the edges."""
+    region = Region(0, 0, 1, 1)
+    topLeft, size = region.topLeft, region.size
+    self.assertEqual(region.__derived_cache__['topLeft'], (0., 0.))
+    self.assertEqual(region.__derived_cache__['size'], (1., 1.))
+    region._setEdges(4, 3, 2, 1)
+    self.assertIsNone(region.__derived_cache__)
+    self.assertIsNot(region.topLeft, topLeft)
+    self.assertEqual((region.left, region.top), (2., 1.))
+    self.assertEqual((*region.topLeft,), (2., 1.))
+    self.assertEqual((*region.size,), (2., 2.))
+
+  def test_empty(self) -> None:
+    """Tests the default region."""
+    region = Region()
+    self.assertFalse(region)
+    self.assertEqual(region.area, 0.)
+    self.assertTrue(Region(0, 0, 1, 1))
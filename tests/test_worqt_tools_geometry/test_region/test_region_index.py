@@ -0,0 +1,109 @@
+"""TestRegionIndex tests the RegionIndex class against linear scans."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from random import shuffle
+
+from worQt.tools.geometry import Region, RegionIndex, Point
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestRegionIndex(AbstractTest):
+  """TestRegionIndex tests the RegionIndex class against linear scans."""
+
+  def setUp(self) -> None:
+    """Set up the test case."""
+    self.regions = [self.randRegion() for _ in range(300)]
+    self.index = RegionIndex(self.regions[:150])
+    for region in self.regions[150:]:
+      self.index.insert(region)
+
+  @staticmethod
+  def ids(regions: list[Region]) -> set[int]:
+    """Returns the identities of the regions."""
+    return {id(region) for region in regions}
+
+  @staticmethod
+  def intersects(region: Region, other: Region) -> bool:
+    """Returns True if the closed regions intersect."""
+    if region.left > other.right or region.right < other.left:
+      return False
+    if region.top > other.bottom or region.bottom < other.top:
+      return False
+    return True
+
+  def assertQueries(self, ) -> None:
+    """Asserts that the queries agree with linear scans."""
+    for _ in range(32):
+      point = self.randPoint()
+      expected = [r for r in self.regions if point in r]
+      self.assertEqual(self.ids(self.index.queryPoint(point)),
+                       self.ids(expected))
+      query = self.randRegion()
+      expected = [r for r in self.regions if self.intersects(r, query)]
+      self.assertEqual(self.ids(self.index.queryRegion(query)),
+                       self.ids(expected))
+
+  def test_queries(self) -> None:
+    """Tests point and region queries."""
+    self.assertEqual(len(self.index), len(self.regions))
+    self.assertEqual(self.ids(self.index), self.ids(self.regions))
+    self.assertQueries()
+
+  def test_nearest(self) -> None:
+    """Tests nearest queries."""
+
+    def distance(region: Region, point: Point) -> float:
+      """Returns the squared distance from the point to the region."""
+      dx = max(region.left - point.x, 0., point.x - region.right)
+      dy = max(region.top - point.y, 0., point.y - region.bottom)
+      return dx * dx + dy * dy
+
+    for _ in range(32):
+      point = self.randPoint()
+      found = self.index.nearestMany(5, point)
+      expected = sorted([distance(r, point) for r in self.regions])[:5]
+      self.assertEqual([distance(r, point) for r in found], expected)
+      nearest = self.index.nearest(point.x, point.y)
+      self.assertEqual(distance(nearest, point), expected[0])
+
+  def test_remove(self) -> None:
+    """Tests that queries remain correct as regions are removed."""
+    shuffle(self.regions)
+    removed, self.regions = self.regions[:200], self.regions[200:]
+    for region in removed:
+      self.index.remove(region)
+    self.assertEqual(len(self.index), len(self.regions))
+    for region in removed:
+      self.assertNotIn(region, self.index)
+    for region in self.regions:
+      self.assertIn(region, self.index)
+    self.assertQueries()
+    with self.assertRaises(KeyError):
+      self.index.remove(removed[0])
+    for region in self.regions:
+      self.index.remove(region)
+    self.assertFalse(self.index)
+    self.assertIsNone(self.index.nearest(0, 0))
+
+  def test_bounds(self) -> None:
+    """Tests the bounding region of the index."""
+    bounds = self.index.bounds
+    self.assertEqual(bounds.left, min([r.left for r in self.regions]))
+    self.assertEqual(bounds.top, min([r.top for r in self.regions]))
+    self.assertEqual(bounds.right, max([r.right for r in self.regions]))
+    self.assertEqual(bounds.bottom, max([r.bottom for r in self.regions]))
+
+  def test_bad_input(self) -> None:
+    """Tests that only regions can be indexed."""
+    with self.assertRaises(TypeError):
+      self.index.insert(self.randPoint())
@@ -0,0 +1,97 @@
+"""TestRegionSubtract tests the set difference of regions."""
+#  AGPL-3.0 license
+#  Copyright (c) 2025 Asger Jon Vistisen
+from __future__ import annotations
+
+from random import random
+
+from worQt.tools.geometry import Region
+from .. import AbstractTest
+
+try:
+  from typing import TYPE_CHECKING
+except ImportError:
+  try:
+    from typing_extensions import TYPE_CHECKING
+  except ImportError:
+    TYPE_CHECKING = False
+
+
+class TestRegionSubtract(AbstractTest):
+  """TestRegionSubtract tests the set difference of regions."""
+
+  @staticmethod
+  def inside(region: Region, x: float, y: float) -> bool:
+    """Returns True if the point is strictly inside the region."""
+    if region.left < x < region.right:
+      return True if region.top < y < region.bottom else False
+    return False
+
+  def assertDisjoint(self, regions: list[Region]) -> None:
+    """Asserts that no two regions overlap."""
+    for i, region in enumerate(regions):
+      for other in regions[i + 1:]:
+        self.assertFalse(region * other)
+
+  def assertDifference(self, region: Region, occluders: list[Region],
+                       parts: list[Region]) -> None:
+    """Asserts that the parts cover exactly the points of the region not
+    covered by any occluder."""
+    self.assertDisjoint(parts)
+    for _ in range(500):
+      x = region.left + random() * region.width
+      y = region.top + random() * region.height
+      occluded = any([self.inside(o, x, y) for o in occluders])
+      covered = any([self.inside(part, x, y) for part in parts])
+      onEdge = any([x in (o.left, o.right) or y in (o.top, o.bottom)
+                    for o in [*occluders, *parts]])
+      if not onEdge:
+        self.assertNotEqual(occluded, covered)
+
+  def test_subtract(self) -> None:
+    """Tests that subtraction of random regions yields at most four
+    disjoint regions covering the difference."""
+    for _ in range(50):
+      region, other = self.randRegions()
+      parts = region - other
+      self.assertLessEqual(len(parts), 4)
+      self.assertDifference(region, [other], parts)
+      area = sum([part.area for part in parts])
+      self.assertAlmostEqual(area, region.area - (region * other).area)
+
+  def test_subtract_cases(self) -> None:
+    """Tests subtraction of disjoint, covering and inner regions."""
+    region = Region(0, 0, 10, 10)
+    self.assertEqual(len(region - Region(20, 20, 30, 30)), 1)
+    self.assertEqual(region - Region(-1, -1, 11, 11), [])
+    parts = region - Region(4, 4, 6, 6)
+    self.assertEqual(len(parts), 4)
+    self.assertEqual(sum([part.area for part in parts]), 96.)
+    parts = region - Region(5, -5, 15, 15)
+    self.assertEqual(len(parts), 1)
+    self.assertEqual(parts[0].right, 5.)
+
+  def test_subtract_many(self) -> None:
+    """Tests that subtracting many occluders yields disjoint regions
+    covering the difference."""
+    for _ in range(10):
+      region = self.randRegion()
+      occluders = [self.randRegion() for _ in range(20)]
+      parts = region.subtractMany(occluders)
+      self.assertDifference(region, occluders, parts)
+      expected = [region]
+      for occluder in occluders:
+        expected = [p for e in expected for p in e - occluder]
+      area = sum([part.area for part in parts])
+      self.assertAlmostEqual(area, sum([e.area for e in expected]))
+
+  def test_subtract_many_cases(self) -> None:
+    """Tests subtracting many occluders in simple cases."""
+    region = Region(0, 0, 10, 10)
+    self.assertEqual(len(region.subtractMany([])), 1)
+    halves = [Region(0, 0, 5, 10), Region(5, 0, 10, 10)]
+    self.assertEqual(region.subtractMany(halves), [])
+    parts = region.subtractMany([Region(2, 2, 4, 4), Region(6, 2, 8, 4)])
+    self.assertEqual(sum([part.area for part in parts]), 92.)
+    tops = [part.top for part in parts]
+    self.assertEqual(tops, sorted(tops))